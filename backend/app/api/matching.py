@@ -40,11 +40,11 @@ async def run_matching(request: MatchingRequest, background_tasks: BackgroundTas
     
     # Initialize session
     session_id = request.solicitation_id
-    matching_sessions[session_id] = {
+    await matching_sessions.aset(session_id, {
         "status": "pending",
         "progress": 0,
         "message": "Matching request received"
-    }
+    })
     
     # Start background processing
     background_tasks.add_task(
@@ -64,7 +64,7 @@ async def process_matching_background(session_id: str, request: MatchingRequest)
     """Background task to process matching"""
     try:
         # Update status
-        matching_sessions[session_id].update({
+        await matching_sessions.apatch(session_id, {
             "status": "processing",
             "progress": 25,
             "message": "Analyzing solicitation PDF..."
@@ -80,7 +80,7 @@ async def process_matching_background(session_id: str, request: MatchingRequest)
         solicitation_analysis['solicitation_id'] = session_id
         
         # Update status
-        matching_sessions[session_id].update({
+        await matching_sessions.apatch(session_id, {
             "progress": 50,
             "message": "Running matching algorithm..."
         })
@@ -93,7 +93,7 @@ async def process_matching_background(session_id: str, request: MatchingRequest)
         )
         
         # Store results
-        matching_sessions[session_id].update({
+        await matching_sessions.apatch(session_id, {
             "status": "completed",
             "progress": 100,
             "message": f"Matching completed. Found {len(results.top_matches)} matches.",
@@ -101,7 +101,7 @@ async def process_matching_background(session_id: str, request: MatchingRequest)
         })
         
     except Exception as e:
-        matching_sessions[session_id].update({
+        await matching_sessions.apatch(session_id, {
             "status": "failed",
             "progress": 0,
             "message": f"Matching failed: {str(e)}"
@@ -58,26 +58,26 @@ async def generate_comprehensive_report(
     from app.state import team_sessions, matching_sessions
     
     # Validate team exists
-    if team_id not in team_sessions:
+    team_session = await team_sessions.aget(team_id)
+    if team_session is None:
         raise HTTPException(
             status_code=404,
             detail=f"Dream team {team_id} not found. Assemble team first."
         )
     
-    team_session = team_sessions[team_id]
     dream_team_report = team_session["dream_team_report"]
     matching_results = team_session["matching_results"]
     
     # Initialize report session
     report_id = f"report_{team_id}"
-    report_sessions[report_id] = {
+    await report_sessions.aset(report_id, {
         "status": "pending",
         "progress": 0,
         "message": "Report generation started...",
         "team_id": team_id,
         "request": request,
         "started_at": datetime.now()
-    }
+    })
     
     # Start background processing
     background_tasks.add_task(
@@ -106,14 +106,14 @@ async def process_report_generation(
     """Background task to generate comprehensive report"""
     try:
         # Update progress: Data preparation
-        report_sessions[report_id].update({
+        await report_sessions.apatch(report_id, {
             "status": "processing",
             "progress": 20,
             "message": "Preparing data for analysis..."
         })
         
         # Generate gap analysis with AI
-        report_sessions[report_id].update({
+        await report_sessions.apatch(report_id, {
             "progress": 40,
             "message": "Running AI-powered gap analysis..."
         })
@@ -121,10 +121,9 @@ async def process_report_generation(
         gap_analysis = None
         if ai_service and request.include_ai_analysis:
             try:
-                gap_analysis = await ai_service.generate_gap_analysis(
+                gap_analysis = await report_service.generate_gap_analysis_async(
                     dream_team_report, 
-                    matching_results,
-                    request.analysis_depth
+                    matching_results
                 )
             except Exception as e:
                 print(f"⚠️ AI analysis failed: {e}")
@@ -133,7 +132,7 @@ async def process_report_generation(
             gap_analysis = report_service.create_basic_gap_analysis(dream_team_report)
         
         # Generate executive summary
-        report_sessions[report_id].update({
+        await report_sessions.apatch(report_id, {
             "progress": 60,
             "message": "Creating executive summary..."
         })
@@ -143,7 +142,7 @@ async def process_report_generation(
         )
         
         # Generate comprehensive report
-        report_sessions[report_id].update({
+        await report_sessions.apatch(report_id, {
             "progress": 80,
             "message": "Assembling comprehensive report..."
         })
@@ -159,7 +158,7 @@ async def process_report_generation(
         # Generate exports if requested
         exports = {}
         if request.export_formats:
-            report_sessions[report_id].update({
+            await report_sessions.apatch(report_id, {
                 "progress": 90,
                 "message": "Generating export formats..."
             })
@@ -174,7 +173,7 @@ async def process_report_generation(
                     print(f"⚠️ Export format {format_type} failed: {e}")
         
         # Complete
-        report_sessions[report_id].update({
+        await report_sessions.apatch(report_id, {
             "status": "completed",
             "progress": 100,
             "message": f"Report generation completed successfully!",
@@ -186,7 +185,7 @@ async def process_report_generation(
         })
         
     except Exception as e:
-        report_sessions[report_id].update({
+        await report_sessions.apatch(report_id, {
             "status": "failed",
             "progress": 0,
             "message": f"Report generation failed: {str(e)}",
@@ -313,14 +312,13 @@ async def export_report(team_id: str, format: str):
     
     report_id = f"report_{team_id}"
     
-    if report_id not in report_sessions:
+    session = await report_sessions.aget(report_id)
+    if session is None:
         raise HTTPException(
             status_code=404,
             detail=f"No report found for team {team_id}. Generate report first."
         )
     
-    session = report_sessions[report_id]
-    
     if session["status"] != "completed":
         raise HTTPException(
             status_code=400,
@@ -393,14 +391,13 @@ async def regenerate_ai_analysis(
     
     report_id = f"report_{team_id}"
     
-    if report_id not in report_sessions:
+    session = await report_sessions.aget(report_id)
+    if session is None:
         raise HTTPException(
             status_code=404,
             detail=f"No report found for team {team_id}"
         )
     
-    session = report_sessions[report_id]
-    
     if session["status"] != "completed":
         raise HTTPException(
             status_code=400,
@@ -408,7 +405,7 @@ async def regenerate_ai_analysis(
         )
     
     # Start regeneration
-    session.update({
+    await report_sessions.apatch(report_id, {
         "regeneration_status": "processing",
         "regeneration_message": f"Regenerating {analysis_type}..."
     })
@@ -428,26 +425,33 @@ async def regenerate_ai_analysis(
 async def regenerate_analysis_background(report_id: str, analysis_type: str):
     """Background task to regenerate specific analysis"""
     try:
-        session = report_sessions[report_id]
+        session = await report_sessions.aget(report_id)
+        if session is None:
+            raise KeyError(report_id)
         
         if analysis_type == "gap_analysis":
             from app.state import team_sessions
             team_id = session["team_id"]
-            team_session = team_sessions[team_id]
+            team_session = await team_sessions.aget(team_id)
+            if team_session is None:
+                raise KeyError(team_id)
             
-            new_gap_analysis = await ai_service.generate_gap_analysis(
+            new_gap_analysis = await report_service.generate_gap_analysis_async(
                 team_session["dream_team_report"],
-                team_session["matching_results"],
-                "detailed"  # Force detailed analysis
+                team_session["matching_results"]
             )
             
-            session["gap_analysis"] = new_gap_analysis
-            session["regeneration_status"] = "completed"
-            session["regeneration_message"] = "Gap analysis regenerated successfully"
+            await report_sessions.apatch(report_id, {
+                "gap_analysis": new_gap_analysis,
+                "regeneration_status": "completed",
+                "regeneration_message": "Gap analysis regenerated successfully"
+            })
             
     except Exception as e:
-        session["regeneration_status"] = "failed"
-        session["regeneration_message"] = f"Regeneration failed: {str(e)}"
+        await report_sessions.apatch(report_id, {
+            "regeneration_status": "failed",
+            "regeneration_message": f"Regeneration failed: {str(e)}"
+        })
 
 @router.get("/{team_id}/metrics")
 def get_report_metrics(team_id: str):
@@ -496,10 +500,16 @@ def delete_report_session(team_id: str):
 @router.get("/health")
 def reports_health_check():
     """Check health of report services"""
+    # A single PING rather than counting sessions, which would SCAN the whole keyspace
+    try:
+        session_store_status = "available" if report_sessions.client.ping() else "unavailable"
+    except Exception:
+        session_store_status = "unavailable"
+    
     return {
         "reports_service": "healthy",
         "ai_service_status": "available" if ai_service else "unavailable",
         "anthropic_api": "configured" if ai_service else "not_configured",
-        "active_report_sessions": len(report_sessions),
+        "session_store_status": session_store_status,
         "supported_export_formats": ["markdown", "pdf", "json", "csv", "xlsx"]
     }
\ No newline at end of file
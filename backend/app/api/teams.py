@@ -105,10 +105,12 @@ def export_affinity_matrix(team_id: str):
         affinity_df, skills_list = dream_team_service.create_affinity_matrix(
             matching_results, top_n_researchers=20
         )
-        session["affinity_matrix"] = {
-            "df": affinity_df,
-            "skills": skills_list
-        }
+        session = team_sessions.patch(team_id, {
+            "affinity_matrix": {
+                "df": affinity_df,
+                "skills": skills_list
+            }
+        })
     
     affinity_data = session["affinity_matrix"]
     
@@ -145,8 +147,10 @@ def optimize_team(team_id: str, request: DreamTeamRequest):
         )
         
         # Update session
-        session["dream_team_report"] = new_dream_team_report
-        session["affinity_matrix"] = None  # Clear cache
+        team_sessions.patch(team_id, {
+            "dream_team_report": new_dream_team_report,
+            "affinity_matrix": None  # Clear cache
+        })
         
         return new_dream_team_report
         
@@ -40,6 +40,10 @@ class Settings:
         self.RQ_QUEUE_NAME = os.getenv("RQ_QUEUE_NAME", "default")
         self.JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", "300"))  # 5 minutes
         
+        # Deconstruction results cached by PDF content hash
+        self.DECONSTRUCTION_CACHE_TTL = int(os.getenv("DECONSTRUCTION_CACHE_TTL", str(7 * 24 * 3600)))  # 7 days
+        self.SECTION_EXTRACTION_CACHE_TTL = int(os.getenv("SECTION_EXTRACTION_CACHE_TTL", str(7 * 24 * 3600)))  # 7 days
+        
         # Ensure directories exist
         for path in [self.DATA_DIR, self.UPLOADS_DIR, self.OUTPUTS_DIR]:
             Path(path).mkdir(parents=True, exist_ok=True)
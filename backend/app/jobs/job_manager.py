@@ -3,7 +3,7 @@
 import json
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from app.jobs.redis_connection import get_redis
 from app.models.job import JobStatus, JobMetadata, JobStatusResponse, JobError
 import logging
@@ -34,8 +34,14 @@ class JobManager:
     
     def update_job_status(self, job_id: str, status: JobStatus, 
                          progress: Optional[int] = None,
-                         error_message: Optional[str] = None) -> None:
-        """Update job status in Redis."""
+                         error_message: Optional[str] = None,
+                         result: Optional[Union[Dict[str, Any], str]] = None) -> None:
+        """Update job status in Redis.
+        
+        A result, if given, is written together with the metadata in a single
+        MULTI/EXEC round trip. Results already encoded as a JSON string are
+        stored as-is.
+        """
         try:
             metadata = self._get_job_metadata(job_id)
             if not metadata:
@@ -55,7 +61,15 @@ class JobManager:
             elif status in [JobStatus.COMPLETED, JobStatus.FAILED]:
                 metadata.completed_at = now
             
-            self._store_job_metadata(metadata)
+            if result is None:
+                self._store_job_metadata(metadata)
+            else:
+                result_key = f"job:{job_id}:result"
+                metadata.result = {"stored": True, "key": result_key}
+                pipe = self.redis.pipeline()
+                pipe.set(result_key, result if isinstance(result, str) else json.dumps(result, default=str))
+                self._store_job_metadata(metadata, pipe)
+                pipe.execute()
             logger.info(f"Job {job_id} status updated to {status}")
             
         except Exception as e:
@@ -155,10 +169,10 @@ class JobManager:
         except Exception as e:
             logger.error(f"Failed to cleanup job {job_id}: {e}")
     
-    def _store_job_metadata(self, metadata: JobMetadata) -> None:
-        """Store job metadata in Redis."""
+    def _store_job_metadata(self, metadata: JobMetadata, client=None) -> None:
+        """Store job metadata in Redis, or queue it on a pipeline."""
         key = f"job:{metadata.job_id}:metadata"
-        self.redis.set(key, metadata.model_dump_json())
+        (client or self.redis).set(key, metadata.model_dump_json())
     
     def _get_job_metadata(self, job_id: str) -> Optional[JobMetadata]:
         """Get job metadata from Redis."""
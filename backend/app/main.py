@@ -26,6 +26,11 @@ app.include_router(reports.router, prefix="/api")
 app.include_router(jobs.router, prefix="/api")
 app.include_router(deconstruct.router, prefix="/api")
 
+@app.on_event("startup")
+def warm_up_models():
+    """Warm the sentence model once per worker before serving requests"""
+    matching.matching_service.warm_up()
+
 @app.get("/")
 def health_check():
     return {
@@ -40,6 +40,7 @@ class StructuredSolicitation(BaseModel):
     processing_time_seconds: float = Field(..., description="Time taken to process the solicitation")
     extraction_confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score of extraction (0-1)")
     created_at: datetime = Field(..., description="When the structured solicitation was created")
+    source_sha256: Optional[str] = Field(None, description="SHA-256 digest of the source PDF")
     
     @field_validator('solicitation_id', 'award_title', 'full_text')
     @classmethod
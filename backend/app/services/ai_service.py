@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pydantic import BaseModel
@@ -24,6 +25,7 @@ class AIService:
         """Initialize AI service with Groq API key"""
         self.api_key = api_key or os.getenv('GROQ_API_KEY')
         self.client = None
+        self.async_client = None
         
         if not self.api_key:
             logger.warning("⚠️ Groq API key not found. AI features will be disabled.")
@@ -34,6 +36,7 @@ class AIService:
             # Initialize Groq client
             from groq import Groq
             self.client = Groq(api_key=self.api_key)
+            self.async_client = self._create_async_client()
             
             # Test the connection with a minimal request
             # self._test_connection()  # Optional validation
@@ -43,10 +46,12 @@ class AIService:
             logger.error("❌ Groq library not found. Install with: pip install groq")
             logger.info("💡 AI features will be disabled. Install groq library.")
             self.client = None
+            self.async_client = None
         except Exception as e:
             logger.error(f"❌ Failed to initialize Groq client: {e}")
             logger.info("💡 AI features will be disabled. Check your groq library version.")
             self.client = None
+            self.async_client = None
 
     def _test_connection(self) -> bool:
         """Test the Groq connection with a minimal request"""
@@ -65,6 +70,36 @@ class AIService:
     def is_available(self) -> bool:
         """Check if AI service is available"""
         return self.client is not None
+    
+    def _create_async_client(self):
+        """AsyncGroq client over a pooled transport so concurrent analyses reuse connections
+        
+        Pooled connections belong to the event loop that opened them, so a client
+        must not be shared between loops (e.g. across asyncio.run calls).
+        """
+        import httpx
+        from groq import AsyncGroq
+        return AsyncGroq(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+        )
+    
+    @asynccontextmanager
+    async def loop_scoped_client(self):
+        """Yield an AsyncGroq client opened and closed inside the running event loop
+        
+        Yields None when the AI service is not available.
+        """
+        if not self.is_available():
+            yield None
+            return
+        client = self._create_async_client()
+        try:
+            yield client
+        finally:
+            await client.close()
         
     def debug_groq_setup(self) -> Dict[str, Any]:
         """Debug method to check Groq setup"""
@@ -140,6 +175,44 @@ class AIService:
             logger.error(f"❌ Gap analysis generation failed: {e}")
             return self._generate_fallback_analysis(team_report, solicitation_data)
     
+    async def generate_gap_analysis_async(self, team_report: Dict, solicitation_data: Dict,
+                                          matching_results: Dict, client=None) -> GapAnalysisResult:
+        """
+        Async variant of generate_gap_analysis using the AsyncGroq client
+        
+        Lets callers run several gap analyses concurrently (e.g. with asyncio.gather)
+        instead of paying one blocking round trip per report. The response is
+        streamed so the event loop stays free while tokens arrive. Callers running
+        their own event loop pass a ``client`` from loop_scoped_client instead of
+        using the service's shared one.
+        """
+        client = client or self.async_client
+        if not self.is_available() or client is None:
+            return self._generate_fallback_analysis(team_report, solicitation_data)
+        
+        try:
+            prompt = self._create_gap_analysis_prompt(team_report, solicitation_data, matching_results)
+            
+            stream = await client.chat.completions.create(
+                model="llama3-70b-8192",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=4000,
+                temperature=0.3,
+                stream=True
+            )
+            
+            chunks = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+            
+            return self._parse_gap_analysis_response("".join(chunks))
+            
+        except Exception as e:
+            logger.error(f"❌ Async gap analysis generation failed: {e}")
+            return self._generate_fallback_analysis(team_report, solicitation_data)
+    
     def _create_gap_analysis_prompt(self, team_report: Dict, solicitation_data: Dict, 
                                   matching_results: Dict) -> str:
         """Create detailed prompt for gap analysis"""
@@ -108,6 +108,11 @@ class WorkProcessor:
             Processed work data ready for database insertion
         """
         try:
+            # Embeddings arrive as numpy arrays; psycopg2 needs a plain list
+            embedding = text_data.get('embedding')
+            if hasattr(embedding, 'tolist'):
+                embedding = embedding.tolist()
+            
             processed = {
                 'researcher_id': researcher_id,
                 'openalex_id': raw_data.get('id', ''),
@@ -117,7 +122,7 @@ class WorkProcessor:
                 'publication_year': raw_data.get('publication_year'),
                 'doi': raw_data.get('doi'),
                 'citations': raw_data.get('cited_by_count', 0),
-                'embedding': text_data.get('embedding')
+                'embedding': embedding
             }
             
             # Clean DOI (remove URL prefix if present)
@@ -1,12 +1,17 @@
 """LLM-powered metadata extraction service for NSF solicitations."""
 
 import os
+import re
 import json
+import asyncio
+import hashlib
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
-from groq import Groq
+import httpx
+from groq import Groq, AsyncGroq
+from app.config import settings
 
 # Try to load .env file if python-dotenv is available
 try:
@@ -17,6 +22,38 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Map section names to extraction types (unknown sections are mined for skills)
+SECTION_EXTRACTION_TYPES = {
+    "award_information": "metadata",
+    "program_description": "skills",
+    "eligibility_information": "rules",
+    "proposal_preparation_instructions": "skills",
+    "review_information": "skills"
+}
+
+# Per-section text ceiling for batched prompts (~4k tokens)
+MAX_BATCHED_SECTION_CHARS = 16_000
+
+# Output token budget per section in a batched request, and the overall cap
+BATCHED_TOKENS_PER_SECTION = 2000
+MAX_BATCHED_TOKENS = 8000
+
+# Per-section fallback: concurrent requests, per-request timeout and retry schedule
+MAX_CONCURRENT_REQUESTS = 10
+LLM_REQUEST_TIMEOUT_SECONDS = 60
+LLM_MAX_ATTEMPTS = 3
+LLM_RETRY_BACKOFF_SECONDS = 1.0
+
+# Redis key prefix for per-section extraction results keyed by content hash
+SECTION_CACHE_PREFIX = "sec_extract"
+
+# JSON shape expected for each extraction type
+EXTRACTION_SCHEMAS = {
+    "metadata": '{"award_title": string, "funding_ceiling": number, "project_duration_months": number, "submission_deadline": string}',
+    "rules": '{"pi_eligibility_rules": [string], "institutional_limitations": [string], "team_size_constraints": {"min_team_size": number, "max_team_size": number, "max_pi": number}}',
+    "skills": '{"required_scientific_skills": [string], "preferred_skills": [string], "technical_requirements": [string]}'
+}
+
 
 class ExtractedMetadata(BaseModel):
     """Structured metadata extracted from solicitation sections"""
@@ -43,10 +80,16 @@ class ExtractedSkills(BaseModel):
 class LLMMetadataExtractor:
     """Service for extracting structured metadata from solicitation text using LLM"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "meta-llama/llama-4-scout-17b-16e-instruct"):
-        """Initialize LLM metadata extractor with Groq API"""
+    def __init__(self, api_key: Optional[str] = None, model: str = "meta-llama/llama-4-scout-17b-16e-instruct",
+                 cache=None):
+        """Initialize LLM metadata extractor with Groq API
+        
+        cache is an optional Redis client used to reuse batched extraction
+        results for sections whose text was seen before.
+        """
         self.api_key = api_key or os.getenv('GROQ_API_KEY')
         self.model = model
+        self.cache = cache
         self.client = None
         
         if not self.api_key:
@@ -67,6 +110,15 @@ class LLMMetadataExtractor:
         """Check if LLM service is available"""
         return self.client is not None
 
+    def warm_up(self) -> None:
+        """Open a pooled connection to the Groq API ahead of the first extraction request"""
+        if not self.is_available():
+            return
+        try:
+            self.client.models.list()
+        except Exception as e:
+            logger.debug(f"LLM warm-up request failed: {e}")
+
     def _extract_metadata_with_llm(self, section_text: str, section_type: str) -> Dict[str, Any]:
         """
         Extract metadata from a specific section using LLM
@@ -329,17 +381,9 @@ JSON Response:"""
         
         return validated
 
-    def extract_all_metadata(self, sections: Dict[str, str]) -> Dict[str, Any]:
-        """
-        Extract all metadata from multiple sections
-        
-        Args:
-            sections: Dictionary mapping section names to their text content
-            
-        Returns:
-            Dictionary containing all extracted metadata
-        """
-        all_metadata = {
+    def _empty_extraction_result(self) -> Dict[str, Any]:
+        """Create the combined extraction structure returned by extract_all_metadata"""
+        return {
             "metadata": {},
             "rules": {},
             "skills": {},
@@ -350,15 +394,36 @@ JSON Response:"""
                 "timestamp": datetime.now().isoformat()
             }
         }
+
+    def _merge_extracted(self, all_metadata: Dict[str, Any], extraction_type: str,
+                         extracted: Dict[str, Any]) -> None:
+        """Merge one section's extraction into the combined result"""
+        if extraction_type not in all_metadata:
+            all_metadata[extraction_type] = {}
         
-        # Map section names to extraction types
-        section_mapping = {
-            "award_information": "metadata",
-            "program_description": "skills",
-            "eligibility_information": "rules",
-            "proposal_preparation_instructions": "skills",
-            "review_information": "skills"
-        }
+        for key, value in extracted.items():
+            if isinstance(value, list):
+                if key not in all_metadata[extraction_type]:
+                    all_metadata[extraction_type][key] = []
+                all_metadata[extraction_type][key].extend(value)
+            elif isinstance(value, dict):
+                if key not in all_metadata[extraction_type]:
+                    all_metadata[extraction_type][key] = {}
+                all_metadata[extraction_type][key].update(value)
+            else:
+                all_metadata[extraction_type][key] = value
+
+    def extract_all_metadata(self, sections: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Extract all metadata from multiple sections, one LLM request per section
+        
+        Args:
+            sections: Dictionary mapping section names to their text content
+            
+        Returns:
+            Dictionary containing all extracted metadata
+        """
+        all_metadata = self._empty_extraction_result()
         
         for section_name, section_text in sections.items():
             if not section_text or not section_text.strip():
@@ -367,28 +432,13 @@ JSON Response:"""
             all_metadata["extraction_summary"]["sections_processed"] += 1
             
             # Determine extraction type
-            extraction_type = section_mapping.get(section_name, "skills")
+            extraction_type = SECTION_EXTRACTION_TYPES.get(section_name, "skills")
             
             try:
                 extracted = self._extract_metadata_with_llm(section_text, extraction_type)
                 
                 if extracted:
-                    # Merge extracted data
-                    if extraction_type not in all_metadata:
-                        all_metadata[extraction_type] = {}
-                    
-                    for key, value in extracted.items():
-                        if isinstance(value, list):
-                            if key not in all_metadata[extraction_type]:
-                                all_metadata[extraction_type][key] = []
-                            all_metadata[extraction_type][key].extend(value)
-                        elif isinstance(value, dict):
-                            if key not in all_metadata[extraction_type]:
-                                all_metadata[extraction_type][key] = {}
-                            all_metadata[extraction_type][key].update(value)
-                        else:
-                            all_metadata[extraction_type][key] = value
-                    
+                    self._merge_extracted(all_metadata, extraction_type, extracted)
                     all_metadata["extraction_summary"]["successful_extractions"] += 1
                 else:
                     all_metadata["extraction_summary"]["failed_extractions"] += 1
@@ -397,4 +447,260 @@ JSON Response:"""
                 logger.error(f"❌ Failed to extract from section {section_name}: {e}")
                 all_metadata["extraction_summary"]["failed_extractions"] += 1
         
-        return all_metadata
\ No newline at end of file
+        return all_metadata
+
+    async def _extract_metadata_with_llm_async(self, client: AsyncGroq, section_text: str,
+                                               section_type: str) -> Dict[str, Any]:
+        """
+        Async variant of _extract_metadata_with_llm with a timeout and retries
+        
+        Args:
+            client: Async Groq client to send the request with
+            section_text: The text content of the section
+            section_type: Type of section (metadata, rules, skills)
+            
+        Returns:
+            Dictionary containing extracted structured data
+        """
+        prompt = self._create_extraction_prompt(section_text, section_type)
+        
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            try:
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=self.model,
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=2000,
+                        temperature=0.1  # Low temperature for consistent extraction
+                    ),
+                    timeout=LLM_REQUEST_TIMEOUT_SECONDS
+                )
+                response_text = response.choices[0].message.content.strip()
+                return self._parse_llm_response(response_text, section_type)
+                
+            except Exception as e:
+                if attempt == LLM_MAX_ATTEMPTS - 1:
+                    logger.error(f"❌ LLM metadata extraction failed for {section_type}: {e}")
+                    return {}
+                delay = LLM_RETRY_BACKOFF_SECONDS * 2 ** attempt
+                logger.warning(f"⚠️ LLM request for {section_type} failed ({e}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+
+    async def extract_all_metadata_async(self, sections: Dict[str, str],
+                                         max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict[str, Any]:
+        """
+        Extract all metadata with concurrent per-section LLM requests
+        
+        Args:
+            sections: Dictionary mapping section names to their text content
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Dictionary containing all extracted metadata
+        """
+        all_metadata = self._empty_extraction_result()
+        if not self.is_available():
+            logger.warning("LLM service not available, returning empty metadata")
+            return all_metadata
+        
+        pending = [
+            (name, SECTION_EXTRACTION_TYPES.get(name, "skills"), text)
+            for name, text in sections.items()
+            if text and text.strip()
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # A client per call keeps its connection pool on the running event loop
+        async with AsyncGroq(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+            )
+        ) as client:
+            async def extract(section_text: str, extraction_type: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._extract_metadata_with_llm_async(client, section_text, extraction_type)
+            
+            results = await asyncio.gather(
+                *(extract(text, extraction_type) for _, extraction_type, text in pending),
+                return_exceptions=True
+            )
+        
+        summary = all_metadata["extraction_summary"]
+        for (section_name, extraction_type, _), extracted in zip(pending, results):
+            summary["sections_processed"] += 1
+            if isinstance(extracted, Exception):
+                logger.error(f"❌ Failed to extract from section {section_name}: {extracted}")
+                summary["failed_extractions"] += 1
+            elif extracted:
+                self._merge_extracted(all_metadata, extraction_type, extracted)
+                summary["successful_extractions"] += 1
+            else:
+                summary["failed_extractions"] += 1
+        
+        return all_metadata
+
+    def _extract_per_section(self, sections: Dict[str, str]) -> Dict[str, Any]:
+        """Per-section extraction: concurrent async requests unless an event loop is already running"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.extract_all_metadata_async(sections))
+        return self.extract_all_metadata(sections)
+
+    def _truncate_section(self, section_text: str) -> str:
+        """Cap section text for batched prompts, marking any truncation"""
+        section_text = section_text.strip()
+        if len(section_text) <= MAX_BATCHED_SECTION_CHARS:
+            return section_text
+        return section_text[:MAX_BATCHED_SECTION_CHARS] + " [TRUNCATED]"
+
+    def _create_batched_prompt(self, sections: Dict[str, str]) -> str:
+        """Create one prompt that extracts every section at once"""
+        payload = {
+            "sections": {
+                name: {
+                    "extraction_type": SECTION_EXTRACTION_TYPES.get(name, "skills"),
+                    "text": text
+                }
+                for name, text in sections.items()
+            }
+        }
+        schemas = "\n".join(f'- "{name}": {schema}' for name, schema in EXTRACTION_SCHEMAS.items())
+        
+        return f"""Extract structured information from each section of this NSF solicitation.
+
+SECTIONS (JSON):
+{json.dumps(payload, ensure_ascii=False)}
+
+For each section, extract the fields for its extraction_type:
+{schemas}
+
+Return a single JSON object of the form {{"sections": {{"<section name>": {{...fields...}}}}}} with one entry per input section.
+
+Rules:
+- Return ONLY valid JSON, no additional text
+- Use null, empty arrays or empty objects for missing information
+- For funding_ceiling, extract only the numeric value (e.g., 500000 not "$500,000")
+- For project_duration_months, convert years to months if needed (e.g., 3 years = 36 months)
+- Extract specific rules and specific skills (e.g., "machine learning" not "AI")
+- Text ending in [TRUNCATED] was cut short; extract from the part shown
+
+JSON Response:"""
+
+    def _section_cache_key(self, section_text: str, extraction_type: str) -> str:
+        """Redis key for a section's extraction, hashed over model, type and text"""
+        digest = hashlib.blake2b(
+            f"{self.model}\0{extraction_type}\0{section_text}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return f"{SECTION_CACHE_PREFIX}:{digest}"
+
+    def _get_cached_sections(self, cache_keys: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch cached extractions for the given sections in one MGET"""
+        if self.cache is None or not cache_keys:
+            return {}
+        try:
+            values = self.cache.mget(list(cache_keys.values()))
+            cached = {}
+            for section_name, value in zip(cache_keys, values):
+                if value:
+                    extracted = json.loads(value)
+                    if isinstance(extracted, dict) and extracted:
+                        cached[section_name] = extracted
+            return cached
+        except Exception as e:
+            logger.warning(f"⚠️ Section extraction cache lookup failed: {e}")
+            return {}
+
+    def _cache_sections(self, cache_keys: Dict[str, str], extracted: Dict[str, Dict[str, Any]]) -> None:
+        """Store fresh section extractions in one pipelined round trip"""
+        if self.cache is None or not extracted:
+            return
+        try:
+            pipe = self.cache.pipeline(transaction=False)
+            for section_name, data in extracted.items():
+                pipe.setex(cache_keys[section_name], settings.SECTION_EXTRACTION_CACHE_TTL, json.dumps(data))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to cache section extractions: {e}")
+
+    def extract_all_metadata_batched(self, sections: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Extract all metadata from multiple sections with a single LLM request
+        
+        Sections whose extraction is cached are not sent to the model again.
+        Falls back to concurrent per-section requests if the batched request fails
+        or its response cannot be parsed.
+        
+        Args:
+            sections: Dictionary mapping section names to their text content
+            
+        Returns:
+            Dictionary containing all extracted metadata
+        """
+        prompt_sections = {
+            name: self._truncate_section(text)
+            for name, text in sections.items()
+            if text and text.strip()
+        }
+        
+        if not prompt_sections or not self.is_available():
+            return self.extract_all_metadata(sections)
+        
+        cache_keys = {}
+        if self.cache is not None:
+            cache_keys = {
+                name: self._section_cache_key(text, SECTION_EXTRACTION_TYPES.get(name, "skills"))
+                for name, text in prompt_sections.items()
+            }
+        section_results = self._get_cached_sections(cache_keys)
+        missing_sections = {
+            name: text for name, text in prompt_sections.items() if name not in section_results
+        }
+        
+        if missing_sections:
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": self._create_batched_prompt(missing_sections)}],
+                    max_tokens=min(MAX_BATCHED_TOKENS, BATCHED_TOKENS_PER_SECTION * len(missing_sections)),
+                    temperature=0.1  # Low temperature for consistent extraction
+                )
+                
+                response_text = response.choices[0].message.content.strip()
+                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+                parsed = json.loads(json_match.group() if json_match else response_text)
+                batch_results = parsed["sections"]
+                if not isinstance(batch_results, dict):
+                    raise ValueError("'sections' is not an object")
+                
+            except Exception as e:
+                logger.warning(f"⚠️ Batched extraction failed, falling back to per-section requests: {e}")
+                return self._extract_per_section(sections)
+            
+            fresh_results = {}
+            for section_name in missing_sections:
+                data = batch_results.get(section_name)
+                extraction_type = SECTION_EXTRACTION_TYPES.get(section_name, "skills")
+                extracted = self._validate_extracted_data(data, extraction_type) if isinstance(data, dict) else {}
+                if extracted:
+                    fresh_results[section_name] = extracted
+            
+            self._cache_sections(cache_keys, fresh_results)
+            section_results.update(fresh_results)
+        
+        all_metadata = self._empty_extraction_result()
+        summary = all_metadata["extraction_summary"]
+        
+        for section_name in prompt_sections:
+            summary["sections_processed"] += 1
+            extraction_type = SECTION_EXTRACTION_TYPES.get(section_name, "skills")
+            extracted = section_results.get(section_name)
+            
+            if extracted:
+                self._merge_extracted(all_metadata, extraction_type, extracted)
+                summary["successful_extractions"] += 1
+            else:
+                summary["failed_extractions"] += 1
+        
+        return all_metadata
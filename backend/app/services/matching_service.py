@@ -144,6 +144,16 @@ class MatchingService:
             print(f"❌ Critical error in data loading: {e}")
             self.data_loaded = False
 
+    def warm_up(self):
+        """Run one encode so model initialization is not paid by the first matching request"""
+        if self.sentence_model is None:
+            return
+        try:
+            self.sentence_model.encode("warmup")
+            print("✅ Sentence model warmed up")
+        except Exception as e:
+            print(f"⚠️ Could not warm up sentence model: {e}")
+
     def _load_pickle_safely(self, file_path: Path):
         """Safely load pickle files that may have missing class dependencies"""
         import pickle
@@ -9,13 +9,17 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 logger = logging.getLogger(__name__)
 
+# Cached OpenAlex responses are reused for a day
+DEFAULT_CACHE_TTL_SECONDS = 86400
+
 
 class OpenAlexClient:
     """Client for interacting with the OpenAlex API."""
     
     BASE_URL = "https://api.openalex.org"
     
-    def __init__(self, email: str, rate_limit_delay: float = 0.1, max_retries: int = 3):
+    def __init__(self, email: str, rate_limit_delay: float = 0.1, max_retries: int = 3,
+                 cache_path: Optional[str] = None, cache_ttl: int = DEFAULT_CACHE_TTL_SECONDS):
         """
         Initialize the OpenAlex client.
         
@@ -23,16 +27,30 @@ class OpenAlexClient:
             email: Email for polite pool access
             rate_limit_delay: Delay between requests in seconds
             max_retries: Maximum number of retry attempts
+            cache_path: SQLite file for an on-disk HTTP response cache (None disables caching)
+            cache_ttl: Seconds a cached response stays valid
         """
         self.email = email
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.session = self._create_session(cache_path, cache_ttl)
         self.session.headers.update({
             'User-Agent': f'TexasStateResearchPipeline (mailto:{email})',
             'Accept': 'application/json'
         })
         
+    @staticmethod
+    def _create_session(cache_path: Optional[str], cache_ttl: int) -> requests.Session:
+        """Create a plain session, or a cached one when a cache path is given."""
+        if cache_path:
+            try:
+                import requests_cache
+                return requests_cache.CachedSession(cache_path, backend='sqlite', expire_after=cache_ttl)
+            except ImportError:
+                logger.warning("requests-cache not installed; OpenAlex responses will not be cached. "
+                               "Install with: pip install requests-cache")
+        return requests.Session()
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -63,8 +81,9 @@ class OpenAlexClient:
         response = self.session.get(url, params=params)
         response.raise_for_status()
         
-        # Rate limiting
-        time.sleep(self.rate_limit_delay)
+        # Rate limiting; requests-cache marks responses it served with from_cache=True
+        if getattr(response, 'from_cache', False) is not True:
+            time.sleep(self.rate_limit_delay)
         
         return response.json()
     
@@ -266,19 +285,16 @@ class OpenAlexClient:
             return ""
         
         try:
-            # Create a list to hold words at their positions
-            word_positions = []
-            
+            # Positions are dense 0..N-1, so scatter words straight into place
+            # instead of sorting (position, word) pairs
+            size = max((pos for positions in abstract_inverted_index.values() for pos in positions), default=-1) + 1
+            words = [None] * size
             for word, positions in abstract_inverted_index.items():
                 for pos in positions:
-                    word_positions.append((pos, word))
-            
-            # Sort by position and extract words
-            word_positions.sort(key=lambda x: x[0])
-            words = [word for _, word in word_positions]
+                    words[pos] = word
             
-            # Join words with spaces
-            abstract = " ".join(words)
+            # Join words with spaces, skipping any gaps in the index
+            abstract = " ".join(word for word in words if word is not None)
             
             logger.debug(f"Reconstructed abstract: {abstract[:100]}...")
             return abstract
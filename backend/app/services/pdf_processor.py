@@ -3,12 +3,51 @@
 import time
 import os
 import re
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import fitz  # PyMuPDF
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Minimum pages per worker before extraction is split across processes
+PAGES_PER_EXTRACTION_WORKER = 25
+
+def _extract_page_range(page_range: Tuple[str, int, int]) -> List[str]:
+    """Extract the text of pages [start, stop) from its own copy of the document"""
+    file_path, start, stop = page_range
+    with fitz.open(file_path) as doc:
+        return [doc[page_num].get_text() for page_num in range(start, stop)]
+
+def extract_page_texts(doc: fitz.Document, file_path: str, max_workers: Optional[int] = None) -> List[str]:
+    """
+    Extract the text of every page of an open PDF, in page order.
+    
+    PyMuPDF documents cannot be shared between threads, so large documents are
+    split into contiguous page ranges that worker processes extract from their
+    own copy of the file. Small documents are extracted in-process.
+    
+    Args:
+        doc: Open document for file_path
+        file_path: Path the document was opened from
+        max_workers: Maximum worker processes (defaults to the CPU count)
+        
+    Returns:
+        List of page texts
+    """
+    page_count = len(doc)
+    workers = min(max_workers or os.cpu_count() or 1, page_count // PAGES_PER_EXTRACTION_WORKER)
+    if workers < 2:
+        return [page.get_text() for page in doc]
+    
+    chunk_size = -(-page_count // workers)
+    page_ranges = [
+        (file_path, start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [text for texts in executor.map(_extract_page_range, page_ranges) for text in texts]
+
 def extract_pdf_text(file_path: str) -> Dict[str, Any]:
     """
     Extract text from a PDF file using PyMuPDF.
@@ -43,14 +82,9 @@ def extract_pdf_text(file_path: str) -> Dict[str, Any]:
         # Open the PDF document
         doc = fitz.open(file_path)
         
-        # Extract text from all pages
-        text_content = ""
+        # Extract text from all pages, joining once at the end
         page_count = len(doc)
-        
-        for page_num in range(page_count):
-            page = doc[page_num]
-            page_text = page.get_text()
-            text_content += page_text + "\n"
+        text_content = "".join(text + "\n" for text in extract_page_texts(doc, file_path))
         
         # Close the document
         doc.close()
@@ -1,27 +1,45 @@
+import asyncio
+import hashlib
 import json
-import markdown
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from jinja2 import Template, Environment, DictLoader
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
+from jinja2 import Environment, DictLoader
 import pandas as pd
 from app.models.team import DreamTeamReport
 from app.models.matching import MatchingResults
-from app.models.reports import (
-    ComprehensiveReport, GapAnalysisReport, ReportExport,
-    ExecutiveSummary, SupportingEvidence
-)
-from app.services.ai_service import AIService
+from app.models.reports import ComprehensiveReport, ReportExport
+from app.services.ai_service import AIService, GapAnalysisResult
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Static lookup tables shared by every report
+LEVEL_EMOJI = MappingProxyType({'High': '🟢', 'Medium': '🟡', 'Low': '🔴'})
+STRATEGY_DESCRIPTIONS = MappingProxyType({
+    "hybrid": "Hybrid approach combining top performers with coverage optimization",
+    "greedy": "Pure optimization strategy maximizing overall team coverage",
+    "rankings": "Top-ranked researchers by overall performance"
+})
+SKILL_LEVELS = ('Low', 'Medium', 'High')
+
+# Row type for the skills coverage table in the markdown template
+SkillRow = namedtuple('SkillRow', 'skill coverage_score level level_emoji expert')
+
+# Maximum number of rendered exports kept per ReportService instance
+RENDER_CACHE_SIZE = 64
+
 class ReportService:
     """Service for generating comprehensive reports with AI-powered analysis"""
     
     def __init__(self, ai_service: Optional[AIService] = None):
         self.ai_service = ai_service
         self.template_env = self._setup_templates()
+        self._render_cache: Dict[Tuple[str, str], str] = {}
+        self._skill_cache: Dict[int, Tuple[pd.DataFrame, Dict[str, List[str]]]] = {}
         
         # Log AI service availability
         if self.ai_service:
@@ -179,18 +197,100 @@ class ReportService:
         
         logger.info(f"🚀 Generating comprehensive report for solicitation {solicitation_id}")
         
-        try:
-            # Generate AI-powered gap analysis if available
-            gap_analysis = None
+        # Generate AI-powered gap analysis if available
+        gap_analysis = None
+        if include_ai_analysis and self.ai_service:
+            gap_analysis = self._generate_ai_gap_analysis(team_report, matching_results)
+        
+        return self._assemble_comprehensive_report(
+            solicitation_id, team_report, matching_results, gap_analysis
+        )
+    
+    async def generate_comprehensive_report_async(
+        self, 
+        solicitation_id: str,
+        team_report: DreamTeamReport,
+        matching_results: MatchingResults,
+        include_ai_analysis: bool = True
+    ) -> ComprehensiveReport:
+        """Async variant of generate_comprehensive_report that awaits the AI gap analysis"""
+        
+        logger.info(f"🚀 Generating comprehensive report for solicitation {solicitation_id}")
+        
+        gap_analysis = None
+        if include_ai_analysis and self.ai_service:
+            gap_analysis = await self.generate_gap_analysis_async(team_report, matching_results)
+        
+        return self._assemble_comprehensive_report(
+            solicitation_id, team_report, matching_results, gap_analysis
+        )
+    
+    async def generate_comprehensive_reports_async(
+        self,
+        items: List[Tuple[str, DreamTeamReport, MatchingResults]],
+        include_ai_analysis: bool = True,
+        client=None
+    ) -> List[ComprehensiveReport]:
+        """Generate reports for several solicitations, running their AI gap analyses concurrently"""
+        
+        logger.info(f"🚀 Generating {len(items)} comprehensive reports")
+        
+        gap_analyses: List[Optional[GapAnalysisResult]] = [None] * len(items)
+        if include_ai_analysis and self.ai_service:
+            gap_analyses = await asyncio.gather(*(
+                self.generate_gap_analysis_async(team_report, matching_results, client=client)
+                for _, team_report, matching_results in items
+            ))
+        
+        return [
+            self._assemble_comprehensive_report(
+                solicitation_id, team_report, matching_results, gap_analysis
+            )
+            for (solicitation_id, team_report, matching_results), gap_analysis
+            in zip(items, gap_analyses)
+        ]
+    
+    def generate_comprehensive_reports(
+        self,
+        items: List[Tuple[str, DreamTeamReport, MatchingResults]],
+        include_ai_analysis: bool = True
+    ) -> List[ComprehensiveReport]:
+        """Synchronous wrapper around generate_comprehensive_reports_async
+        
+        Each call runs its own event loop, so the AI requests go through a client
+        opened inside that loop rather than the service's shared async client.
+        Async callers should await generate_comprehensive_reports_async instead.
+        """
+        async def generate() -> List[ComprehensiveReport]:
             if include_ai_analysis and self.ai_service:
-                gap_analysis = self._generate_ai_gap_analysis(team_report, matching_results)
+                async with self.ai_service.loop_scoped_client() as client:
+                    return await self.generate_comprehensive_reports_async(items, include_ai_analysis, client)
+            return await self.generate_comprehensive_reports_async(items, include_ai_analysis)
+        
+        return asyncio.run(generate())
+    
+    def _assemble_comprehensive_report(
+        self,
+        solicitation_id: str,
+        team_report: DreamTeamReport,
+        matching_results: MatchingResults,
+        gap_analysis: Optional[GapAnalysisResult]
+    ) -> ComprehensiveReport:
+        """Build the report sections around an already computed gap analysis"""
+        
+        try:
+            # Skill names grouped by level, shared by every section
+            _, skill_levels = self._skill_data(team_report)
+            now = datetime.now()
             
             # Create executive summary
-            executive_summary = self._create_executive_summary(team_report, gap_analysis)
+            executive_summary = self._create_executive_summary(
+                team_report, gap_analysis, skill_levels, now=now
+            )
             
             # Generate strategic recommendations
             strategic_recommendations = self._generate_strategic_recommendations(
-                team_report, gap_analysis
+                team_report, gap_analysis, skill_levels
             )
             
             # Collect supporting evidence
@@ -199,7 +299,7 @@ class ReportService:
             )
             
             # Generate next steps
-            next_steps = self._generate_next_steps(team_report, gap_analysis)
+            next_steps = self._generate_next_steps(team_report, gap_analysis, skill_levels)
             
             # Create comprehensive report
             report = ComprehensiveReport(
@@ -212,7 +312,7 @@ class ReportService:
                 strategic_recommendations=strategic_recommendations,
                 supporting_evidence=supporting_evidence,
                 next_steps=next_steps,
-                generated_at=datetime.now(),
+                generated_at=now,
                 report_version="1.0"
             )
             
@@ -223,33 +323,24 @@ class ReportService:
             logger.error(f"❌ Error generating comprehensive report: {e}")
             raise
     
-    def _generate_ai_gap_analysis(
+    def _build_gap_analysis_payload(
         self, 
         team_report: DreamTeamReport, 
         matching_results: MatchingResults
-    ) -> Optional[GapAnalysisReport]:
-        """Generate AI-powered gap analysis using Anthropic"""
-        
-        if not self.ai_service:
-            logger.warning("⚠️ AI service not available for gap analysis")
-            return None
-        
-        try:
-            logger.info("🤖 Generating AI-powered gap analysis...")
-            
-            # Prepare data for AI analysis
-            analysis_data = {
-                'solicitation_title': team_report.solicitation_title,
-                'team_coverage_score': team_report.overall_coverage_score,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Prepare keyword arguments for AIService.generate_gap_analysis"""
+        return {
+            'team_report': {
                 'team_members': [
                     {
                         'name': member.name,
                         'role': member.role,
                         'avg_affinity': member.avg_affinity,
-                        'top_skills': [skill['skill'] for skill in member.top_skills[:3]]
+                        'top_skills': member.top_skills[:3]
                     }
                     for member in team_report.team_members
                 ],
+                'overall_coverage_score': team_report.overall_coverage_score,
                 'skill_analysis': [
                     {
                         'skill': skill.skill,
@@ -259,12 +350,28 @@ class ReportService:
                     }
                     for skill in team_report.skill_analysis
                 ],
-                'skills_analyzed': matching_results.skills_analyzed,
                 'strategy_used': team_report.strategy_used
-            }
+            },
+            'solicitation_data': {'title': team_report.solicitation_title},
+            'matching_results': {'skills_analyzed': matching_results.skills_analyzed}
+        }
+    
+    def _generate_ai_gap_analysis(
+        self, 
+        team_report: DreamTeamReport, 
+        matching_results: MatchingResults
+    ) -> Optional[GapAnalysisResult]:
+        """Generate AI-powered gap analysis"""
+        
+        if not self.ai_service:
+            logger.warning("⚠️ AI service not available for gap analysis")
+            return None
+        
+        try:
+            logger.info("🤖 Generating AI-powered gap analysis...")
             
-            # Generate gap analysis using AI
-            gap_analysis = self.ai_service.generate_gap_analysis(analysis_data)
+            payload = self._build_gap_analysis_payload(team_report, matching_results)
+            gap_analysis = self.ai_service.generate_gap_analysis(**payload)
             
             logger.info("✅ AI gap analysis generated")
             return gap_analysis
@@ -273,17 +380,75 @@ class ReportService:
             logger.error(f"❌ Error generating AI gap analysis: {e}")
             return None
     
+    async def generate_gap_analysis_async(
+        self, 
+        team_report: DreamTeamReport, 
+        matching_results: MatchingResults,
+        client=None
+    ) -> Optional[GapAnalysisResult]:
+        """Generate AI-powered gap analysis without blocking the event loop"""
+        
+        if not self.ai_service:
+            logger.warning("⚠️ AI service not available for gap analysis")
+            return None
+        
+        try:
+            payload = self._build_gap_analysis_payload(team_report, matching_results)
+            return await self.ai_service.generate_gap_analysis_async(**payload, client=client)
+        except Exception as e:
+            logger.error(f"❌ Error generating AI gap analysis: {e}")
+            return None
+    
+    def _skill_data(self, team_report: DreamTeamReport) -> Tuple[pd.DataFrame, Dict[str, List[str]]]:
+        """
+        Skill frame and per-level skill names for a team report
+        
+        Built once per report object and reused by every section and export;
+        the entry is dropped when the team report is garbage collected.
+        """
+        key = id(team_report)
+        cached = self._skill_cache.get(key)
+        if cached is None:
+            skills = self._skill_frame(team_report.skill_analysis)
+            cached = (skills, self._group_skills_by_level(skills))
+            self._skill_cache[key] = cached
+            weakref.finalize(team_report, self._skill_cache.pop, key, None)
+        return cached
+    
+    def _skill_frame(self, skill_analysis) -> pd.DataFrame:
+        """Build a column store of the skill analysis with a categorical level column"""
+        return pd.DataFrame({
+            'skill': [s.skill for s in skill_analysis],
+            'coverage_score': [s.coverage_score for s in skill_analysis],
+            'level': pd.Categorical([s.level for s in skill_analysis], categories=SKILL_LEVELS, ordered=True),
+            'expert': [s.expert for s in skill_analysis],
+            'expert_score': [s.expert_score for s in skill_analysis]
+        })
+    
+    @staticmethod
+    def _group_skills_by_level(skills: pd.DataFrame) -> Dict[str, List[str]]:
+        """Skill names for every coverage level in one groupby pass, in report order"""
+        grouped = skills.groupby('level', observed=False, sort=False)['skill'].agg(list)
+        return {level: grouped.get(level, []) for level in SKILL_LEVELS}
+    
     def _create_executive_summary(
         self, 
         team_report: DreamTeamReport, 
-        gap_analysis: Optional[GapAnalysisReport]
+        gap_analysis: Optional[GapAnalysisResult],
+        skill_levels: Optional[Dict[str, List[str]]] = None,
+        now: Optional[datetime] = None
     ) -> str:
         """Create executive summary"""
         
+        if skill_levels is None:
+            _, skill_levels = self._skill_data(team_report)
+        if now is None:
+            now = datetime.now()
+        
         # Analyze skill coverage
-        high_coverage = [s for s in team_report.skill_analysis if s.level == 'High']
-        medium_coverage = [s for s in team_report.skill_analysis if s.level == 'Medium']
-        low_coverage = [s for s in team_report.skill_analysis if s.level == 'Low']
+        high_coverage = skill_levels['High']
+        medium_coverage = skill_levels['Medium']
+        low_coverage = skill_levels['Low']
         
         # Determine competitiveness level
         coverage_score = team_report.overall_coverage_score
@@ -302,11 +467,11 @@ class ReportService:
         
         # Create strengths and gaps summary
         strengths_summary = f"{len(high_coverage)} high-coverage areas including " + \
-                          ", ".join([s.skill for s in high_coverage[:3]])
+                          ", ".join(high_coverage[:3])
         
         if low_coverage:
             gaps_summary = f"{len(low_coverage)} critical gaps requiring attention: " + \
-                          ", ".join([s.skill for s in low_coverage[:3]])
+                          ", ".join(low_coverage[:3])
         else:
             gaps_summary = "No critical gaps identified"
         
@@ -330,7 +495,7 @@ class ReportService:
             solicitation_title=team_report.solicitation_title,
             coverage_score=coverage_score,
             strategy_used=team_report.strategy_used,
-            generated_at=datetime.now().strftime("%B %d, %Y"),
+            generated_at=now.strftime("%B %d, %Y"),
             team_size=len(team_report.team_members),
             pi_name=team_report.team_members[0].name if team_report.team_members else "N/A",
             pi_score=f"{team_report.team_members[0].avg_affinity:.1f}" if team_report.team_members else "N/A",
@@ -345,83 +510,82 @@ class ReportService:
     
     def _get_strategy_description(self, strategy: str) -> str:
         """Get human-readable strategy description"""
-        descriptions = {
-            "hybrid": "Hybrid approach combining top performers with coverage optimization",
-            "greedy": "Pure optimization strategy maximizing overall team coverage",
-            "rankings": "Top-ranked researchers by overall performance"
-        }
-        return descriptions.get(strategy, strategy)
+        return STRATEGY_DESCRIPTIONS.get(strategy, strategy)
     
     def _generate_strategic_recommendations(
         self, 
         team_report: DreamTeamReport, 
-        gap_analysis: Optional[GapAnalysisReport]
+        gap_analysis: Optional[GapAnalysisResult],
+        skill_levels: Optional[Dict[str, List[str]]] = None
     ) -> str:
         """Generate strategic recommendations"""
-        
-        recommendations = []
+        if skill_levels is None:
+            _, skill_levels = self._skill_data(team_report)
+        return "\n\n".join(self._iter_strategic_recommendations(team_report, gap_analysis, skill_levels))
+    
+    def _iter_strategic_recommendations(
+        self, 
+        team_report: DreamTeamReport, 
+        gap_analysis: Optional[GapAnalysisResult],
+        skill_levels: Dict[str, List[str]]
+    ) -> Iterator[str]:
+        """Yield strategic recommendation paragraphs in report order"""
         
         # Coverage-based recommendations
-        low_coverage = [s for s in team_report.skill_analysis if s.level == 'Low']
-        medium_coverage = [s for s in team_report.skill_analysis if s.level == 'Medium']
-        high_coverage = [s for s in team_report.skill_analysis if s.level == 'High']
+        low_coverage = skill_levels['Low']
+        medium_coverage = skill_levels['Medium']
+        high_coverage = skill_levels['High']
         
         # Proposal strategy recommendations
         if len(high_coverage) >= 3:
-            recommendations.append(
-                "**Proposal Strategy:** Lead with team strengths in " + 
-                ", ".join([s.skill for s in high_coverage[:3]]) + 
-                ". Position these as core competitive advantages."
+            yield (
+                "**Proposal Strategy:** Lead with team strengths in "
+                f"{', '.join(high_coverage[:3])}. "
+                "Position these as core competitive advantages."
             )
         
         # Gap mitigation strategies
         if low_coverage:
-            recommendations.append("**Gap Mitigation:**")
+            yield "**Gap Mitigation:**"
             for skill in low_coverage[:3]:
-                recommendations.append(
-                    f"  - {skill.skill}: Consider external collaboration or consultant expertise"
-                )
+                yield f"  - {skill}: Consider external collaboration or consultant expertise"
         
         # Team development recommendations
         if medium_coverage:
-            recommendations.append(
-                "**Team Development:** Invest in strengthening medium-coverage areas through " +
+            yield (
+                "**Team Development:** Invest in strengthening medium-coverage areas through "
                 "targeted training or strategic partnerships."
             )
         
         # Budget allocation guidance
         coverage_score = team_report.overall_coverage_score
         if coverage_score >= 70:
-            recommendations.append(
-                "**Budget Allocation:** Leverage existing team strengths. " +
+            yield (
+                "**Budget Allocation:** Leverage existing team strengths. "
                 "Minimal external expertise required."
             )
         elif coverage_score >= 50:
-            recommendations.append(
-                "**Budget Allocation:** Reserve 15-25% of budget for external expertise " +
+            yield (
+                "**Budget Allocation:** Reserve 15-25% of budget for external expertise "
                 "to address identified gaps."
             )
         else:
-            recommendations.append(
-                "**Budget Allocation:** Significant investment required in external partnerships " +
+            yield (
+                "**Budget Allocation:** Significant investment required in external partnerships "
                 "or consultant expertise (25-40% of budget)."
             )
         
         # Timeline recommendations
         if coverage_score >= 70:
-            recommendations.append("**Timeline:** Proceed with standard proposal timeline.")
+            yield "**Timeline:** Proceed with standard proposal timeline."
         else:
-            recommendations.append(
-                "**Timeline:** Allow additional 2-4 weeks for team strengthening activities."
-            )
+            yield "**Timeline:** Allow additional 2-4 weeks for team strengthening activities."
         
         # AI-generated recommendations
         if gap_analysis and hasattr(gap_analysis, 'strategic_recommendations'):
-            recommendations.append("**AI-Generated Insights:**")
+            yield "**AI-Generated Insights:**"
             for rec in gap_analysis.strategic_recommendations[:3]:
-                recommendations.append(f"  - {rec}")
-        
-        return "\n\n".join(recommendations)
+                yield f"  - {rec}"
     
     def _collect_supporting_evidence(
         self, 
@@ -460,20 +624,24 @@ class ReportService:
     def _generate_next_steps(
         self, 
         team_report: DreamTeamReport, 
-        gap_analysis: Optional[GapAnalysisReport]
+        gap_analysis: Optional[GapAnalysisResult],
+        skill_levels: Optional[Dict[str, List[str]]] = None
     ) -> str:
         """Generate actionable next steps"""
         
+        if skill_levels is None:
+            _, skill_levels = self._skill_data(team_report)
+        
         next_steps = []
         
         # Immediate actions
         next_steps.append("## Immediate Actions (Next 1-2 weeks)")
         
-        low_coverage = [s for s in team_report.skill_analysis if s.level == 'Low']
+        low_coverage = skill_levels['Low']
         if low_coverage:
             next_steps.append("1. **Address Critical Gaps:**")
             for skill in low_coverage[:3]:
-                next_steps.append(f"   - Identify collaborators for: {skill.skill}")
+                next_steps.append(f"   - Identify collaborators for: {skill}")
         else:
             next_steps.append("1. **Leverage Team Strengths:** Develop proposal outline emphasizing high-coverage areas")
         
@@ -503,6 +671,8 @@ class ReportService:
         """Create formatted markdown report"""
         
         try:
+            _, skill_levels = self._skill_data(report.team_report)
+            
             # Prepare template data
             template_data = {
                 'title': f"Strategic Analysis: {report.solicitation_title}",
@@ -514,9 +684,9 @@ class ReportService:
                 'strategy_used': report.team_report.strategy_used,
                 'selection_history': report.team_report.selection_history,
                 'skill_analysis': self._prepare_skill_analysis_for_template(report.team_report.skill_analysis),
-                'high_coverage_count': len([s for s in report.team_report.skill_analysis if s.level == 'High']),
-                'medium_coverage_count': len([s for s in report.team_report.skill_analysis if s.level == 'Medium']),
-                'low_coverage_count': len([s for s in report.team_report.skill_analysis if s.level == 'Low']),
+                'high_coverage_count': len(skill_levels['High']),
+                'medium_coverage_count': len(skill_levels['Medium']),
+                'low_coverage_count': len(skill_levels['Low']),
                 'gap_analysis': report.gap_analysis.analysis_text if report.gap_analysis else "AI analysis not available",
                 'strategic_recommendations': report.strategic_recommendations,
                 'next_steps': report.next_steps,
@@ -533,19 +703,18 @@ class ReportService:
             logger.error(f"❌ Error creating markdown report: {e}")
             raise
     
-    def _prepare_skill_analysis_for_template(self, skill_analysis) -> List[Dict]:
+    def _prepare_skill_analysis_for_template(self, skill_analysis) -> List[SkillRow]:
         """Prepare skill analysis data for template rendering"""
-        result = []
-        for skill in skill_analysis:
-            emoji_map = {'High': '🟢', 'Medium': '🟡', 'Low': '🔴'}
-            result.append({
-                'skill': skill.skill,
-                'coverage_score': skill.coverage_score,
-                'level': skill.level,
-                'level_emoji': emoji_map.get(skill.level, '⚪'),
-                'expert': skill.expert
-            })
-        return result
+        return [
+            SkillRow(
+                skill.skill,
+                skill.coverage_score,
+                skill.level,
+                LEVEL_EMOJI.get(skill.level, '⚪'),
+                skill.expert
+            )
+            for skill in skill_analysis
+        ]
     
     def export_report(
         self, 
@@ -556,17 +725,19 @@ class ReportService:
         
         try:
             if format_type.lower() == "markdown":
-                content = self.create_markdown_report(report)
+                render = self.create_markdown_report
                 
             elif format_type.lower() == "json":
-                content = json.dumps(report.dict(), indent=2, default=str)
+                render = self._create_json_export
                 
             elif format_type.lower() == "csv":
-                content = self._create_csv_export(report)
+                render = self._create_csv_export
                 
             else:
                 raise ValueError(f"Unsupported export format: {format_type}")
             
+            content = self._render_cached(report, format_type.lower(), render)
+            
             return ReportExport(
                 solicitation_id=report.solicitation_id,
                 format_type=format_type,
@@ -583,6 +754,46 @@ class ReportService:
             logger.error(f"❌ Error exporting report: {e}")
             raise
     
+    def export_reports(
+        self, 
+        report: ComprehensiveReport, 
+        format_types: List[str]
+    ) -> List[ReportExport]:
+        """Export a report in several formats concurrently, preserving the requested order"""
+        
+        if not format_types:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=len(format_types)) as executor:
+            return list(executor.map(lambda fmt: self.export_report(report, fmt), format_types))
+    
+    def _render_cached(
+        self, 
+        report: ComprehensiveReport, 
+        format_type: str, 
+        render: Callable[[ComprehensiveReport], str]
+    ) -> str:
+        """Render an export, reusing the result for reports with identical content"""
+        
+        key = (self._report_digest(report), format_type)
+        content = self._render_cache.get(key)
+        if content is None:
+            content = render(report)
+            if len(self._render_cache) >= RENDER_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._render_cache.pop(next(iter(self._render_cache)), None)
+            self._render_cache[key] = content
+        return content
+    
+    @staticmethod
+    def _report_digest(report: ComprehensiveReport) -> str:
+        """Stable hash of the report content used as render cache key"""
+        return hashlib.blake2b(report.model_dump_json().encode(), digest_size=16).hexdigest()
+    
+    def _create_json_export(self, report: ComprehensiveReport) -> str:
+        """Create JSON export of the full report"""
+        return json.dumps(report.model_dump(), indent=2, default=str)
+    
     def _create_csv_export(self, report: ComprehensiveReport) -> str:
         """Create CSV export of key data"""
         
@@ -597,20 +808,16 @@ class ReportService:
                 'Selection_Reason': member.selection_reason
             })
         
-        # Skills coverage data
-        skills_data = []
-        for skill in report.team_report.skill_analysis:
-            skills_data.append({
-                'Skill': skill.skill,
-                'Coverage_Score': skill.coverage_score,
-                'Level': skill.level,
-                'Expert': skill.expert,
-                'Expert_Score': skill.expert_score
-            })
-        
         # Convert to CSV strings
         team_df = pd.DataFrame(team_data)
-        skills_df = pd.DataFrame(skills_data)
+        skills, _ = self._skill_data(report.team_report)
+        skills_df = skills.rename(columns={
+            'skill': 'Skill',
+            'coverage_score': 'Coverage_Score',
+            'level': 'Level',
+            'expert': 'Expert',
+            'expert_score': 'Expert_Score'
+        })
         
         csv_content = "# Team Members\n"
         csv_content += team_df.to_csv(index=False)
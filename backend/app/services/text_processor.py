@@ -1,66 +1,159 @@
 """
 Text Processing Engine for abstract reconstruction, keyword extraction, and embedding generation.
 """
+import os
 import re
+import heapq
+import hashlib
 import logging
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 from sentence_transformers import SentenceTransformer
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from collections import Counter
+from collections import Counter, OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Default number of embeddings kept in the in-memory LRU cache
+EMBEDDING_CACHE_SIZE = 10_000
+
+# Whole alphabetic words of at least three letters (digits and underscores excluded).
+# findall scans in C in a single pass, so no separate word segmenter is needed.
+KEYWORD_TOKEN_PATTERN = re.compile(r"\b[^\W\d_]{3,}\b")
+
+# process_works encodes prepared works in chunks of this many batches while
+# the pool keeps preparing later works
+PIPELINE_CHUNK_BATCHES = 8
+
+# Per-process TextProcessor used by process_works workers (never loads the model)
+_worker_processor: Optional["TextProcessor"] = None
+
+
+def _init_text_worker(model_name: str):
+    """Create the worker-local text processor once per pool process."""
+    global _worker_processor
+    _worker_processor = TextProcessor(model_name)
+
+
+def _prepare_work_text_in_worker(work_data: Dict) -> Tuple[Dict, str]:
+    """Run the CPU-only text preparation for one work inside a pool process."""
+    return _worker_processor._prepare_work_text_safe(work_data)
+
 
 class TextProcessor:
     """Handles text processing tasks for the research pipeline."""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: int = 64,
+                 cache_size: int = EMBEDDING_CACHE_SIZE):
         """
         Initialize the text processor.
         
         Args:
             model_name: Name of the sentence transformer model to use
+            batch_size: Number of texts per forward pass when encoding in batches
+            cache_size: Maximum number of embeddings kept in the LRU cache
         """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._emb_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
         self.model = None
+        self._model_lock = threading.Lock()
         self._initialize_nltk()
         
+    @staticmethod
+    def _ensure_nltk(package: str, path: str):
+        """Download an NLTK package only if it is not already installed."""
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(package, quiet=True)
+    
     def _initialize_nltk(self):
         """Initialize NLTK resources."""
         try:
-            # Download required NLTK data
-            nltk.download('punkt', quiet=True)
-            nltk.download('punkt_tab', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
+            # Only the stop word list is needed; tokenization is regex based
+            self._ensure_nltk('stopwords', 'corpora/stopwords')
             
-            self.stop_words = set(stopwords.words('english'))
+            self.stop_words = frozenset(stopwords.words('english'))
             logger.info("NLTK resources initialized successfully")
             
         except Exception as e:
             logger.error(f"Error initializing NLTK: {e}")
             # Fallback to basic stop words and simple tokenization
-            self.stop_words = {
+            self.stop_words = frozenset({
                 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
                 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
                 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
                 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
-            }
+            })
+        
+        # Keep only stop words the keyword tokenizer can actually produce
+        self.stop_words = frozenset(
+            word for word in self.stop_words if KEYWORD_TOKEN_PATTERN.fullmatch(word)
+        )
     
     def _load_model(self):
         """Lazy load the sentence transformer model."""
-        if self.model is None:
+        if self.model is not None:
+            return
+        
+        with self._model_lock:
+            if self.model is not None:
+                return
+            
             try:
-                logger.info(f"Loading sentence transformer model: {self.model_name}")
-                self.model = SentenceTransformer(self.model_name)
+                import torch
+                
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                logger.info(f"Loading sentence transformer model: {self.model_name} on {device}")
+                model = SentenceTransformer(self.model_name, device=device)
+                if device == "cuda":
+                    # Half precision halves weight bandwidth and uses tensor cores
+                    model.half()
+                # Abstracts are short; cap padding explicitly
+                model.max_seq_length = 256
+                # MiniLM ships a Rust-backed fast tokenizer; a slow one dominates encode time
+                if not getattr(model.tokenizer, 'is_fast', True):
+                    logger.warning(f"Model {self.model_name} loaded a slow Python tokenizer")
+                # Publish only the fully configured model to other threads
+                self.model = model
                 logger.info("Model loaded successfully")
             except Exception as e:
                 logger.error(f"Error loading model: {e}")
                 raise
     
+    def warm_up(self):
+        """Load the model and run one encode so the first real request is not slowed down."""
+        self._load_model()
+        self._encode_batch(["warmup"])
+        logger.info("Sentence transformer model warmed up")
+    
+    @staticmethod
+    def _scatter_inverted_index(inverted_index: Dict) -> List[Optional[str]]:
+        """Place each word of an inverted index at its positions (None marks gaps)."""
+        # OpenAlex positions are dense 0..N-1, so scatter words straight into place
+        size = 0
+        for positions in inverted_index.values():
+            if isinstance(positions, list):
+                if positions:
+                    size = max(size, max(positions) + 1)
+            else:
+                # Handle case where positions is not a list
+                size = max(size, positions + 1)
+        
+        words = [None] * size
+        for word, positions in inverted_index.items():
+            if isinstance(positions, list):
+                for pos in positions:
+                    words[pos] = word
+            else:
+                words[positions] = word
+        return words
+    
     def reconstruct_abstract(self, inverted_index: Dict) -> str:
         """
         Reconstruct abstract text from OpenAlex inverted index format.
@@ -75,31 +168,58 @@ class TextProcessor:
             return ""
         
         try:
-            # Create a list to hold words at their positions
-            word_positions = []
-            
-            for word, positions in inverted_index.items():
-                if isinstance(positions, list):
-                    for pos in positions:
-                        word_positions.append((pos, word))
-                else:
-                    # Handle case where positions is not a list
-                    word_positions.append((positions, word))
-            
-            # Sort by position and extract words
-            word_positions.sort(key=lambda x: x[0])
-            words = [word for _, word in word_positions]
+            words = self._scatter_inverted_index(inverted_index)
             
-            # Join words with spaces
-            abstract = " ".join(words)
+            # Join words with spaces, skipping any gaps in the index
+            abstract = " ".join(word for word in words if word is not None)
             
-            logger.debug(f"Reconstructed abstract ({len(words)} words): {abstract[:100]}...")
+            logger.debug("Reconstructed abstract (%d positions): %.100s...", len(words), abstract)
             return abstract
             
         except Exception as e:
             logger.error(f"Error reconstructing abstract: {e}")
             return ""
     
+    def reconstruct_and_extract(self, inverted_index: Dict,
+                                max_keywords: int = 20) -> Tuple[str, List[str]]:
+        """
+        Reconstruct an abstract and extract its keywords in one pass over the index.
+        
+        Each distinct word is tokenized once instead of re-tokenizing the joined
+        abstract; the result matches reconstruct_abstract followed by extract_keywords.
+        
+        Args:
+            inverted_index: Dictionary mapping words to position lists
+            max_keywords: Maximum number of keywords to return
+            
+        Returns:
+            Tuple of (reconstructed abstract text, extracted keywords)
+        """
+        if not inverted_index:
+            return "", []
+        
+        try:
+            words = self._scatter_inverted_index(inverted_index)
+            
+            stop_words = self.stop_words
+            word_tokens = {
+                word: [token for token in KEYWORD_TOKEN_PATTERN.findall(word.lower())
+                       if token not in stop_words]
+                for word in inverted_index
+            }
+            present = [word for word in words if word is not None]
+            
+            abstract = " ".join(present)
+            word_freq = Counter(token for word in present for token in word_tokens[word])
+            keywords = [word for word, _ in word_freq.most_common(max_keywords)]
+            
+            logger.debug("Reconstructed abstract with %d keywords (%d positions)", len(keywords), len(words))
+            return abstract, keywords
+            
+        except Exception as e:
+            logger.error(f"Error reconstructing abstract: {e}")
+            return "", []
+    
     def create_proxy_abstract(self, topics: List[Dict]) -> str:
         """
         Create a proxy abstract from topic information when abstract is unavailable.
@@ -114,15 +234,16 @@ class TextProcessor:
             return ""
         
         try:
-            # Sort topics by score (highest first)
-            sorted_topics = sorted(topics, key=lambda x: x.get('score', 0), reverse=True)
-            
-            # Take top topics and create a descriptive text
-            top_topics = [topic.get('display_name', '') for topic in sorted_topics[:5] if topic.get('display_name')]
+            # Take the 5 highest-scoring topics and create a descriptive text
+            top_topics = [
+                topic.get('display_name', '')
+                for topic in heapq.nlargest(5, topics, key=lambda x: x.get('score', 0))
+                if topic.get('display_name')
+            ]
             
             if top_topics:
                 proxy_abstract = f"This research work focuses on {', '.join(top_topics[:-1])} and {top_topics[-1]}." if len(top_topics) > 1 else f"This research work focuses on {top_topics[0]}."
-                logger.debug(f"Created proxy abstract from {len(top_topics)} topics")
+                logger.debug("Created proxy abstract from %d topics", len(top_topics))
                 return proxy_abstract
             else:
                 return "Research work with unspecified topics."
@@ -146,38 +267,151 @@ class TextProcessor:
             return []
         
         try:
-            # Clean and tokenize text
-            text = re.sub(r'[^\w\s]', ' ', text.lower())
-            
-            # Try NLTK tokenization first, fallback to simple split
-            try:
-                tokens = word_tokenize(text)
-            except Exception:
-                # Fallback to simple tokenization
-                tokens = text.split()
-            
-            # Filter out stop words and short words
-            filtered_tokens = [
-                token for token in tokens 
-                if token not in self.stop_words 
-                and len(token) > 2 
-                and token.isalpha()
-            ]
-            
-            # Get word frequencies
-            word_freq = Counter(filtered_tokens)
+            # Tokenize into alphabetic words of 3+ letters and drop stop words
+            stop_words = self.stop_words
+            word_freq = Counter(
+                token for token in KEYWORD_TOKEN_PATTERN.findall(text.lower())
+                if token not in stop_words
+            )
             
             # Extract most common words as keywords
             keywords = [word for word, _ in word_freq.most_common(max_keywords)]
             
-            logger.debug(f"Extracted {len(keywords)} keywords from text")
+            logger.debug("Extracted %d keywords from text", len(keywords))
             return keywords
             
         except Exception as e:
             logger.error(f"Error extracting keywords: {e}")
             return []
     
-    def generate_embedding(self, text: str) -> Optional[List[float]]:
+    @staticmethod
+    def _get_cache_key(text: str) -> str:
+        """Content hash used as the embedding cache key."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[np.ndarray]:
+        """Return a cached embedding and mark it as recently used."""
+        embedding = self._emb_cache.get(key)
+        if embedding is not None:
+            self._emb_cache.move_to_end(key)
+        return embedding
+    
+    def _cache_put(self, key: str, embedding: np.ndarray):
+        """Store an embedding, evicting the least recently used entries."""
+        self._emb_cache[key] = embedding
+        self._emb_cache.move_to_end(key)
+        while len(self._emb_cache) > self.cache_size:
+            self._emb_cache.popitem(last=False)
+    
+    def find_uncached_texts(self, texts: List[str]) -> List[str]:
+        """
+        Find texts that still need to be encoded.
+        
+        Args:
+            texts: Input texts, possibly with duplicates
+            
+        Returns:
+            Distinct texts without a cached embedding, in first-seen order
+        """
+        return [
+            text for text in dict.fromkeys(texts)
+            if self._get_cache_key(text) not in self._emb_cache
+        ]
+    
+    def _split_long_texts(self, texts: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Split texts longer than the model's sequence limit into token windows.
+        
+        Each window is a substring of the original text, cut at whitespace where
+        possible, so the model tokenizes the real text rather than decoded ids.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Tuple of (pieces to encode, index of the source text for each piece)
+        """
+        tokenizer = self.model.tokenizer
+        # Leave room for the [CLS] and [SEP] tokens added during encoding
+        window = self.model.max_seq_length - 2
+        # Every token covers at least one character, so shorter texts cannot overflow
+        candidates = [index for index, text in enumerate(texts) if len(text) > window]
+        
+        windows = {}
+        if candidates and getattr(tokenizer, 'is_fast', True):
+            encoded = tokenizer(
+                [texts[index] for index in candidates],
+                add_special_tokens=False,
+                return_offsets_mapping=True
+            )
+            for index, offsets in zip(candidates, encoded['offset_mapping']):
+                if len(offsets) > window:
+                    windows[index] = self._token_windows(texts[index], offsets, window)
+        
+        pieces = []
+        owners = []
+        for index, text in enumerate(texts):
+            for piece in windows.get(index, (text,)):
+                pieces.append(piece)
+                owners.append(index)
+        return pieces, owners
+    
+    @staticmethod
+    def _token_windows(text: str, offsets: List[Tuple[int, int]], window: int) -> List[str]:
+        """Cut ``text`` into substrings of at most ``window`` tokens, given token character offsets."""
+        pieces = []
+        start = 0
+        while start < len(offsets):
+            end = min(start + window, len(offsets))
+            if end < len(offsets):
+                # Move the cut back to a token that follows whitespace so no word is split
+                cut = end
+                while cut > start and offsets[cut][0] == offsets[cut - 1][1]:
+                    cut -= 1
+                if cut > start:
+                    end = cut
+            pieces.append(text[offsets[start][0]:offsets[end - 1][1]])
+            start = end
+        return pieces
+    
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode a list of texts in batched forward passes.
+        
+        SentenceTransformer.encode length-sorts its whole input before batching,
+        so passing every text in one call (rather than pre-chunked slices) keeps
+        padding per batch minimal. Texts longer than the model's sequence limit
+        are embedded as the mean of their token windows instead of being truncated.
+        
+        Args:
+            texts: Non-empty input texts
+            
+        Returns:
+            Read-only array of shape (len(texts), embedding_dim)
+        """
+        self._load_model()
+        pieces, owners = self._split_long_texts(texts)
+        embeddings = self.model.encode(
+            pieces,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+            normalize_embeddings=False,
+            convert_to_numpy=True
+        )
+        
+        if len(pieces) != len(texts):
+            # Mean-pool the window embeddings of each long text
+            owners = np.asarray(owners)
+            pooled = np.zeros((len(texts), embeddings.shape[1]), dtype=np.float32)
+            np.add.at(pooled, owners, embeddings)
+            pooled /= np.bincount(owners, minlength=len(texts))[:, None]
+            embeddings = pooled.astype(embeddings.dtype, copy=False)
+        
+        # Rows are shared between the cache and callers, so they must not be mutated
+        embeddings.flags.writeable = False
+        return embeddings
+    
+    def generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Generate vector embedding for text using sentence transformer.
         
@@ -185,30 +419,80 @@ class TextProcessor:
             text: Input text to generate embedding for
             
         Returns:
-            384-dimensional vector embedding as list of floats, or None if failed
+            Read-only 384-dimensional embedding array, or None if failed
         """
         if not text:
             return None
         
         try:
-            self._load_model()
+            cache_key = self._get_cache_key(text)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Generate embedding
-            embedding = self.model.encode(text, convert_to_numpy=True)
+            embedding = self._encode_batch([text])[0]
+            self._cache_put(cache_key, embedding)
             
-            # Convert to list and ensure it's 384 dimensions
-            embedding_list = embedding.tolist()
+            if len(embedding) != 384:
+                logger.warning(f"Unexpected embedding dimension: {len(embedding)}, expected 384")
             
-            if len(embedding_list) != 384:
-                logger.warning(f"Unexpected embedding dimension: {len(embedding_list)}, expected 384")
-            
-            logger.debug(f"Generated embedding for text: {text[:50]}...")
-            return embedding_list
+            logger.debug("Generated embedding for text: %.50s...", text)
+            return embedding
             
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             return None
     
+    def _prepare_work_text(self, work_data: Dict) -> Tuple[Dict, str]:
+        """
+        Resolve the abstract and keywords of a work.
+        
+        Args:
+            work_data: Dictionary containing work information
+            
+        Returns:
+            Tuple of (partial result without embedding, text to embed)
+        """
+        result = {
+            'abstract': '',
+            'keywords': [],
+            'embedding': None
+        }
+        
+        if not work_data:
+            logger.warning("Empty work_data provided")
+            return result, ''
+        
+        # 1. Get or reconstruct abstract
+        abstract = work_data.get('abstract')
+        keywords = None
+        
+        if not abstract:
+            # Try to reconstruct from inverted index, collecting keywords on the way
+            inverted_index = work_data.get('abstract_inverted_index')
+            if inverted_index:
+                abstract, keywords = self.reconstruct_and_extract(inverted_index)
+                logger.debug("Reconstructed abstract from inverted index")
+        
+        if not abstract:
+            # Create proxy abstract from topics
+            topics = work_data.get('topics', [])
+            abstract = self.create_proxy_abstract(topics)
+            keywords = None
+            logger.debug("Created proxy abstract from topics")
+        
+        result['abstract'] = abstract or ''
+        
+        # 2. Extract keywords
+        if abstract:
+            result['keywords'] = keywords if keywords is not None else self.extract_keywords(abstract)
+        
+        # 3. Embedding text is title + abstract
+        title = work_data.get('title', '')
+        embedding_text = f"{title} {abstract}".strip()
+        
+        return result, embedding_text
+    
     def process_work_text(self, work_data: Dict) -> Dict:
         """
         Process all text-related aspects of a work (abstract, keywords, embedding).
@@ -226,44 +510,126 @@ class TextProcessor:
         }
         
         try:
-            if not work_data:
-                logger.warning("Empty work_data provided")
-                return result
+            result, embedding_text = self._prepare_work_text(work_data)
             
-            # 1. Get or reconstruct abstract
-            abstract = work_data.get('abstract')
+            if embedding_text:
+                result['embedding'] = self.generate_embedding(embedding_text)
             
-            if not abstract:
-                # Try to reconstruct from inverted index
-                inverted_index = work_data.get('abstract_inverted_index')
-                if inverted_index:
-                    abstract = self.reconstruct_abstract(inverted_index)
-                    logger.debug("Reconstructed abstract from inverted index")
+            if logger.isEnabledFor(logging.DEBUG):
+                title = work_data.get('title', '') if work_data else ''
+                logger.debug("Processed text for work: %.50s...", title or 'Unknown')
+            return result
             
-            if not abstract:
-                # Create proxy abstract from topics
-                topics = work_data.get('topics', [])
-                abstract = self.create_proxy_abstract(topics)
-                logger.debug("Created proxy abstract from topics")
+        except Exception as e:
+            logger.error(f"Error processing work text: {e}")
+            return result
+    
+    def _prepare_work_text_safe(self, work_data: Dict) -> Tuple[Dict, str]:
+        """
+        Prepare a work's text, returning an empty result if preparation fails.
+        
+        Args:
+            work_data: Work dictionary from OpenAlex API
             
-            result['abstract'] = abstract or ''
+        Returns:
+            Tuple of (processed text dictionary without embedding, text to embed)
+        """
+        try:
+            return self._prepare_work_text(work_data)
+        except Exception as e:
+            logger.error(f"Error processing work text: {e}")
+            return {'abstract': '', 'keywords': [], 'embedding': None}, ''
+    
+    def process_works_batch(self, works: List[Dict]) -> List[Dict]:
+        """
+        Process many works at once, encoding all embeddings in batched forward passes.
+        
+        Args:
+            works: List of work dictionaries
             
-            # 2. Extract keywords
-            if abstract:
-                keywords = self.extract_keywords(abstract)
-                result['keywords'] = keywords
+        Returns:
+            List of processed text dictionaries, one per input work and in the same order
+        """
+        return self._embed_prepared_works([self._prepare_work_text_safe(work) for work in works])
+    
+    def process_works(self, works: List[Dict], n_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Process many works, preparing text in a process pool and embedding in this process.
+        
+        Abstract reconstruction, proxy abstracts and keyword extraction run in worker
+        processes; the model is only used here so its weights are never copied to workers.
+        Prepared works are encoded in chunks as they arrive, so encoding overlaps with
+        the preparation of later works.
+        
+        Args:
+            works: List of work dictionaries
+            n_workers: Number of worker processes (defaults to the CPU count)
             
-            # 3. Generate embedding from title + abstract
-            title = work_data.get('title', '')
-            embedding_text = f"{title} {abstract}".strip()
+        Returns:
+            List of processed text dictionaries, one per input work and in the same order
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers <= 1 or len(works) < 2:
+            return self.process_works_batch(works)
+        
+        n_workers = min(n_workers, len(works))
+        chunksize = max(1, len(works) // (n_workers * 4))
+        encode_chunk = self.batch_size * PIPELINE_CHUNK_BATCHES
+        results = []
+        prepared = []
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_text_worker,
+                                 initargs=(self.model_name,)) as executor:
+            for item in executor.map(_prepare_work_text_in_worker, works, chunksize=chunksize):
+                prepared.append(item)
+                if len(prepared) >= encode_chunk:
+                    results.extend(self._embed_prepared_works(prepared))
+                    prepared = []
+        
+        if prepared:
+            results.extend(self._embed_prepared_works(prepared))
+        return results
+    
+    def _embed_prepared_works(self, prepared: List[Tuple[Dict, str]]) -> List[Dict]:
+        """
+        Attach batched embeddings to prepared work texts.
+        
+        Args:
+            prepared: (processed text dictionary, text to embed) pairs in work order
             
+        Returns:
+            List of processed text dictionaries with embeddings filled in
+        """
+        results = []
+        texts = []
+        owners = []
+        
+        for index, (result, embedding_text) in enumerate(prepared):
+            results.append(result)
             if embedding_text:
-                embedding = self.generate_embedding(embedding_text)
-                result['embedding'] = embedding
-            
-            logger.debug(f"Processed text for work: {title[:50] if title else 'Unknown'}...")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing work text: {e}")
-            return result
\ No newline at end of file
+                texts.append(embedding_text)
+                owners.append(index)
+        
+        missing = []
+        if texts:
+            try:
+                # Only texts without a cached embedding go through the model
+                missing = self.find_uncached_texts(texts)
+                encoded = {}
+                if missing:
+                    for text, embedding in zip(missing, self._encode_batch(missing)):
+                        encoded[text] = embedding
+                
+                for index, text in zip(owners, texts):
+                    embedding = encoded.get(text)
+                    if embedding is None:
+                        embedding = self._cache_get(self._get_cache_key(text))
+                    results[index]['embedding'] = embedding
+                
+                # Store new embeddings last so lookups above cannot be evicted mid-batch
+                for text, embedding in encoded.items():
+                    self._cache_put(self._get_cache_key(text), embedding)
+            except Exception as e:
+                logger.error(f"Error generating batch embeddings: {e}")
+        
+        logger.debug("Processed text for %d works (%d of %d embeddings encoded)", len(prepared), len(missing), len(texts))
+        return results
@@ -1,7 +1,196 @@
 """Shared application state to avoid circular imports"""
-from typing import Dict
+import logging
+from datetime import datetime
+from io import StringIO
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional
 
-# Global session storage (use Redis/DB in production)
-matching_sessions: Dict[str, Dict] = {}
-team_sessions: Dict[str, Dict] = {}
-report_sessions: Dict[str, Dict] = {}
\ No newline at end of file
+import pandas as pd
+import redis
+from fastapi.concurrency import run_in_threadpool
+from pydantic import PlainSerializer, PlainValidator, TypeAdapter
+from typing_extensions import Annotated, TypedDict
+
+from app.config import settings
+from app.models.matching import MatchingResults
+from app.models.reports import (
+    ComprehensiveReport, ExecutiveSummary, ReportExport, ReportGenerationRequest
+)
+from app.services.ai_service import GapAnalysisResult
+from app.models.team import DreamTeamReport
+
+logger = logging.getLogger(__name__)
+
+# Sessions expire after an hour without writes
+SESSION_TTL_SECONDS = 3600
+
+
+def _frame_from_json(value: Any) -> pd.DataFrame:
+    if isinstance(value, pd.DataFrame):
+        return value
+    # Keep labels and values as stored instead of guessing numbers, dates or narrower dtypes
+    return pd.read_json(StringIO(value), orient="split", dtype=False, convert_axes=False, convert_dates=False)
+
+
+# DataFrames are stored as split-oriented JSON, which keeps index and column labels
+DataFrameJSON = Annotated[
+    pd.DataFrame,
+    PlainValidator(_frame_from_json),
+    PlainSerializer(lambda frame: frame.to_json(orient="split"), return_type=str)
+]
+
+
+class MatchingSession(TypedDict, total=False):
+    status: str
+    progress: int
+    message: str
+    results: MatchingResults
+
+
+class AffinityMatrix(TypedDict):
+    df: DataFrameJSON
+    skills: List[str]
+
+
+class TeamSession(TypedDict, total=False):
+    dream_team_report: DreamTeamReport
+    matching_results: MatchingResults
+    affinity_matrix: Optional[AffinityMatrix]
+
+
+class ReportSession(TypedDict, total=False):
+    status: str
+    progress: int
+    message: str
+    error: str
+    team_id: str
+    request: ReportGenerationRequest
+    started_at: datetime
+    completed_at: datetime
+    comprehensive_report: ComprehensiveReport
+    gap_analysis: Optional[GapAnalysisResult]
+    executive_summary: Optional[ExecutiveSummary]
+    exports: Dict[str, ReportExport]
+    regeneration_status: str
+    regeneration_message: str
+
+
+class SessionStore(MutableMapping[str, Dict]):
+    """Dict-like session storage in Redis with TTL-based eviction.
+
+    Sessions are shared by all server workers and expire ``ttl`` seconds after
+    their last write. Each store declares its session fields with a TypedDict
+    ``schema``; sessions are written as JSON through it and validated back into
+    models and DataFrames on read, so nothing read from Redis is unpickled.
+    Reads return copies: use ``patch`` (or assign the whole session back) to
+    persist changes.
+
+    Redis calls block, so ``async def`` handlers should use the ``a``-prefixed
+    methods, which run the round trip and (de)serialization in the threadpool.
+    """
+
+    def __init__(self, prefix: str, schema: type, ttl: int = SESSION_TTL_SECONDS,
+                 client: Optional[redis.Redis] = None):
+        self.prefix = prefix
+        self.ttl = ttl
+        self._client = client
+        self._adapter = TypeAdapter(schema)
+
+    @property
+    def client(self) -> redis.Redis:
+        """Binary Redis client, created on first use."""
+        if self._client is None:
+            self._client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=True
+            )
+        return self._client
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _dumps(self, session: Dict) -> bytes:
+        return self._adapter.dump_json(session)
+
+    def _loads(self, data: bytes) -> Dict:
+        return self._adapter.validate_json(data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the session for ``key``, or ``default`` if it does not exist."""
+        data = self.client.get(self._key(key))
+        if data is None:
+            return default
+        return self._loads(data)
+
+    def set(self, key: str, value: Dict) -> None:
+        """Store a session, resetting its TTL."""
+        self.client.setex(self._key(key), self.ttl, self._dumps(value))
+
+    def patch(self, key: str, fields: Dict) -> Dict:
+        """Merge ``fields`` into an existing session and store it.
+
+        The read-modify-write runs in a WATCH/MULTI transaction, so concurrent
+        patches from request handlers, background tasks or other workers are
+        retried instead of overwriting each other.
+        """
+        name = self._key(key)
+
+        def apply(pipe) -> Dict:
+            data = pipe.get(name)
+            if data is None:
+                raise KeyError(key)
+            session = self._loads(data)
+            session.update(fields)
+            pipe.multi()
+            pipe.setex(name, self.ttl, self._dumps(session))
+            return session
+
+        return self.client.transaction(apply, name, value_from_callable=True)
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """``get`` without blocking the event loop."""
+        return await run_in_threadpool(self.get, key, default)
+
+    async def aset(self, key: str, value: Dict) -> None:
+        """``set`` without blocking the event loop."""
+        await run_in_threadpool(self.set, key, value)
+
+    async def apatch(self, key: str, fields: Dict) -> Dict:
+        """``patch`` without blocking the event loop."""
+        return await run_in_threadpool(self.patch, key, fields)
+
+    def __getitem__(self, key: str) -> Dict:
+        session = self.get(key)
+        if session is None:
+            raise KeyError(key)
+        return session
+
+    def __setitem__(self, key: str, value: Dict) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.client.delete(self._key(key)):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and bool(self.client.exists(self._key(key)))
+
+    def __iter__(self) -> Iterator[str]:
+        start = len(self.prefix) + 1
+        for name in self.client.scan_iter(match=f"{self.prefix}:*"):
+            if isinstance(name, bytes):
+                name = name.decode()
+            yield name[start:]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.prefix}:*"))
+
+
+# Global session storage shared across workers
+matching_sessions = SessionStore("session:match", MatchingSession)
+team_sessions = SessionStore("session:team", TeamSession)
+report_sessions = SessionStore("session:report", ReportSession)
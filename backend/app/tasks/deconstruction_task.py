@@ -1,9 +1,13 @@
 """Deconstruction task for processing PDF solicitations into structured data."""
 
+import re
 import time
+import hashlib
 import logging
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
 from datetime import datetime
+from app.config import settings
 from app.services.pdf_processor import extract_pdf_text, chunk_by_sections
 from app.services.llm_metadata_extractor import LLMMetadataExtractor
 from app.jobs.job_manager import get_job_manager
@@ -11,6 +15,110 @@ from app.models.structured_solicitation import StructuredSolicitation
 
 logger = logging.getLogger(__name__)
 
+# LLM extractor shared by all jobs in this worker, see _get_llm_extractor
+_llm_extractor = None
+_llm_extractor_lock = threading.Lock()
+
+# Redis key prefix for deconstruction results keyed by PDF SHA-256
+DECONSTRUCTION_CACHE_PREFIX = "decon"
+
+# Read size for hashing PDFs where hashlib.file_digest is unavailable (Python < 3.11)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Fallback extraction patterns, compiled once at import
+FUNDING_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$([0-9,]+(?:\.[0-9]{2})?)\s*(?:million|M)?',
+    r'([0-9,]+)\s*dollars?',
+    r'up\s+to\s+\$?([0-9,]+(?:\.[0-9]{2})?)',
+    r'awards?\s+of\s+up\s+to\s+\$?([0-9,]+)',
+    r'maximum\s+(?:of\s+)?\$?([0-9,]+)',
+    r'ceiling\s+of\s+\$?([0-9,]+)'
+))
+
+DURATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'([0-9]+)\s*years?\s*\(([0-9]+)\s*months?\)',  # "3 years (36 months)"
+    r'([0-9]+)\s*years?',
+    r'([0-9]+)\s*months?',
+    r'duration[:\s]+([0-9]+)\s*(?:years?|months?)',
+    r'project\s+period[:\s]+([0-9]+)'
+))
+
+TITLE_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in (
+    r'NSF\s+[0-9-]+[:\s]+([^.\n]+)',
+    r'Program[:\s]+([^.\n]+)',
+    r'Award[:\s]+([^.\n]+)',
+    r'^([A-Z][^.\n]+(?:Program|Initiative|Award))',
+))
+
+DEADLINE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'deadline[:\s]+([A-Za-z]+ [0-9]+, [0-9]{4})',
+    r'due[:\s]+([A-Za-z]+ [0-9]+, [0-9]{4})',
+    r'submit(?:ted)?\s+by[:\s]+([A-Za-z]+ [0-9]+, [0-9]{4})',
+    r'([A-Za-z]+ [0-9]+, [0-9]{4})\s+deadline'
+))
+
+ELIGIBILITY_PATTERNS = tuple(
+    re.compile(rf'[^.\n]*{re.escape(keyword)}[^.\n]*', re.IGNORECASE)
+    for keyword in (
+        "U.S. citizens", "permanent residents", "nationals",
+        "Principal Investigators must", "Co-Principal Investigators",
+        "eligible institutions", "degree-granting"
+    )
+)
+
+TEAM_SIZE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'maximum\s+of\s+([0-9]+)\s+(?:Principal\s+)?Investigators?',
+    r'up\s+to\s+([0-9]+)\s+(?:total\s+)?researchers?',
+    r'teams?\s+(?:may\s+)?include\s+up\s+to\s+([0-9]+)',
+    r'([0-9]+)\s+(?:Principal\s+)?Investigators?\s+per\s+proposal'
+))
+
+# Deadline date formats, keyed by a pattern that recognizes their shape so only
+# plausible formats are handed to strptime
+DEADLINE_FORMATS = (
+    (re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}'), ("%B %d, %Y", "%b %d, %Y")),  # "March 15, 2025", "Mar 15, 2025"
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), ("%Y-%m-%d",)),                     # "2025-03-15"
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), ("%m/%d/%Y", "%d/%m/%Y")),           # "03/15/2025", "15/03/2025"
+)
+
+# Skill keywords per fallback category, in reporting order
+SKILL_KEYWORDS = {
+    "required_scientific_skills": (
+        "required expertise", "must have", "essential skills",
+        "advanced mathematics", "theoretical computer science", "machine learning theory",
+        "high-performance computing", "parallel algorithms", "numerical methods"
+    ),
+    "preferred_skills": (
+        "preferred qualifications", "desired experience", "advantageous",
+        "optimization theory", "statistical learning", "deep learning",
+        "artificial intelligence", "data analytics", "computational complexity"
+    ),
+    "technical_requirements": (
+        "technical requirements", "access to", "proficiency in",
+        "supercomputing facilities", "programming languages", "software",
+        "Python", "MATLAB", "C++", "R programming", "Fortran"
+    ),
+}
+
+# One lookahead alternation finds every skill keyword in a single scan of the
+# lowercased text, including keywords that overlap each other
+SKILL_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(
+        re.escape(keyword.lower())
+        for keyword in sorted(
+            {keyword for keywords in SKILL_KEYWORDS.values() for keyword in keywords},
+            key=len, reverse=True
+        )
+    ) + "))"
+)
+
+# Maximum skills reported per category
+SKILL_CATEGORY_LIMITS = {
+    "required_scientific_skills": 8,
+    "preferred_skills": 8,
+    "technical_requirements": 6,
+}
+
 
 def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSolicitation:
     """
@@ -19,7 +127,7 @@ def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSoli
     Steps:
     1. Extract full text using PDF library (PyMuPDF)
     2. Chunk text by section headers ("Eligibility", "Award Information", etc.)
-    3. Send each chunk to LLM for targeted extraction
+    3. Send all chunks to the LLM in one batched extraction request
     4. Assemble structured solicitation object
     5. Store result in Redis
     
@@ -41,6 +149,24 @@ def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSoli
         job_manager.update_job_status(job_id, "processing", progress=0)
         logger.info(f"Starting deconstruction task for job {job_id}")
         
+        # Step 0: Reuse the result of an earlier run on the same PDF
+        digest = _hash_file(file_path)
+        cached_solicitation = _get_cached_solicitation(job_manager, digest)
+        if cached_solicitation is not None:
+            structured_solicitation = cached_solicitation.model_copy(update={
+                "solicitation_id": job_id,
+                "processing_time_seconds": time.time() - start_time,
+                "created_at": datetime.now()
+            })
+            job_manager.update_job_status(
+                job_id, "completed", progress=100, result=structured_solicitation.model_dump_json()
+            )
+            logger.info(f"Deconstruction task for job {job_id} served from cache ({digest[:12]})")
+            return structured_solicitation
+        
+        # Connect to the LLM service while the PDF is being read
+        _start_llm_warm_up()
+        
         # Step 1: Extract PDF text with enhanced error handling
         logger.info(f"Extracting text from PDF: {file_path}")
         try:
@@ -84,21 +210,25 @@ def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSoli
         # Step 3: Extract metadata using LLM with comprehensive error handling
         logger.info("Extracting metadata using LLM")
         extracted_metadata = None
+        # Only LLM results are cached, so a degraded run is redone once the LLM is back
+        llm_extraction_succeeded = False
         
         try:
-            llm_extractor = LLMMetadataExtractor()
+            llm_extractor = _get_llm_extractor()
             
             if not llm_extractor.is_available():
                 logger.warning("LLM service not available, using fallback extraction")
                 extracted_metadata = _fallback_metadata_extraction(sections, full_text)
             else:
                 logger.info("LLM service available, attempting extraction")
-                extracted_metadata = llm_extractor.extract_all_metadata(sections)
+                extracted_metadata = llm_extractor.extract_all_metadata_batched(sections)
                 
                 # Validate extraction results
                 if not extracted_metadata or not any(extracted_metadata.get(key, {}) for key in ["metadata", "rules", "skills"]):
                     logger.warning("LLM extraction returned empty results, falling back to pattern-based extraction")
                     extracted_metadata = _fallback_metadata_extraction(sections, full_text)
+                else:
+                    llm_extraction_succeeded = True
                     
         except Exception as e:
             logger.error(f"LLM metadata extraction failed: {str(e)}")
@@ -133,7 +263,8 @@ def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSoli
                 full_text=full_text,
                 sections=sections,
                 extracted_metadata=extracted_metadata,
-                processing_time=processing_time
+                processing_time=processing_time,
+                source_sha256=digest
             )
             
             # Validate the assembled object
@@ -144,11 +275,12 @@ def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSoli
             logger.error(f"Failed to assemble structured solicitation: {str(e)}")
             raise Exception(f"Assembly failed: {str(e)}")
         
-        # Step 5: Store result and complete job
+        # Step 5: Store result and complete job, serializing the full text only once
         try:
-            result_dict = structured_solicitation.model_dump()
-            job_manager.store_job_result(job_id, result_dict)
-            job_manager.update_job_status(job_id, "completed", progress=100)
+            result_json = structured_solicitation.model_dump_json()
+            job_manager.update_job_status(job_id, "completed", progress=100, result=result_json)
+            if llm_extraction_succeeded:
+                _cache_solicitation(job_manager, digest, result_json)
             
             logger.info(f"Deconstruction task completed for job {job_id} in {processing_time:.2f}s")
             logger.info(f"Extraction confidence: {structured_solicitation.extraction_confidence:.1f}%")
@@ -178,12 +310,93 @@ def deconstruct_solicitation_task(job_id: str, file_path: str) -> StructuredSoli
         raise Exception(error_message)
 
 
+def _get_llm_extractor() -> LLMMetadataExtractor:
+    """Extractor shared by all jobs in this worker, so they reuse one Groq client and its connection pool
+
+    An extractor that is not available (e.g. GROQ_API_KEY missing) is returned
+    but not kept, so a later job retries once the configuration is fixed. The
+    shared instance warms up its connection once, in the background, when created.
+    """
+    global _llm_extractor
+    if _llm_extractor is None:
+        with _llm_extractor_lock:
+            if _llm_extractor is None:
+                extractor = LLMMetadataExtractor(cache=_get_extraction_cache())
+                if not extractor.is_available():
+                    return extractor
+                threading.Thread(target=extractor.warm_up, daemon=True).start()
+                _llm_extractor = extractor
+    return _llm_extractor
+
+
+def _get_extraction_cache():
+    """Redis client for the extractor's section cache, or None if Redis is unreachable"""
+    try:
+        return get_job_manager().redis
+    except Exception as e:
+        logger.warning(f"Section extraction cache disabled: {e}")
+        return None
+
+
+def _start_llm_warm_up() -> None:
+    """Create the shared LLM extractor early, so its first-use warm-up overlaps PDF reading"""
+    try:
+        _get_llm_extractor()
+    except Exception as e:
+        logger.warning(f"Could not start LLM warm-up: {e}")
+
+
+def _hash_file(file_path: str) -> Optional[str]:
+    """SHA-256 of a file, or None if it cannot be read"""
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):
+                # file_digest reads into one reusable buffer and hashes via OpenSSL
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+    except OSError as e:
+        logger.warning(f"Could not hash {file_path}, skipping result cache: {e}")
+        return None
+
+
+def _get_cached_solicitation(job_manager, digest: Optional[str]) -> Optional[StructuredSolicitation]:
+    """Look up a previously deconstructed solicitation by PDF digest"""
+    if not digest:
+        return None
+    try:
+        cached = job_manager.redis.get(f"{DECONSTRUCTION_CACHE_PREFIX}:{digest}")
+        if not isinstance(cached, (str, bytes)):
+            return None
+        return StructuredSolicitation.model_validate_json(cached)
+    except Exception as e:
+        logger.warning(f"Ignoring deconstruction cache entry for {digest}: {e}")
+        return None
+
+
+def _cache_solicitation(job_manager, digest: Optional[str], solicitation_json: str) -> None:
+    """Store a serialized solicitation under its PDF digest"""
+    if not digest:
+        return
+    try:
+        job_manager.redis.setex(
+            f"{DECONSTRUCTION_CACHE_PREFIX}:{digest}",
+            settings.DECONSTRUCTION_CACHE_TTL,
+            solicitation_json
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache deconstruction result for {digest}: {e}")
+
+
 def _assemble_structured_solicitation(
     job_id: str,
     full_text: str,
     sections: Dict[str, str],
     extracted_metadata: Dict[str, Any],
-    processing_time: float
+    processing_time: float,
+    source_sha256: Optional[str] = None
 ) -> StructuredSolicitation:
     """Assemble the final structured solicitation object"""
     
@@ -213,7 +426,8 @@ def _assemble_structured_solicitation(
         "full_text": full_text,
         "processing_time_seconds": processing_time,
         "extraction_confidence": extraction_confidence_normalized,
-        "created_at": datetime.now()
+        "created_at": datetime.now(),
+        "source_sha256": source_sha256
     }
     
     # Add optional fields only if they have values
@@ -227,22 +441,7 @@ def _assemble_structured_solicitation(
         # Try to parse the deadline string into a datetime object
         deadline_str = metadata.get("submission_deadline")
         try:
-            # Try common date formats
-            date_formats = [
-                "%B %d, %Y",  # "March 15, 2025"
-                "%b %d, %Y",  # "Mar 15, 2025"
-                "%Y-%m-%d",   # "2025-03-15"
-                "%m/%d/%Y",   # "03/15/2025"
-                "%d/%m/%Y",   # "15/03/2025"
-            ]
-            
-            parsed_deadline = None
-            for fmt in date_formats:
-                try:
-                    parsed_deadline = datetime.strptime(deadline_str, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_deadline = _parse_deadline(deadline_str)
             
             if parsed_deadline:
                 solicitation_data["submission_deadline"] = parsed_deadline
@@ -279,6 +478,19 @@ def _assemble_structured_solicitation(
     return StructuredSolicitation(**solicitation_data)
 
 
+def _parse_deadline(deadline_str: str) -> Optional[datetime]:
+    """Parse a deadline with the date formats matching its shape, or return None"""
+    for shape, formats in DEADLINE_FORMATS:
+        if shape.fullmatch(deadline_str):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(deadline_str, fmt)
+                except ValueError:
+                    continue
+            return None
+    return None
+
+
 def _fallback_metadata_extraction(sections: Dict[str, str], full_text: str) -> Dict[str, Any]:
     """
     Enhanced fallback metadata extraction when LLM is not available
@@ -291,28 +503,19 @@ def _fallback_metadata_extraction(sections: Dict[str, str], full_text: str) -> D
     skills = {}
     successful_extractions = 0
     
-    import re
+    text_lower = full_text.lower()
     
     # Enhanced funding amount extraction
-    funding_patterns = [
-        r'\$([0-9,]+(?:\.[0-9]{2})?)\s*(?:million|M)?',
-        r'([0-9,]+)\s*dollars?',
-        r'up\s+to\s+\$?([0-9,]+(?:\.[0-9]{2})?)',
-        r'awards?\s+of\s+up\s+to\s+\$?([0-9,]+)',
-        r'maximum\s+(?:of\s+)?\$?([0-9,]+)',
-        r'ceiling\s+of\s+\$?([0-9,]+)'
-    ]
-    
     max_funding = 0
-    for pattern in funding_patterns:
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
+    for pattern in FUNDING_PATTERNS:
+        matches = pattern.findall(full_text)
         if matches:
             try:
                 for match in matches:
                     amount_str = match.replace(',', '')
                     amount = float(amount_str)
                     # Handle millions
-                    if 'million' in full_text.lower() and amount < 1000:
+                    if 'million' in text_lower and amount < 1000:
                         amount *= 1000000
                     max_funding = max(max_funding, amount)
             except ValueError:
@@ -323,25 +526,17 @@ def _fallback_metadata_extraction(sections: Dict[str, str], full_text: str) -> D
         successful_extractions += 1
     
     # Enhanced project duration extraction
-    duration_patterns = [
-        r'([0-9]+)\s*years?\s*\(([0-9]+)\s*months?\)',  # "3 years (36 months)"
-        r'([0-9]+)\s*years?',
-        r'([0-9]+)\s*months?',
-        r'duration[:\s]+([0-9]+)\s*(?:years?|months?)',
-        r'project\s+period[:\s]+([0-9]+)'
-    ]
-    
-    for pattern in duration_patterns:
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
-        if matches:
+    for pattern in DURATION_PATTERNS:
+        match = pattern.search(full_text)
+        if match:
             try:
-                if isinstance(matches[0], tuple):
+                if len(match.groups()) > 1:
                     # Handle "3 years (36 months)" format
-                    duration = int(matches[0][1])  # Use months value
+                    duration = int(match.group(2))  # Use months value
                 else:
-                    duration = int(matches[0])
+                    duration = int(match.group(1))
                     # Convert years to months if pattern contains 'year'
-                    if 'year' in pattern.lower():
+                    if 'year' in pattern.pattern.lower():
                         duration *= 12
                 metadata["project_duration_months"] = duration
                 successful_extractions += 1
@@ -349,84 +544,60 @@ def _fallback_metadata_extraction(sections: Dict[str, str], full_text: str) -> D
             except (ValueError, IndexError):
                 continue
     
-    # Extract award title from common patterns
-    title_patterns = [
-        r'NSF\s+[0-9-]+[:\s]+([^.\n]+)',
-        r'Program[:\s]+([^.\n]+)',
-        r'Award[:\s]+([^.\n]+)',
-        r'^([A-Z][^.\n]+(?:Program|Initiative|Award))',
-    ]
-    
-    for pattern in title_patterns:
-        matches = re.findall(pattern, full_text, re.MULTILINE | re.IGNORECASE)
-        if matches:
-            title = matches[0].strip()
+    # Extract award title from common patterns; only the first match of each
+    # pattern is used, so stop scanning there
+    for pattern in TITLE_PATTERNS:
+        match = pattern.search(full_text)
+        if match:
+            title = match.group(1).strip()
             if len(title) > 10 and len(title) < 200:  # Reasonable title length
                 metadata["award_title"] = title
                 successful_extractions += 1
                 break
     
     # Extract submission deadline
-    deadline_patterns = [
-        r'deadline[:\s]+([A-Za-z]+ [0-9]+, [0-9]{4})',
-        r'due[:\s]+([A-Za-z]+ [0-9]+, [0-9]{4})',
-        r'submit(?:ted)?\s+by[:\s]+([A-Za-z]+ [0-9]+, [0-9]{4})',
-        r'([A-Za-z]+ [0-9]+, [0-9]{4})\s+deadline'
-    ]
-    
-    for pattern in deadline_patterns:
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
-        if matches:
-            metadata["submission_deadline"] = matches[0].strip()
+    for pattern in DEADLINE_PATTERNS:
+        match = pattern.search(full_text)
+        if match:
+            metadata["submission_deadline"] = match.group(1).strip()
             successful_extractions += 1
             break
     
-    # Enhanced eligibility rules extraction
-    eligibility_keywords = [
-        "U.S. citizens", "permanent residents", "nationals",
-        "Principal Investigators must", "Co-Principal Investigators",
-        "eligible institutions", "degree-granting"
-    ]
-    
+    # Enhanced eligibility rules extraction, keeping each rule once in the
+    # order it is first found
     pi_rules = []
     institutional_rules = []
+    seen_rules = set()
     
-    for keyword in eligibility_keywords:
-        pattern = rf'[^.\n]*{re.escape(keyword)}[^.\n]*'
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
+    for pattern in ELIGIBILITY_PATTERNS:
+        matches = pattern.findall(full_text)
         for match in matches:
             clean_match = match.strip()
-            if len(clean_match) > 20:  # Meaningful rule
+            if len(clean_match) > 20 and clean_match not in seen_rules:  # Meaningful, new rule
+                seen_rules.add(clean_match)
                 if "Principal Investigator" in clean_match or "PI" in clean_match:
                     pi_rules.append(clean_match)
                 elif "institution" in clean_match.lower():
                     institutional_rules.append(clean_match)
     
     if pi_rules:
-        rules["pi_eligibility_rules"] = list(set(pi_rules))  # Remove duplicates
+        rules["pi_eligibility_rules"] = pi_rules
         successful_extractions += 1
     
     if institutional_rules:
-        rules["institutional_limitations"] = list(set(institutional_rules))
+        rules["institutional_limitations"] = institutional_rules
         successful_extractions += 1
     
     # Extract team size constraints
-    team_size_patterns = [
-        r'maximum\s+of\s+([0-9]+)\s+(?:Principal\s+)?Investigators?',
-        r'up\s+to\s+([0-9]+)\s+(?:total\s+)?researchers?',
-        r'teams?\s+(?:may\s+)?include\s+up\s+to\s+([0-9]+)',
-        r'([0-9]+)\s+(?:Principal\s+)?Investigators?\s+per\s+proposal'
-    ]
-    
     team_constraints = {}
-    for pattern in team_size_patterns:
-        matches = re.findall(pattern, full_text, re.IGNORECASE)
-        if matches:
+    for pattern in TEAM_SIZE_PATTERNS:
+        match = pattern.search(full_text)
+        if match:
             try:
-                size = int(matches[0])
-                if "Principal Investigator" in pattern or "PI" in pattern:
+                size = int(match.group(1))
+                if "Principal Investigator" in pattern.pattern or "PI" in pattern.pattern:
                     team_constraints["max_pi"] = size
-                elif "total" in pattern or "researchers" in pattern:
+                elif "total" in pattern.pattern or "researchers" in pattern.pattern:
                     team_constraints["max_team_size"] = size
             except ValueError:
                 continue
@@ -436,46 +607,12 @@ def _fallback_metadata_extraction(sections: Dict[str, str], full_text: str) -> D
         successful_extractions += 1
     
     # Enhanced skills extraction with categorization
-    required_skill_keywords = [
-        "required expertise", "must have", "essential skills",
-        "advanced mathematics", "theoretical computer science", "machine learning theory",
-        "high-performance computing", "parallel algorithms", "numerical methods"
-    ]
-    
-    preferred_skill_keywords = [
-        "preferred qualifications", "desired experience", "advantageous",
-        "optimization theory", "statistical learning", "deep learning",
-        "artificial intelligence", "data analytics", "computational complexity"
-    ]
-    
-    technical_requirement_keywords = [
-        "technical requirements", "access to", "proficiency in",
-        "supercomputing facilities", "programming languages", "software",
-        "Python", "MATLAB", "C++", "R programming", "Fortran"
-    ]
-    
-    def extract_skills_by_category(keywords, text):
-        found_skills = []
-        for keyword in keywords:
-            if keyword.lower() in text.lower():
-                found_skills.append(keyword)
-        return found_skills
-    
-    required_skills = extract_skills_by_category(required_skill_keywords, full_text)
-    preferred_skills = extract_skills_by_category(preferred_skill_keywords, full_text)
-    technical_reqs = extract_skills_by_category(technical_requirement_keywords, full_text)
-    
-    if required_skills:
-        skills["required_scientific_skills"] = required_skills[:8]
-        successful_extractions += 1
-    
-    if preferred_skills:
-        skills["preferred_skills"] = preferred_skills[:8]
-        successful_extractions += 1
-    
-    if technical_reqs:
-        skills["technical_requirements"] = technical_reqs[:6]
-        successful_extractions += 1
+    found_keywords = set(SKILL_KEYWORD_PATTERN.findall(text_lower))
+    for category, keywords in SKILL_KEYWORDS.items():
+        found_skills = [keyword for keyword in keywords if keyword.lower() in found_keywords]
+        if found_skills:
+            skills[category] = found_skills[:SKILL_CATEGORY_LIMITS[category]]
+            successful_extractions += 1
     
     logger.info(f"Fallback extraction completed: {successful_extractions} successful extractions")
     
@@ -508,5 +645,5 @@ def _chunk_by_sections(text: str) -> Dict[str, str]:
 
 def _extract_metadata_with_llm(section_text: str, section_type: str) -> Dict[str, Any]:
     """LLM-powered data extraction"""
-    extractor = LLMMetadataExtractor()
+    extractor = _get_llm_extractor()
     return extractor._extract_metadata_with_llm(section_text, section_type)
\ No newline at end of file
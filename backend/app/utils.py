@@ -3,6 +3,55 @@ import re
 import time
 from typing import Dict, Tuple
 from pathlib import Path
+from app.services.pdf_processor import extract_page_texts
+
+# Lines that cannot be a document title
+TITLE_SKIP_PATTERN = re.compile(r'^(Page|Section|\d+)', re.IGNORECASE)
+
+# Heading patterns per section
+SECTION_HEADINGS = {
+    'Program Description': [
+        r'Program\s+Description',
+        r'Scientific\s+Objectives',
+        r'Research\s+Areas'
+    ],
+    'Award Information': [
+        r'Section\s+II[:\s]*Award\s+Information',
+        r'Award\s+Information',
+        r'Funding\s+Information'
+    ],
+    'Eligibility': [
+        r'Section\s+III[:\s]*Eligibility',
+        r'Eligibility\s+Requirements',
+        r'Who\s+May\s+Apply'
+    ],
+    'Submission Requirements': [
+        r'Section\s+V[:\s]*Proposal.*Submission',
+        r'Application\s+Instructions',
+        r'Submission\s+Instructions'
+    ]
+}
+
+# One named group per section inside a lookahead, so a single scan reports
+# every section even where headings overlap
+SECTION_GROUPS = {f"section_{i}": name for i, name in enumerate(SECTION_HEADINGS)}
+SECTION_PATTERN = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{group}>" + "|".join(SECTION_HEADINGS[name]) + ")"
+        for group, name in SECTION_GROUPS.items()
+    ) + ")",
+    re.IGNORECASE
+)
+
+# Title and abstract detection
+TITLE_SCAN_LINES = 20
+ABSTRACT_FALLBACK_LINES = 6
+ABSTRACT_MAX_CHARS = 2000
+ABSTRACT_MARKERS = ('abstract', 'summary', 'overview', 'program description')
+ABSTRACT_STOP_CONDITIONS = (
+    'table of contents', 'section i', 'section 1', 'introduction',
+    'background', 'key dates', 'important dates'
+)
 
 def extract_pdf_text(file_path: str) -> Dict:
     """Extract text from PDF and perform basic analysis"""
@@ -34,16 +83,16 @@ def _extract_text_from_pdf(file_path: str) -> Tuple[str, str, str]:
     doc = None
     try:
         doc = fitz.open(file_path)
-        full_text = ""
         
-        # Extract text from all pages
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text = page.get_text()
-            full_text += f"\n--- PAGE {page_num + 1} ---\n{text}\n"
+        # Extract text from all pages, joining once at the end
+        full_text = "".join(
+            f"\n--- PAGE {page_num} ---\n{text}\n"
+            for page_num, text in enumerate(extract_page_texts(doc, file_path), start=1)
+        )
         
-        # Extract title and abstract
-        title, abstract = _extract_title_and_abstract(full_text, Path(file_path).name)
+        # Extract title and abstract, preferring the document's own title
+        metadata_title = (doc.metadata or {}).get("title") or ""
+        title, abstract = _extract_title_and_abstract(full_text, Path(file_path).name, metadata_title)
         
         return full_text, title, abstract
     
@@ -53,97 +102,83 @@ def _extract_text_from_pdf(file_path: str) -> Tuple[str, str, str]:
         if doc:
             doc.close()
 
-def _extract_title_and_abstract(text: str, filename: str) -> Tuple[str, str]:
-    """Extract title and abstract from text"""
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+def _extract_title_and_abstract(text: str, filename: str, metadata_title: str = "") -> Tuple[str, str]:
+    """Extract title and abstract from text in a single pass over its lines
+
+    A reasonable PDF metadata title is used as-is, skipping the title scan.
+    """
+    metadata_title = metadata_title.strip()
+    if 10 < len(metadata_title) < 300:
+        title = metadata_title
+        title_found = True
+    else:
+        # Default title from filename
+        title = filename.replace('.pdf', '').replace('_', ' ').replace('-', ' ')
+        title_found = False
     
-    # Default title from filename
-    title = filename.replace('.pdf', '').replace('_', ' ').replace('-', ' ')
+    abstract_parts = []
+    abstract_length = 0
+    abstract_started = False
+    abstract_done = False
+    leading_lines = []
     
-    # Look for title in first 20 lines
-    for i, line in enumerate(lines[:20]):
-        if (30 < len(line) < 300 and
+    lines = filter(None, map(str.strip, text.split('\n')))
+    for line_num, line in enumerate(lines):
+        if line_num < ABSTRACT_FALLBACK_LINES:
+            leading_lines.append(line)
+        
+        # Look for title in the first lines
+        if (not title_found and line_num < TITLE_SCAN_LINES and
+            30 < len(line) < 300 and
             not line.isupper() and
-            not re.match(r'^(Page|Section|\d+)', line, re.IGNORECASE) and
+            not TITLE_SKIP_PATTERN.match(line) and
             not line.startswith('http')):
             title = line
-            break
-    
-    # Extract abstract
-    abstract = ""
-    abstract_started = False
-    abstract_markers = ['abstract', 'summary', 'overview', 'program description']
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        
-        # Start abstract detection
-        if not abstract_started:
-            for marker in abstract_markers:
-                if marker in line_lower and len(line) > len(marker) + 5:
-                    abstract_started = True
-                    # Extract text after marker
-                    marker_pos = line_lower.find(marker)
-                    remaining_text = line[marker_pos + len(marker):].strip()
-                    if remaining_text and not remaining_text.startswith(':'):
-                        abstract += remaining_text + " "
-                    break
-            continue
+            title_found = True
         
-        # Continue abstract collection
-        if abstract_started:
-            # Stop conditions
-            stop_conditions = [
-                'table of contents', 'section i', 'section 1', 'introduction',
-                'background', 'key dates', 'important dates'
-            ]
-            
-            if any(stop in line_lower for stop in stop_conditions):
-                break
+        if not abstract_done:
+            line_lower = line.lower()
             
-            abstract += line + " "
+            # Start abstract detection
+            if not abstract_started:
+                for marker in ABSTRACT_MARKERS:
+                    if marker in line_lower and len(line) > len(marker) + 5:
+                        abstract_started = True
+                        # Extract text after marker
+                        marker_pos = line_lower.find(marker)
+                        remaining_text = line[marker_pos + len(marker):].strip()
+                        if remaining_text and not remaining_text.startswith(':'):
+                            abstract_parts.append(remaining_text)
+                            abstract_length += len(remaining_text) + 1
+                        break
             
-            # Stop if abstract is getting too long
-            if len(abstract) > 2000:
-                break
+            # Continue abstract collection until a stop condition or length limit
+            elif any(stop in line_lower for stop in ABSTRACT_STOP_CONDITIONS):
+                abstract_done = True
+            else:
+                abstract_parts.append(line)
+                abstract_length += len(line) + 1
+                abstract_done = abstract_length > ABSTRACT_MAX_CHARS
+        
+        # Stop once every result is settled
+        if (abstract_done and line_num + 1 >= ABSTRACT_FALLBACK_LINES and
+                (title_found or line_num + 1 >= TITLE_SCAN_LINES)):
+            break
+    
+    abstract = " ".join(abstract_parts)
     
     # Fallback for abstract
     if not abstract.strip():
-        abstract = ' '.join(lines[1:6])  # Use first few lines
+        abstract = ' '.join(leading_lines[1:])  # Use first few lines
     
     return title.strip(), abstract.strip()[:1500]  # Limit abstract length
 
 def _detect_sections(text: str) -> list:
     """Detect sections in the document"""
-    sections_found = []
-    
-    section_patterns = {
-        'Program Description': [
-            r'Program\s+Description',
-            r'Scientific\s+Objectives',
-            r'Research\s+Areas'
-        ],
-        'Award Information': [
-            r'Section\s+II[:\s]*Award\s+Information',
-            r'Award\s+Information',
-            r'Funding\s+Information'
-        ],
-        'Eligibility': [
-            r'Section\s+III[:\s]*Eligibility',
-            r'Eligibility\s+Requirements',
-            r'Who\s+May\s+Apply'
-        ],
-        'Submission Requirements': [
-            r'Section\s+V[:\s]*Proposal.*Submission',
-            r'Application\s+Instructions',
-            r'Submission\s+Instructions'
-        ]
-    }
-    
-    for section_name, patterns in section_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                sections_found.append(section_name)
-                break
+    found = set()
+    for match in SECTION_PATTERN.finditer(text):
+        found.add(SECTION_GROUPS[match.lastgroup])
+        if len(found) == len(SECTION_HEADINGS):
+            break
     
-    return sections_found
\ No newline at end of file
+    return [name for name in SECTION_HEADINGS if name in found]
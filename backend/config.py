@@ -1,13 +1,37 @@
+import atexit
 import os
-from typing import Optional, List
+import queue
+from functools import cached_property, lru_cache
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
-from pydantic import BaseSettings, validator
+from pydantic import FieldValidationInfo, PrivateAttr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+# Preprocessed model files expected in MODELS_DIR
+REQUIRED_MODEL_FILES = (
+    "tfidf_model.pkl",
+    "researcher_vectors.npz",
+    "conceptual_profiles.npz",
+    "researcher_metadata.parquet",
+    "evidence_index.json"
+)
+
+# Background thread writing queued log records (started by Settings.setup_logging)
+_log_listener: Optional[QueueListener] = None
+
+# Expected key prefixes per provider (empty values mean "not configured")
+API_KEY_PREFIXES = {
+    "ANTHROPIC_API_KEY": ("sk-ant-",),
+    "GROQ_API_KEY": ("gsk_",),
+    "OPENAI_API_KEY": ("sk-",)
+}
 
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
-    Uses pydantic BaseSettings for automatic validation and type conversion.
+    Uses pydantic-settings BaseSettings for automatic validation and type conversion.
     """
     
     # API Configuration
@@ -72,44 +96,81 @@ class Settings(BaseSettings):
     CACHE_TTL_SECONDS: int = 3600  # 1 hour
     
     # Logging Configuration
-    LOG_LEVEL: str = "INFO"
+    LOG_LEVEL: int = logging.INFO  # Level name (e.g. "INFO") or number in the environment
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-    
-    @validator("ANTHROPIC_API_KEY")
-    def validate_anthropic_key(cls, v):
-        if v and not v.startswith("sk-ant-"):
-            raise ValueError("Invalid Anthropic API key format")
-        return v
-    
-    @validator("DATA_DIR", "MODELS_DIR", "UPLOADS_DIR", "OUTPUTS_DIR")
+    DISABLE_APP_LOG_FILE: bool = False  # Skip app.log, e.g. in ephemeral containers
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,  # Read-only for the life of the process
+        extra="ignore"  # .env also holds settings for other components
+    )
+    
+    # (models dir mtime_ns, results) of the last validate_environment call
+    _validation_cache: Optional[Tuple[Optional[int], Dict]] = PrivateAttr(default=None)
+    # AI configuration derived once from the (frozen) API key fields
+    _has_ai: bool = PrivateAttr(default=False)
+    _ai_status: Dict[str, bool] = PrivateAttr(default_factory=dict)
+    
+    @field_validator("DATA_DIR", "MODELS_DIR", "UPLOADS_DIR", "OUTPUTS_DIR", mode="after")
+    @classmethod
     def validate_directories(cls, v):
         """Ensure directories exist or can be created"""
         path = Path(v)
         path.mkdir(parents=True, exist_ok=True)
         return str(path)
     
-    @validator("TF_IDF_ALPHA", "TF_IDF_BETA")
+    @field_validator(*API_KEY_PREFIXES, mode="after")
+    @classmethod
+    def validate_api_key_prefix(cls, v, info: FieldValidationInfo):
+        """Check that configured API keys have their provider's prefix"""
+        prefixes = API_KEY_PREFIXES[info.field_name]
+        if v and not v.startswith(prefixes):
+            raise ValueError(f"{info.field_name} must start with {' or '.join(prefixes)}")
+        return v
+    
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def validate_log_level(cls, v):
+        """Resolve level names to their numeric logging level once"""
+        if isinstance(v, str) and not v.strip().isdigit():
+            # getLevelName maps a known name to its int (getLevelNamesMapping is 3.11+ only)
+            level = logging.getLevelName(v.strip().upper())
+            if not isinstance(level, int):
+                raise ValueError(f"Unknown log level: {v}")
+            return level
+        return v
+    
+    @field_validator("TF_IDF_ALPHA", "TF_IDF_BETA", mode="after")
+    @classmethod
     def validate_weights(cls, v):
         if not 0 <= v <= 1:
             raise ValueError("Weights must be between 0 and 1")
         return v
     
-    @property
+    def model_post_init(self, __context) -> None:
+        """Precompute AI service status from the configured keys"""
+        self._has_ai = bool(self.ANTHROPIC_API_KEY or self.GROQ_API_KEY)
+        self._ai_status = {
+            "anthropic_configured": bool(self.ANTHROPIC_API_KEY),
+            "groq_configured": bool(self.GROQ_API_KEY),
+            "openai_configured": bool(self.OPENAI_API_KEY),
+            "ai_features_available": self._has_ai
+        }
+    
+    @cached_property
     def models_path(self) -> Path:
         """Path to models directory"""
         return Path(self.MODELS_DIR)
     
-    @property
+    @cached_property
     def uploads_path(self) -> Path:
         """Path to uploads directory"""
         return Path(self.UPLOADS_DIR)
     
-    @property
+    @cached_property
     def outputs_path(self) -> Path:
         """Path to outputs directory"""
         return Path(self.OUTPUTS_DIR)
@@ -142,27 +203,37 @@ class Settings(BaseSettings):
     
     def has_ai_capabilities(self) -> bool:
         """Check if any AI service is configured"""
-        return bool(self.ANTHROPIC_API_KEY or self.GROQ_API_KEY)
+        return self._has_ai
     
     def get_ai_service_status(self) -> dict:
-        """Get status of AI services configuration"""
-        return {
-            "anthropic_configured": bool(self.ANTHROPIC_API_KEY),
-            "groq_configured": bool(self.GROQ_API_KEY),
-            "openai_configured": bool(self.OPENAI_API_KEY),
-            "ai_features_available": self.has_ai_capabilities()
-        }
+        """Get status of AI services configuration (shared dict; do not modify)"""
+        return self._ai_status
     
     def setup_logging(self):
-        """Configure logging based on settings"""
-        logging.basicConfig(
-            level=getattr(logging, self.LOG_LEVEL.upper()),
-            format=self.LOG_FORMAT,
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(f"{self.OUTPUTS_DIR}/app.log")
-            ]
-        )
+        """Configure logging based on settings.
+        
+        Records are handed to a background listener thread through a queue,
+        so logging callers never block on console or file I/O. Handlers are
+        left alone when the host (uvicorn, gunicorn, ...) already configured
+        the root logger.
+        """
+        global _log_listener
+        
+        root_logger = logging.getLogger()
+        if not root_logger.handlers and _log_listener is None:
+            handlers = [logging.StreamHandler()]
+            if not self.DISABLE_APP_LOG_FILE:
+                handlers.append(logging.FileHandler(f"{self.OUTPUTS_DIR}/app.log", delay=True))
+            
+            log_queue = queue.SimpleQueue()
+            logging.basicConfig(
+                level=self.LOG_LEVEL,
+                format=self.LOG_FORMAT,
+                handlers=[QueueHandler(log_queue)]
+            )
+            _log_listener = QueueListener(log_queue, *handlers)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
         
         # Reduce noise from some libraries
         logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
@@ -173,9 +244,19 @@ class Settings(BaseSettings):
         """
         Validate the current environment setup.
         
+        Results are cached until the models directory changes, so polling
+        the config summary does not rescan it on every call.
+        
         Returns:
             dict: Validation results with status and messages
         """
+        try:
+            models_mtime = os.stat(self.models_path).st_mtime_ns
+        except OSError:
+            models_mtime = None
+        if self._validation_cache is not None and self._validation_cache[0] == models_mtime:
+            return self._validation_cache[1]
+        
         validation_results = {
             "status": "valid",
             "warnings": [],
@@ -195,18 +276,13 @@ class Settings(BaseSettings):
             )
         
         # Check model files
-        required_model_files = [
-            "tfidf_model.pkl",
-            "researcher_vectors.npz", 
-            "conceptual_profiles.npz",
-            "researcher_metadata.parquet",
-            "evidence_index.json"
-        ]
-        
-        missing_files = []
-        for file_name in required_model_files:
-            if not (self.models_path / file_name).exists():
-                missing_files.append(file_name)
+        # One directory listing instead of a stat per file
+        try:
+            with os.scandir(self.models_path) as entries:
+                present_files = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            present_files = set()
+        missing_files = [file_name for file_name in REQUIRED_MODEL_FILES if file_name not in present_files]
         
         if missing_files:
             validation_results["warnings"].append(
@@ -226,6 +302,7 @@ class Settings(BaseSettings):
         elif validation_results["warnings"]:
             validation_results["status"] = "valid_with_warnings"
         
+        self._validation_cache = (models_mtime, validation_results)
         return validation_results
     
     def get_full_config_summary(self) -> dict:
@@ -260,29 +337,33 @@ class Settings(BaseSettings):
         }
 
 
-# Create global settings instance
-settings = Settings()
-
-# Configure logging on import
-settings.setup_logging()
-
-# Create a logger for this module
-logger = logging.getLogger(__name__)
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get the global settings instance.
     
+    Settings are read from the environment once per process, so using this
+    as a FastAPI dependency does not re-parse .env or re-run validators.
+    
     Returns:
         Settings: The configured settings object
     """
-    return settings
+    return Settings()
+
+# Create global settings instance
+settings = get_settings()
+
+# Create a logger for this module
+logger = logging.getLogger(__name__)
 
 def validate_startup_environment():
     """
     Validate environment on application startup.
-    Logs warnings and errors, raises exception if critical issues found.
+    Configures logging, then logs warnings and errors and raises an
+    exception if critical issues are found.
     """
+    settings.setup_logging()
+    
     validation = settings.validate_environment()
     
     logger.info("🔧 Environment Validation Results:")
@@ -0,0 +1,53 @@
+"""
+Shared PostgreSQL connection pool for the database scripts.
+Connections are tagged with an application_name so they are identifiable
+in pg_stat_activity.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from psycopg2.pool import ThreadedConnectionPool
+
+APPLICATION_NAME = 'dashboard-migrate'
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool(database_url=None):
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS,
+                    POOL_MAX_CONNECTIONS,
+                    database_url or os.getenv('DATABASE_URL'),
+                    application_name=APPLICATION_NAME
+                )
+    return _pool
+
+@contextmanager
+def get_conn(database_url=None):
+    """Borrow a pooled connection and return it to the pool afterwards."""
+    pool = get_pool(database_url)
+    connection = pool.getconn()
+    try:
+        yield connection
+    finally:
+        if not connection.closed:
+            # Undo per-script session changes such as autocommit
+            connection.rollback()
+            connection.autocommit = False
+        pool.putconn(connection)
+
+def close_pool():
+    """Close every pooled connection."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
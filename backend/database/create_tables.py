@@ -6,9 +6,13 @@ This script creates all necessary tables, indexes, and constraints.
 
 import os
 import sys
-import psycopg2
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from pgvector.psycopg2 import register_vector
 from dotenv import load_dotenv
+from _pool import close_pool, get_conn
 import logging
 
 # Setup logging
@@ -18,6 +22,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tables the schema must create, in creation order
+EXPECTED_TABLES = (
+    'institutions',
+    'researchers',
+    'works',
+    'topics',
+    'researcher_grants'
+)
+EXPECTED_TABLES_SET = frozenset(EXPECTED_TABLES)
+
 def load_environment():
     """Load environment variables from .env file."""
     load_dotenv()
@@ -27,62 +41,29 @@ def load_environment():
     return database_url
 
 def execute_schema_file(connection, schema_file_path):
-    """Execute SQL commands from schema file."""
+    """Execute SQL commands from schema file.
+    
+    The whole script is sent in one round trip; Postgres splits it (including
+    dollar-quoted function bodies) and runs it as a single implicit transaction.
+    """
     try:
         with open(schema_file_path, 'r') as file:
             schema_sql = file.read()
         
-        cursor = connection.cursor()
+        if not schema_sql.strip():
+            logger.warning(f"Schema file is empty: {schema_file_path}")
+            return
         
-        # Split the schema into individual statements, handling dollar-quoted strings
-        statements = []
-        current_statement = ""
-        in_dollar_quote = False
-        dollar_tag = ""
-        
-        lines = schema_sql.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('--'):
-                continue
-                
-            # Check for dollar-quoted strings
-            if '$' in line and not in_dollar_quote:
-                # Look for dollar quote start
-                import re
-                dollar_match = re.search(r'\$(\w*)\$', line)
-                if dollar_match:
-                    dollar_tag = dollar_match.group(0)
-                    in_dollar_quote = True
-            elif in_dollar_quote and dollar_tag in line:
-                in_dollar_quote = False
-                dollar_tag = ""
-            
-            current_statement += line + '\n'
-            
-            # If we hit a semicolon and we're not in a dollar-quoted string, end the statement
-            if line.endswith(';') and not in_dollar_quote:
-                if current_statement.strip():
-                    statements.append(current_statement.strip())
-                current_statement = ""
-        
-        # Add any remaining statement
-        if current_statement.strip():
-            statements.append(current_statement.strip())
-        
-        for i, statement in enumerate(statements):
+        with connection.cursor() as cursor:
             try:
-                logger.info(f"Executing statement {i+1}/{len(statements)}")
-                cursor.execute(statement)
+                logger.info(f"Executing schema script ({len(schema_sql)} characters)")
+                cursor.execute(schema_sql)
                 connection.commit()
-                logger.debug(f"Successfully executed: {statement[:100]}...")
             except Exception as e:
-                logger.error(f"Error executing statement {i+1}: {e}")
-                logger.error(f"Statement: {statement[:200]}...")
+                logger.error(f"Error executing schema script: {e}")
                 connection.rollback()
                 raise
         
-        cursor.close()
         logger.info("Schema creation completed successfully")
         
     except FileNotFoundError:
@@ -94,14 +75,6 @@ def execute_schema_file(connection, schema_file_path):
 
 def verify_tables(connection):
     """Verify that all expected tables were created."""
-    expected_tables = [
-        'institutions',
-        'researchers', 
-        'works',
-        'topics',
-        'researcher_grants'
-    ]
-    
     cursor = connection.cursor()
     
     # Check if tables exist
@@ -117,7 +90,7 @@ def verify_tables(connection):
     logger.info(f"Found tables: {existing_tables}")
     
     # Verify all expected tables exist
-    missing_tables = set(expected_tables) - set(existing_tables)
+    missing_tables = EXPECTED_TABLES_SET.difference(existing_tables)
     if missing_tables:
         logger.error(f"Missing tables: {missing_tables}")
         return False
@@ -131,15 +104,20 @@ def verify_tables(connection):
     
     logger.info("pg_vector extension is enabled")
     
-    # Verify table structures
-    for table in expected_tables:
-        cursor.execute(f"""
-            SELECT column_name, data_type, is_nullable
-            FROM information_schema.columns 
-            WHERE table_name = '{table}' 
-            ORDER BY ordinal_position;
-        """)
-        columns = cursor.fetchall()
+    # Verify table structures with one query for all tables
+    cursor.execute("""
+        SELECT table_name, column_name, data_type, is_nullable
+        FROM information_schema.columns 
+        WHERE table_schema = 'public' 
+        AND table_name = ANY(%s)
+        ORDER BY table_name, ordinal_position;
+    """, (list(EXPECTED_TABLES),))
+    columns_by_table = {
+        table: [col[1:] for col in columns]
+        for table, columns in groupby(cursor.fetchall(), key=itemgetter(0))
+    }
+    for table in EXPECTED_TABLES:
+        columns = columns_by_table.get(table, [])
         logger.info(f"Table '{table}' has {len(columns)} columns")
         for col in columns:
             logger.debug(f"  {col[0]}: {col[1]} (nullable: {col[2]})")
@@ -149,54 +127,48 @@ def verify_tables(connection):
 
 def test_table_relationships(connection):
     """Test foreign key relationships with sample data."""
+    # Adapt NumPy arrays to the vector type; needs the extension created by the schema
+    register_vector(connection)
     cursor = connection.cursor()
     
     try:
         # Test data insertion to verify relationships
         logger.info("Testing table relationships with sample data...")
         
-        # Insert sample institution
+        # Insert one row per table in a single statement; each CTE feeds the
+        # generated ID of its parent row to the next insert
+        sample_embedding = np.full(384, 0.1, dtype=np.float32)  # Sample 384-dimensional vector
         cursor.execute("""
-            INSERT INTO institutions (openalex_id, name, ror_id) 
-            VALUES ('https://openalex.org/I12345', 'Texas State University', 'https://ror.org/02hpadn98')
-            RETURNING id;
-        """)
-        institution_id = cursor.fetchone()[0]
-        logger.info(f"Created sample institution with ID: {institution_id}")
-        
-        # Insert sample researcher
-        cursor.execute("""
-            INSERT INTO researchers (institution_id, openalex_id, full_name, h_index, department) 
-            VALUES (%s, 'https://openalex.org/A67890', 'Dr. Jane Smith', 25, 'Computer Science')
-            RETURNING id;
-        """, (institution_id,))
-        researcher_id = cursor.fetchone()[0]
-        logger.info(f"Created sample researcher with ID: {researcher_id}")
-        
-        # Insert sample work with embedding
-        sample_embedding = [0.1] * 384  # Sample 384-dimensional vector
-        cursor.execute("""
-            INSERT INTO works (researcher_id, openalex_id, title, abstract, keywords, publication_year, doi, citations, embedding) 
-            VALUES (%s, 'https://openalex.org/W11111', 'Sample Research Paper', 'This is a sample abstract for testing purposes.', 
-                    '["machine learning", "artificial intelligence", "research"]', 2023, '10.1000/sample', 15, %s)
-            RETURNING id;
-        """, (researcher_id, sample_embedding))
-        work_id = cursor.fetchone()[0]
-        logger.info(f"Created sample work with ID: {work_id}")
-        
-        # Insert sample topic
-        cursor.execute("""
-            INSERT INTO topics (work_id, name, type, score) 
-            VALUES (%s, 'Computer Science', 'topic', 0.95);
-        """, (work_id,))
-        logger.info("Created sample topic")
-        
-        # Insert sample grant
-        cursor.execute("""
-            INSERT INTO researcher_grants (researcher_id, award_id, award_year, role, award_amount, award_title) 
-            VALUES (%s, 'NSF-2023-001', 2023, 'Principal Investigator', 500000, 'AI Research Grant');
-        """, (researcher_id,))
-        logger.info("Created sample grant")
+            WITH ins_institution AS (
+                INSERT INTO institutions (openalex_id, name, ror_id) 
+                VALUES ('https://openalex.org/I12345', 'Texas State University', 'https://ror.org/02hpadn98')
+                RETURNING id
+            ), ins_researcher AS (
+                INSERT INTO researchers (institution_id, openalex_id, full_name, h_index, department) 
+                SELECT id, 'https://openalex.org/A67890', 'Dr. Jane Smith', 25, 'Computer Science'
+                FROM ins_institution
+                RETURNING id
+            ), ins_work AS (
+                INSERT INTO works (researcher_id, openalex_id, title, abstract, keywords, publication_year, doi, citations, embedding) 
+                SELECT id, 'https://openalex.org/W11111', 'Sample Research Paper', 'This is a sample abstract for testing purposes.', 
+                       '["machine learning", "artificial intelligence", "research"]', 2023, '10.1000/sample', 15, %s
+                FROM ins_researcher
+                RETURNING id
+            ), ins_topic AS (
+                INSERT INTO topics (work_id, name, type, score) 
+                SELECT id, 'Computer Science', 'topic', 0.95
+                FROM ins_work
+            ), ins_grant AS (
+                INSERT INTO researcher_grants (researcher_id, award_id, award_year, role, award_amount, award_title) 
+                SELECT id, 'NSF-2023-001', 2023, 'Principal Investigator', 500000, 'AI Research Grant'
+                FROM ins_researcher
+            )
+            SELECT ins_institution.id, ins_researcher.id, ins_work.id
+            FROM ins_institution, ins_researcher, ins_work;
+        """, (sample_embedding,))
+        institution_id, researcher_id, work_id = cursor.fetchone()
+        logger.info(f"Created sample institution {institution_id}, researcher {researcher_id} "
+                    f"and work {work_id} with topic and grant")
         
         connection.commit()
         
@@ -219,10 +191,10 @@ def test_table_relationships(connection):
         
         # Test vector similarity query
         cursor.execute("""
-            SELECT title, embedding <-> %s::vector as distance
+            SELECT title, embedding <-> %s as distance
             FROM works 
             WHERE embedding IS NOT NULL
-            ORDER BY embedding <-> %s::vector
+            ORDER BY embedding <-> %s
             LIMIT 1;
         """, (sample_embedding, sample_embedding))
         
@@ -233,12 +205,8 @@ def test_table_relationships(connection):
             logger.error("Vector similarity test failed")
             return False
         
-        # Clean up test data
-        cursor.execute("DELETE FROM researcher_grants WHERE award_id = 'NSF-2023-001';")
-        cursor.execute("DELETE FROM topics WHERE name = 'Computer Science' AND type = 'topic';")
-        cursor.execute("DELETE FROM works WHERE openalex_id = 'https://openalex.org/W11111';")
-        cursor.execute("DELETE FROM researchers WHERE openalex_id = 'https://openalex.org/A67890';")
-        cursor.execute("DELETE FROM institutions WHERE openalex_id = 'https://openalex.org/I12345';")
+        # Clean up test data; foreign keys cascade from the institution
+        cursor.execute("DELETE FROM institutions WHERE id = %s;", (institution_id,))
         connection.commit()
         
         logger.info("Test data cleaned up successfully")
@@ -258,27 +226,27 @@ def main():
         database_url = load_environment()
         logger.info("Environment loaded successfully")
         
-        # Connect to database
-        connection = psycopg2.connect(database_url)
-        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        logger.info("Connected to database successfully")
-        
-        # Get schema file path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        schema_file = os.path.join(script_dir, 'schema.sql')
-        
-        # Execute schema creation
-        execute_schema_file(connection, schema_file)
-        
-        # Verify tables were created
-        if not verify_tables(connection):
-            logger.error("Table verification failed")
-            return False
-        
-        # Test relationships
-        if not test_table_relationships(connection):
-            logger.error("Relationship testing failed")
-            return False
+        # Borrow a pooled connection
+        with get_conn(database_url) as connection:
+            connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            logger.info("Connected to database successfully")
+            
+            # Get schema file path
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            schema_file = os.path.join(script_dir, 'schema.sql')
+            
+            # Execute schema creation
+            execute_schema_file(connection, schema_file)
+            
+            # Verify tables were created
+            if not verify_tables(connection):
+                logger.error("Table verification failed")
+                return False
+            
+            # Test relationships
+            if not test_table_relationships(connection):
+                logger.error("Relationship testing failed")
+                return False
         
         logger.info("Database schema creation and testing completed successfully!")
         return True
@@ -286,11 +254,9 @@ def main():
     except Exception as e:
         logger.error(f"Error in main execution: {e}")
         return False
-    finally:
-        if 'connection' in locals():
-            connection.close()
-            logger.info("Database connection closed")
 
 if __name__ == "__main__":
     success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    close_pool()
+    logger.info("Database connections closed")
+    sys.exit(0 if success else 1)
@@ -4,47 +4,51 @@ Schema verification script to validate database structure.
 """
 
 import os
-import psycopg2
 from dotenv import load_dotenv
+from _pool import close_pool, get_conn
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows transferred per round trip when streaming catalog queries
+FETCH_BATCH_SIZE = 1000
+
+def iter_query(connection, query, name):
+    """Stream the rows of ``query`` through a named server-side cursor in batches."""
+    with connection.cursor(name) as cursor:
+        cursor.itersize = FETCH_BATCH_SIZE
+        cursor.execute(query)
+        for batch in iter(lambda: cursor.fetchmany(FETCH_BATCH_SIZE), []):
+            yield from batch
+
 def verify_schema():
     """Verify the database schema is correctly created."""
     load_dotenv()
     database_url = os.getenv('DATABASE_URL')
     
-    connection = psycopg2.connect(database_url)
-    cursor = connection.cursor()
-    
-    try:
+    with get_conn(database_url) as connection:
         # Check tables
-        cursor.execute("""
+        tables = iter_query(connection, """
             SELECT table_name, 
                    (SELECT COUNT(*) FROM information_schema.columns WHERE table_name = t.table_name) as column_count
             FROM information_schema.tables t
             WHERE table_schema = 'public' 
             AND table_type = 'BASE TABLE'
             ORDER BY table_name;
-        """)
-        
-        tables = cursor.fetchall()
+        """, "verify_tables")
         logger.info("=== DATABASE TABLES ===")
         for table_name, column_count in tables:
             logger.info(f"✓ {table_name}: {column_count} columns")
         
         # Check indexes
-        cursor.execute("""
+        indexes = iter_query(connection, """
             SELECT schemaname, tablename, indexname, indexdef
             FROM pg_indexes 
             WHERE schemaname = 'public'
             AND indexname NOT LIKE '%_pkey'
             ORDER BY tablename, indexname;
-        """)
-        
-        indexes = cursor.fetchall()
+        """, "verify_indexes")
         logger.info("\n=== DATABASE INDEXES ===")
         current_table = None
         for schema, table, index_name, index_def in indexes:
@@ -54,7 +58,7 @@ def verify_schema():
             logger.info(f"  ✓ {index_name}")
         
         # Check foreign keys
-        cursor.execute("""
+        foreign_keys = iter_query(connection, """
             SELECT
                 tc.table_name, 
                 kcu.column_name, 
@@ -70,30 +74,29 @@ def verify_schema():
                   AND ccu.table_schema = tc.table_schema
             WHERE tc.constraint_type = 'FOREIGN KEY'
             ORDER BY tc.table_name;
-        """)
-        
-        foreign_keys = cursor.fetchall()
+        """, "verify_foreign_keys")
         logger.info("\n=== FOREIGN KEY RELATIONSHIPS ===")
         for table, column, ref_table, ref_column in foreign_keys:
             logger.info(f"✓ {table}.{column} → {ref_table}.{ref_column}")
         
         # Check extensions
-        cursor.execute("SELECT extname FROM pg_extension WHERE extname IN ('vector', 'uuid-ossp');")
-        extensions = cursor.fetchall()
+        extensions = iter_query(
+            connection,
+            "SELECT extname FROM pg_extension WHERE extname IN ('vector', 'uuid-ossp');",
+            "verify_extensions"
+        )
         logger.info("\n=== EXTENSIONS ===")
         for ext in extensions:
             logger.info(f"✓ {ext[0]}")
         
         # Check constraints
-        cursor.execute("""
+        constraints = iter_query(connection, """
             SELECT table_name, constraint_name, constraint_type
             FROM information_schema.table_constraints
             WHERE table_schema = 'public'
             AND constraint_type IN ('CHECK', 'UNIQUE')
             ORDER BY table_name, constraint_type;
-        """)
-        
-        constraints = cursor.fetchall()
+        """, "verify_constraints")
         logger.info("\n=== CONSTRAINTS ===")
         current_table = None
         for table, constraint_name, constraint_type in constraints:
@@ -104,10 +107,7 @@ def verify_schema():
         
         logger.info("\n=== SCHEMA VERIFICATION COMPLETE ===")
         logger.info("All database components are properly configured!")
-        
-    finally:
-        cursor.close()
-        connection.close()
 
 if __name__ == "__main__":
-    verify_schema()
\ No newline at end of file
+    verify_schema()
+    close_pool()
\ No newline at end of file
@@ -3,16 +3,43 @@
 Analyze and document the complete database schema and data.
 """
 import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 from dotenv import load_dotenv
+import argparse
 import os
+import sys
 import json
+from itertools import groupby
+from operator import itemgetter
 
 # Load environment variables
 load_dotenv()
 
+# Tables whose first rows are printed, and how many rows
+SAMPLE_TABLES = ('institutions', 'researchers', 'works', 'topics', 'cads_researchers', 'cads_works', 'cads_topics')
+SAMPLE_ROW_COUNT = 3
+# Column types left out of sample rows
+LARGE_COLUMN_TYPES = ('vector', 'tsvector')
+# Longest sample string printed before truncation
+MAX_SAMPLE_VALUE_LENGTH = 100
+REPORT_RULE = "=" * 80
+TABLE_RULE = "-" * 60
+# Column metadata from the last run, reused while the schema is unchanged;
+# the format number is bumped whenever the cached column layout changes
+SCHEMA_CACHE_FORMAT = 2
+SCHEMA_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.schema_cache.json')
+
 def connect_database():
-    """Connect to database using IPv4 pooler."""
+    """Connect to database, preferring the transaction-mode pooler URL."""
+    pooled_url = os.getenv("DATABASE_POOLED_URL")
+    if pooled_url:
+        return psycopg2.connect(
+            pooled_url,
+            connect_timeout=30,
+            sslmode='require'
+        )
+    
     USER = os.getenv("user")
     PASSWORD = os.getenv("password")
     HOST = os.getenv("host")
@@ -26,109 +53,261 @@ def connect_database():
         port=PORT,
         dbname=DBNAME,
         connect_timeout=30,
-        sslmode='require',
-        cursor_factory=RealDictCursor
+        sslmode='require'
     )
 
-def analyze_database():
-    """Analyze the complete database schema and data."""
+def analyze_database(output_format='text'):
+    """Analyze the complete database schema and data and write the report once."""
     conn = connect_database()
     
     try:
         with conn.cursor() as cursor:
-            print("🔍 COMPREHENSIVE DATABASE ANALYSIS")
-            print("="*80)
-            
-            # Get all tables
-            cursor.execute("""
-                SELECT table_name, table_type
-                FROM information_schema.tables 
-                WHERE table_schema = 'public'
-                ORDER BY table_name;
-            """)
-            tables = cursor.fetchall()
-            
-            print(f"\n📋 DATABASE TABLES ({len(tables)} total):")
-            for table in tables:
-                print(f"   {table['table_name']} ({table['table_type']})")
-            
-            # Analyze each table in detail
-            for table in tables:
-                if table['table_type'] == 'BASE TABLE':
-                    analyze_table(cursor, table['table_name'])
-            
-            # Analyze relationships
-            print("\n🔗 TABLE RELATIONSHIPS:")
-            cursor.execute("""
-                SELECT 
-                    tc.table_name,
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table_name,
-                    ccu.column_name AS foreign_column_name
-                FROM information_schema.table_constraints AS tc
-                JOIN information_schema.key_column_usage AS kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage AS ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_schema = 'public'
-                ORDER BY tc.table_name, kcu.column_name;
-            """)
-            
-            relationships = cursor.fetchall()
-            for rel in relationships:
-                print(f"   {rel['table_name']}.{rel['column_name']} -> {rel['foreign_table_name']}.{rel['foreign_column_name']}")
-            
+            report = build_report(cursor)
     finally:
         conn.close()
+    
+    if output_format == 'json':
+        sys.stdout.write(json.dumps(report, indent=2, default=str) + "\n")
+    else:
+        sys.stdout.write(render_text_report(report))
+
+def build_report(cursor):
+    """Collect tables, columns, row counts, samples and relationships into one dict."""
+    # Table list, row statistics and foreign keys arrive in one round trip
+    overview = fetch_overview(cursor)
+    table_metadata = fetch_table_metadata(cursor, overview)
+    
+    tables = {}
+    for table in overview['tables']:
+        if table['table_type'] != 'BASE TABLE':
+            continue
+        table_name = table['table_name']
+        metadata = table_metadata.get(table_name) or {'columns': [], 'row_count': 0}
+        tables[table_name] = {
+            'columns': [
+                {'name': column_name, 'type': data_type, 'nullable': not not_null, 'default': column_default}
+                for column_name, data_type, not_null, column_default in metadata['columns']
+            ],
+            'row_count_estimate': metadata['row_count'],
+            'samples': fetch_samples(cursor, table_name, metadata['columns']) if table_name in SAMPLE_TABLES else []
+        }
+    
+    return {
+        'table_list': overview['tables'],
+        'tables': tables,
+        'relationships': overview['relationships']
+    }
+
+def load_cached_columns(schema_version):
+    """Return cached column metadata if it was stored for ``schema_version``."""
+    try:
+        with open(SCHEMA_CACHE_PATH) as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if cache.get('format') != SCHEMA_CACHE_FORMAT or cache.get('schema_version') != schema_version:
+        return None
+    return cache['columns']
+
+def save_cached_columns(schema_version, columns_by_table):
+    """Store column metadata for ``schema_version``; caching is best effort."""
+    try:
+        with open(SCHEMA_CACHE_PATH, 'w') as cache_file:
+            json.dump({'format': SCHEMA_CACHE_FORMAT, 'schema_version': schema_version,
+                       'columns': columns_by_table}, cache_file)
+    except OSError as e:
+        print(f"⚠️ Could not write schema cache: {e}", file=sys.stderr)
+
+def fetch_table_columns(cursor):
+    """Fetch ``[name, type, not_null, default]`` for every public table's columns in one query."""
+    cursor.execute("""
+        SELECT
+            c.relname AS table_name,
+            a.attname AS column_name,
+            format_type(a.atttypid, a.atttypmod) AS data_type,
+            a.attnotnull AS not_null,
+            pg_get_expr(d.adbin, d.adrelid) AS column_default
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid
+        LEFT JOIN pg_catalog.pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+        WHERE n.nspname = 'public'
+            AND c.relkind = 'r'
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+        ORDER BY c.relname, a.attnum;
+    """)
+    
+    # Plain tuple rows: each column is kept as [name, type, not_null, default]
+    return {
+        table_name: [list(row[1:]) for row in rows]
+        for table_name, rows in groupby(cursor.fetchall(), key=itemgetter(0))
+    }
 
-def analyze_table(cursor, table_name):
-    """Analyze a specific table in detail."""
-    print(f"\n📊 TABLE: {table_name.upper()}")
-    print("-" * 60)
+def fetch_overview(cursor):
+    """Fetch the table list, row statistics, schema version and foreign keys in one query.
     
-    # Get column information
+    Each independent introspection query is a JSON-aggregated subselect of a
+    single statement, so they cost one round trip instead of one each.
+    Row counts come from the planner statistics (live tuples, falling back to
+    reltuples) instead of a COUNT(*) scan per table. The schema version is
+    derived from the public schema's pg_class, pg_attribute and pg_attrdef
+    rows, so it changes on table and column DDL alike.
+    """
     cursor.execute("""
-        SELECT 
-            column_name,
-            data_type,
-            is_nullable,
-            column_default,
-            character_maximum_length
-        FROM information_schema.columns
-        WHERE table_name = %s
-        ORDER BY ordinal_position;
-    """, (table_name,))
+        SELECT
+            (
+                SELECT COALESCE(json_agg(t ORDER BY t.table_name), '[]')
+                FROM (
+                    SELECT table_name, table_type
+                    FROM information_schema.tables
+                    WHERE table_schema = 'public'
+                ) t
+            ) AS tables,
+            (
+                SELECT COALESCE(json_agg(s), '[]')
+                FROM (
+                    SELECT
+                        c.relname AS table_name,
+                        COALESCE(st.n_live_tup, GREATEST(c.reltuples, 0)::bigint) AS row_count
+                    FROM pg_catalog.pg_class c
+                    LEFT JOIN pg_catalog.pg_stat_user_tables st ON st.relid = c.oid
+                    WHERE c.relnamespace = 'public'::regnamespace
+                        AND c.relkind = 'r'
+                ) s
+            ) AS table_stats,
+            (
+                SELECT current_database() || ':' || count(*) || ':' || max(oid::bigint) || ':' || max(xmin::text::bigint)
+                FROM pg_catalog.pg_class
+                WHERE relnamespace = 'public'::regnamespace
+            ) || ':' || (
+                -- Column-level DDL (nullability, defaults, dropped columns) leaves pg_class untouched
+                SELECT count(*) || ':' || COALESCE(max(a.xmin::text::bigint), 0)
+                FROM pg_catalog.pg_attribute a
+                JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                WHERE c.relnamespace = 'public'::regnamespace
+            ) || ':' || (
+                SELECT count(*) || ':' || COALESCE(max(d.xmin::text::bigint), 0)
+                FROM pg_catalog.pg_attrdef d
+                JOIN pg_catalog.pg_class c ON c.oid = d.adrelid
+                WHERE c.relnamespace = 'public'::regnamespace
+            ) AS schema_version,
+            (
+                SELECT COALESCE(json_agg(r ORDER BY r.table_name, r.column_name), '[]')
+                FROM (
+                    SELECT 
+                        tc.table_name,
+                        kcu.column_name,
+                        ccu.table_name AS foreign_table_name,
+                        ccu.column_name AS foreign_column_name
+                    FROM information_schema.table_constraints AS tc
+                    JOIN information_schema.key_column_usage AS kcu
+                        ON tc.constraint_name = kcu.constraint_name
+                        AND tc.table_schema = kcu.table_schema
+                    JOIN information_schema.constraint_column_usage AS ccu
+                        ON ccu.constraint_name = tc.constraint_name
+                        AND ccu.table_schema = tc.table_schema
+                    WHERE tc.constraint_type = 'FOREIGN KEY'
+                        AND tc.table_schema = 'public'
+                ) r
+            ) AS relationships;
+    """)
+    tables, table_stats, schema_version, relationships = cursor.fetchone()
+    return {
+        'tables': tables,
+        'table_stats': table_stats,
+        'schema_version': schema_version,
+        'relationships': relationships
+    }
+
+def fetch_table_metadata(cursor, overview):
+    """Combine row statistics from ``overview`` with column definitions.
+    
+    Column definitions are cached in SCHEMA_CACHE_PATH and only re-queried
+    when the schema version changes.
+    """
+    table_stats = overview['table_stats']
+    if not table_stats:
+        return {}
     
-    columns = cursor.fetchall()
+    schema_version = overview['schema_version']
+    columns_by_table = load_cached_columns(schema_version)
+    if columns_by_table is None:
+        columns_by_table = fetch_table_columns(cursor)
+        save_cached_columns(schema_version, columns_by_table)
+    
+    return {
+        stats['table_name']: {
+            'columns': columns_by_table.get(stats['table_name'], []),
+            'row_count': stats['row_count']
+        }
+        for stats in table_stats
+    }
+
+def truncate_value(value):
+    """Shorten long strings for sample output."""
+    if isinstance(value, str) and len(value) > MAX_SAMPLE_VALUE_LENGTH:
+        return value[:MAX_SAMPLE_VALUE_LENGTH] + "..."
+    return value
+
+def fetch_samples(cursor, table_name, columns):
+    """Fetch the first SAMPLE_ROW_COUNT rows of a table as dicts."""
+    # Leave out embedding and search-vector columns, which are large and unreadable when printed
+    sample_columns = [
+        column_name for column_name, data_type, _, _ in columns
+        if not data_type.startswith(LARGE_COLUMN_TYPES)
+    ]
+    query = sql.SQL("SELECT {} FROM {} LIMIT %s;").format(
+        sql.SQL(", ").join(map(sql.Identifier, sample_columns)) if sample_columns else sql.SQL("*"),
+        sql.Identifier(table_name)
+    )
     
-    print("Columns:")
-    for col in columns:
-        nullable = "NULL" if col['is_nullable'] == 'YES' else "NOT NULL"
-        default = f" DEFAULT {col['column_default']}" if col['column_default'] else ""
-        length = f"({col['character_maximum_length']})" if col['character_maximum_length'] else ""
-        print(f"   {col['column_name']}: {col['data_type']}{length} {nullable}{default}")
+    # Named cursor: rows stay on the server until fetched
+    with cursor.connection.cursor(name=f"sample_{table_name}", cursor_factory=RealDictCursor) as sample_cursor:
+        sample_cursor.itersize = SAMPLE_ROW_COUNT
+        sample_cursor.execute(query, (SAMPLE_ROW_COUNT,))
+        return [dict(row) for row in sample_cursor.fetchmany(SAMPLE_ROW_COUNT)]
+
+def render_text_report(report):
+    """Render the report as the human-readable text listing."""
+    lines = [f"🔍 COMPREHENSIVE DATABASE ANALYSIS\n{REPORT_RULE}"]
     
-    # Get row count
-    cursor.execute(f"SELECT COUNT(*) as count FROM {table_name};")
-    count = cursor.fetchone()['count']
-    print(f"Row Count: {count:,}")
+    table_list = report['table_list']
+    lines.append(f"\n📋 DATABASE TABLES ({len(table_list)} total):")
+    lines.extend(f"   {table['table_name']} ({table['table_type']})" for table in table_list)
     
-    # Get sample data for key tables
-    if table_name in ['institutions', 'researchers', 'works', 'topics', 'cads_researchers', 'cads_works', 'cads_topics']:
-        cursor.execute(f"SELECT * FROM {table_name} LIMIT 3;")
-        samples = cursor.fetchall()
+    for table_name, table in report['tables'].items():
+        lines.append(f"\n📊 TABLE: {table_name.upper()}\n{TABLE_RULE}")
+        lines.append("Columns:")
+        for column in table['columns']:
+            nullable = "NULL" if column['nullable'] else "NOT NULL"
+            default = f" DEFAULT {column['default']}" if column['default'] else ""
+            lines.append(f"   {column['name']}: {column['type']} {nullable}{default}")
+        lines.append(f"Row Count (estimated): {table['row_count_estimate']:,}")
         
-        if samples:
-            print("Sample Data:")
-            for i, sample in enumerate(samples, 1):
-                print(f"   Sample {i}:")
-                for key, value in sample.items():
-                    if isinstance(value, str) and len(value) > 100:
-                        value = value[:100] + "..."
-                    print(f"      {key}: {value}")
+        if table['samples']:
+            lines.append("Sample Data:")
+            for i, sample in enumerate(table['samples'], 1):
+                lines.append(f"   Sample {i}:")
+                lines.extend(f"      {key}: {truncate_value(value)}" for key, value in sample.items())
+    
+    lines.append("\n🔗 TABLE RELATIONSHIPS:")
+    lines.extend(
+        f"   {rel['table_name']}.{rel['column_name']} -> {rel['foreign_table_name']}.{rel['foreign_column_name']}"
+        for rel in report['relationships']
+    )
+    return "\n".join(lines) + "\n"
+
+def parse_args(argv=None):
+    """Parse the output format."""
+    parser = argparse.ArgumentParser(description="Analyze the database schema and data.")
+    parser.add_argument(
+        '--format',
+        choices=['text', 'json'],
+        default='text',
+        help="text for the readable report (default), json for machine consumption"
+    )
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    analyze_database()
\ No newline at end of file
+    analyze_database(parse_args().format)
@@ -23,13 +23,17 @@ def clear_database():
     try:
         print("Clearing database tables...")
         
-        # Clear tables in reverse dependency order
         tables = ['topics', 'researcher_grants', 'works', 'researchers', 'institutions']
         
-        for table in tables:
-            result = db_manager.execute_query(f"DELETE FROM {table};")
-            count_result = db_manager.execute_query(f"SELECT COUNT(*) as count FROM {table};", fetch=True)
-            print(f"  Cleared {table}: {count_result[0]['count']} rows remaining")
+        # One TRUNCATE empties every table (and, like the previous cascading
+        # DELETEs, any table referencing them) without per-row dead tuples
+        db_manager.execute_query(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE;")
+        
+        count_query = " UNION ALL ".join(
+            f"SELECT '{table}' AS table_name, COUNT(*) AS count FROM {table}" for table in tables
+        )
+        for row in db_manager.execute_query(count_query + ";", fetch=True):
+            print(f"  Cleared {row['table_name']}: {row['count']} rows remaining")
         
         print("✅ Database cleared successfully!")
         
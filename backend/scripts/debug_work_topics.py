@@ -20,13 +20,17 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Repeated runs reuse OpenAlex responses cached on disk
+OPENALEX_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.openalex_cache')
+
 
 def debug_work_structure():
     """Debug the structure of work data from OpenAlex."""
     
     # Initialize client
     email = os.getenv('OPENALEX_EMAIL', 'test@example.com')
-    client = OpenAlexClient(email=email, rate_limit_delay=0.1)
+    client = OpenAlexClient(email=email, rate_limit_delay=0.1,
+                            cache_path=OPENALEX_CACHE_PATH)
     
     try:
         # Search for Texas State University
@@ -24,6 +24,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Repeated runs reuse OpenAlex responses cached on disk
+OPENALEX_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.openalex_cache')
+
 
 def demonstrate_openalex_integration():
     """Demonstrate the complete OpenAlex API integration."""
@@ -32,7 +35,8 @@ def demonstrate_openalex_integration():
     print("=" * 60)
     
     # Initialize client
-    client = OpenAlexClient(email="demo@texasstate.edu", rate_limit_delay=0.1)
+    client = OpenAlexClient(email="demo@texasstate.edu", rate_limit_delay=0.1,
+                            cache_path=OPENALEX_CACHE_PATH)
     print("✅ OpenAlex client initialized with rate limiting and error handling")
     
     # 1. Search for Texas State University
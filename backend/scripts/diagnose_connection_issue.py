@@ -2,14 +2,26 @@
 """
 Comprehensive diagnostic script to identify Supabase connection issues.
 """
+import argparse
 import os
 import sys
 import socket
+import ssl
+import struct
 import subprocess
 import platform
-from dotenv import load_dotenv
+from functools import lru_cache
+from urllib.parse import unquote, urlsplit
+from concurrent.futures import ThreadPoolExecutor
 
-load_dotenv()
+# Probes are I/O-bound (subprocesses, sockets), so run them side by side
+MAX_PROBE_WORKERS = 16
+# Database host under diagnosis
+SUPABASE_HOSTNAME = "db.zsezliiffdcgqekwggjq.supabase.co"
+# Postgres SSLRequest message: length 8, request code 80877103
+PG_SSL_REQUEST = struct.pack("!ii", 8, 80877103)
+# Public DNS server whose TCP port 53 answers from any network with internet access
+PUBLIC_TCP_PROBE = ("8.8.8.8", 53)
 
 def print_section(title):
     """Print a section header."""
@@ -27,33 +39,102 @@ def run_command(cmd):
     except Exception as e:
         return False, "", str(e)
 
+@lru_cache(maxsize=8)
+def resolve(hostname, port):
+    """Resolve TCP addresses for hostname:port once per run, so every section sees the same list."""
+    return tuple(socket.getaddrinfo(hostname, port, socket.AF_UNSPEC, socket.SOCK_STREAM))
+
+def resolve_ipv4(hostname, port):
+    """Return the first IPv4 address for hostname:port, or None if there is none."""
+    try:
+        addresses = resolve(hostname, port)
+    except OSError:
+        return None
+    return next((sockaddr[0] for family, _, _, _, sockaddr in addresses if family == socket.AF_INET), None)
+
+def run_commands(cmds):
+    """Run independent system commands concurrently; results keep the input order."""
+    with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, len(cmds))) as executor:
+        return list(executor.map(run_command, cmds))
+
+def try_socket_connect(address):
+    """Attempt a TCP connection to one getaddrinfo result; return (error code, exception)."""
+    family, type_, proto, canonname, sockaddr = address
+    try:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(10)
+        result = sock.connect_ex(sockaddr)
+        sock.close()
+        return result, None
+    except Exception as e:
+        return None, e
+
+def probe_tcp(address, timeout=2):
+    """Open and close one TCP connection; return (success, error message)."""
+    try:
+        with socket.create_connection(address, timeout=timeout):
+            return True, ""
+    except OSError as e:
+        return False, str(e)
+
+def probe_dns(hostname):
+    """Resolve a hostname with the system resolver; return (success, error message)."""
+    try:
+        socket.getaddrinfo(hostname, None)
+        return True, ""
+    except OSError as e:
+        return False, str(e)
+
+def probe_postgres_tls(hostname, port=5432, timeout=3):
+    """Negotiate TLS with a Postgres server without authenticating.
+    
+    Postgres expects an SSLRequest before the TLS handshake; a server willing
+    to use TLS answers with a single 'S'. Returns (success, detail).
+    """
+    try:
+        with socket.create_connection((hostname, port), timeout=timeout) as sock:
+            sock.sendall(PG_SSL_REQUEST)
+            answer = sock.recv(1)
+            if answer != b'S':
+                return False, f"server declined TLS (answer {answer!r})"
+            context = ssl.create_default_context()
+            with context.wrap_socket(sock, server_hostname=hostname) as tls_sock:
+                return True, tls_sock.version()
+    except (OSError, ssl.SSLError) as e:
+        return False, str(e)
+
 def test_basic_connectivity():
     """Test basic network connectivity."""
     print_section("Basic Network Connectivity")
     
+    # In-process probes: one TCP handshake to a public DNS server and one
+    # resolver lookup, instead of forking ping/nslookup
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        internet = executor.submit(probe_tcp, PUBLIC_TCP_PROBE)
+        dns = executor.submit(probe_dns, "google.com")
+        (internet_ok, internet_err), (dns_ok, dns_err) = internet.result(), dns.result()
+    
     # Test internet connectivity
-    print("1. Testing basic internet connectivity...")
-    success, stdout, stderr = run_command("ping -c 3 8.8.8.8")
-    if success:
+    print(f"1. Testing basic internet connectivity (TCP {PUBLIC_TCP_PROBE[0]}:{PUBLIC_TCP_PROBE[1]})...")
+    if internet_ok:
         print("   ✅ Internet connectivity: OK")
     else:
         print("   ❌ Internet connectivity: FAILED")
-        print(f"   Error: {stderr}")
+        print(f"   Error: {internet_err}")
     
     # Test DNS resolution to known good host
     print("\n2. Testing DNS resolution to google.com...")
-    success, stdout, stderr = run_command("nslookup google.com")
-    if success:
+    if dns_ok:
         print("   ✅ DNS resolution: OK")
     else:
         print("   ❌ DNS resolution: FAILED")
-        print(f"   Error: {stderr}")
+        print(f"   Error: {dns_err}")
 
 def test_supabase_hostname():
     """Test Supabase hostname resolution."""
     print_section("Supabase Hostname Resolution")
     
-    hostname = "db.zsezliiffdcgqekwggjq.supabase.co"
+    hostname = SUPABASE_HOSTNAME
     
     # Test with different DNS tools
     dns_commands = [
@@ -63,9 +144,9 @@ def test_supabase_hostname():
         ("ping", f"ping -c 1 {hostname}"),
     ]
     
-    for tool, cmd in dns_commands:
+    results = run_commands([cmd for _, cmd in dns_commands])
+    for (tool, cmd), (success, stdout, stderr) in zip(dns_commands, results):
         print(f"\n{tool.upper()} test:")
-        success, stdout, stderr = run_command(cmd)
         if success:
             print(f"   ✅ {tool}: SUCCESS")
             if stdout:
@@ -83,7 +164,7 @@ def test_python_dns():
     """Test Python's DNS resolution capabilities."""
     print_section("Python DNS Resolution")
     
-    hostname = "db.zsezliiffdcgqekwggjq.supabase.co"
+    hostname = SUPABASE_HOSTNAME
     
     # Test Python's socket.gethostbyname
     print("1. Testing Python socket.gethostbyname()...")
@@ -96,7 +177,7 @@ def test_python_dns():
     # Test Python's socket.getaddrinfo
     print("\n2. Testing Python socket.getaddrinfo()...")
     try:
-        results = socket.getaddrinfo(hostname, 5432, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        results = resolve(hostname, 5432)
         print(f"   ✅ getaddrinfo found {len(results)} addresses:")
         for i, (family, type_, proto, canonname, sockaddr) in enumerate(results[:3]):
             family_name = "IPv4" if family == socket.AF_INET else "IPv6" if family == socket.AF_INET6 else f"Family-{family}"
@@ -108,30 +189,27 @@ def test_python_socket_connection():
     """Test Python socket connection."""
     print_section("Python Socket Connection")
     
-    hostname = "db.zsezliiffdcgqekwggjq.supabase.co"
+    hostname = SUPABASE_HOSTNAME
     port = 5432
     
     # Try to get addresses first
     try:
-        addresses = socket.getaddrinfo(hostname, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        addresses = resolve(hostname, port)
         print(f"Found {len(addresses)} addresses to try...")
         
-        for i, (family, type_, proto, canonname, sockaddr) in enumerate(addresses):
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_PROBE_WORKERS, len(addresses)))) as executor:
+            outcomes = list(executor.map(try_socket_connect, addresses))
+        
+        for i, ((family, type_, proto, canonname, sockaddr), (result, error)) in enumerate(zip(addresses, outcomes)):
             family_name = "IPv4" if family == socket.AF_INET else "IPv6" if family == socket.AF_INET6 else f"Family-{family}"
             print(f"\n{i+1}. Testing {family_name} connection to {sockaddr[0]}:{sockaddr[1]}...")
             
-            try:
-                sock = socket.socket(family, socket.SOCK_STREAM)
-                sock.settimeout(10)
-                result = sock.connect_ex(sockaddr)
-                sock.close()
-                
-                if result == 0:
-                    print(f"   ✅ {family_name} socket connection: SUCCESS")
-                else:
-                    print(f"   ❌ {family_name} socket connection failed: Error code {result}")
-            except Exception as e:
-                print(f"   ❌ {family_name} socket connection failed: {e}")
+            if error is not None:
+                print(f"   ❌ {family_name} socket connection failed: {error}")
+            elif result == 0:
+                print(f"   ✅ {family_name} socket connection: SUCCESS")
+            else:
+                print(f"   ❌ {family_name} socket connection failed: Error code {result}")
                 
     except Exception as e:
         print(f"❌ Could not resolve addresses: {e}")
@@ -144,26 +222,42 @@ def test_psycopg2_connection():
         import psycopg2
         print("✅ psycopg2 module available")
         
-        database_url = os.getenv('DATABASE_URL')
+        # Only this section reads the environment, so .env is loaded here
+        from dotenv import load_dotenv
+        load_dotenv()
+        
+        url_name = 'DATABASE_POOLED_URL' if os.getenv('DATABASE_POOLED_URL') else 'DATABASE_URL'
+        database_url = os.getenv(url_name)
         if not database_url:
             print("❌ DATABASE_URL not found in environment")
             return
         
-        print(f"📋 DATABASE_URL: {database_url[:50]}...")
+        print(f"📋 {url_name}: {database_url[:50]}...")
         
-        # Parse URL
-        import re
-        match = re.match(r'postgresql://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)', database_url)
-        if match:
-            username, password, host, port, database = match.groups()
+        # Parse URL (credentials may be percent-encoded)
+        url = urlsplit(database_url)
+        try:
+            port = url.port or 5432
+        except ValueError:
+            port = None
+        if url.scheme in ('postgres', 'postgresql') and url.hostname and port:
+            host, database = url.hostname, url.path.lstrip('/')
+            username, password = unquote(url.username or ''), unquote(url.password or '')
             print(f"📋 Parsed - Host: {host}, Port: {port}, DB: {database}, User: {username}")
             
+            # Pin libpq to an IPv4 address so it cannot pick an unroutable IPv6 one;
+            # host is still sent for TLS verification
+            ipv4 = resolve_ipv4(host, port)
+            connect_kwargs = {'hostaddr': ipv4} if ipv4 else {}
+            print(f"📋 Using IPv4 address: {ipv4}" if ipv4 else "📋 No IPv4 address found, letting libpq resolve")
+            
             # Try connection with detailed error reporting
             print("\nAttempting psycopg2 connection...")
             try:
                 conn = psycopg2.connect(
                     host=host,
                     port=port,
+                    **connect_kwargs,
                     database=database,
                     user=username,
                     password=password,
@@ -231,36 +325,51 @@ def test_alternative_connections():
     except Exception as e:
         print(f"   ❌ HTTPS to supabase.com failed: {e}")
     
-    # Test if we can reach other PostgreSQL servers
-    print("\n2. Testing connection to public PostgreSQL server...")
-    try:
-        import psycopg2
-        # Try connecting to a public test database
-        conn = psycopg2.connect(
-            host="postgres.crcind.com",
-            port=5432,
-            database="crcind",
-            user="postgres",
-            password="",
-            connect_timeout=5
-        )
-        print("   ✅ Connection to public PostgreSQL: SUCCESS")
-        conn.close()
-    except Exception as e:
-        print(f"   ❌ Connection to public PostgreSQL failed: {e}")
+    # Test TLS negotiation with the database itself
+    print(f"\n2. Testing Postgres TLS handshake with {SUPABASE_HOSTNAME}...")
+    success, detail = probe_postgres_tls(SUPABASE_HOSTNAME)
+    if success:
+        print(f"   ✅ Postgres TLS handshake: SUCCESS ({detail})")
+    else:
+        print(f"   ❌ Postgres TLS handshake failed: {detail}")
 
-def main():
-    """Run all diagnostic tests."""
+# Diagnostic sections selectable with --section, in the order they run
+SECTIONS = {
+    'basic': [test_basic_connectivity],
+    'dns': [test_supabase_hostname, test_python_dns],
+    'socket': [test_python_socket_connection],
+    'psycopg2': [test_psycopg2_connection],
+    'net': [test_network_configuration],
+    'alt': [test_alternative_connections],
+}
+
+def parse_args(argv=None):
+    """Parse which diagnostic sections to run."""
+    parser = argparse.ArgumentParser(description="Diagnose Supabase connection issues.")
+    parser.add_argument(
+        '--section',
+        action='append',
+        choices=[*SECTIONS, 'all'],
+        help="Section to run (repeatable); runs every section by default"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the selected diagnostic tests."""
+    args = parse_args(argv)
+    selected = args.section or ['all']
+    if 'all' in selected:
+        selected = list(SECTIONS)
+    
     print("🚀 Supabase Connection Diagnostic Tool")
     print("This will help identify why Python can't connect to Supabase")
     
-    test_basic_connectivity()
-    test_supabase_hostname()
-    test_python_dns()
-    test_python_socket_connection()
-    test_psycopg2_connection()
-    test_network_configuration()
-    test_alternative_connections()
+    # Heavy imports (psycopg2, requests, dotenv) happen inside their sections,
+    # so a spot check like --section dns never loads them
+    for name in SECTIONS:
+        if name in selected:
+            for test in SECTIONS[name]:
+                test()
     
     print_section("Summary & Recommendations")
     print("📋 Diagnostic complete. Review the results above to identify the issue.")
@@ -271,4 +380,4 @@ def main():
     print("   4. If IPv6 issues: Try forcing IPv4 or configuring IPv6 properly")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
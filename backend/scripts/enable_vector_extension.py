@@ -19,8 +19,8 @@ def enable_vector_extension():
     print("=== Enabling Vector Extension in Supabase ===\n")
     
     try:
-        # Initialize DatabaseManager
-        db_manager = DatabaseManager()
+        # Initialize DatabaseManager (pooled URL if configured, else DATABASE_URL)
+        db_manager = DatabaseManager(database_url=os.getenv('DATABASE_POOLED_URL'))
         db_manager.connect()
         print("✓ Connected to database successfully\n")
         
@@ -10,6 +10,7 @@ import argparse
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -21,6 +22,8 @@ class TestRunner:
         self.base_dir = Path(__file__).parent.parent
         self.test_dir = self.base_dir / "tests"
         self.coverage_dir = self.base_dir / "htmlcov"
+        # Leave two cores free for the OS and the database the tests talk to
+        self.workers = max(1, (os.cpu_count() or 2) - 2)
         
     def setup_environment(self):
         """Set up test environment."""
@@ -61,9 +64,14 @@ class TestRunner:
             print(f"Error running command: {e}")
             sys.exit(1)
     
+    def _pytest_base(self) -> List[str]:
+        """Base pytest command, fanned out across workers by pytest-xdist."""
+        # loadfile keeps each module on one worker so module-scoped fixtures are built once
+        return ["python", "-m", "pytest", "tests/", "-n", str(self.workers), "--dist=loadfile"]
+    
     def run_unit_tests(self, verbose: bool = True) -> bool:
         """Run unit tests."""
-        cmd = ["python", "-m", "pytest", "tests/", "-m", "unit"]
+        cmd = self._pytest_base() + ["-m", "unit"]
         if verbose:
             cmd.append("-v")
         
@@ -72,7 +80,7 @@ class TestRunner:
     
     def run_integration_tests(self, verbose: bool = True) -> bool:
         """Run integration tests."""
-        cmd = ["python", "-m", "pytest", "tests/", "-m", "integration"]
+        cmd = self._pytest_base() + ["-m", "integration"]
         if verbose:
             cmd.append("-v")
         
@@ -81,7 +89,7 @@ class TestRunner:
     
     def run_e2e_tests(self, verbose: bool = True) -> bool:
         """Run end-to-end tests."""
-        cmd = ["python", "-m", "pytest", "tests/", "-m", "e2e"]
+        cmd = self._pytest_base() + ["-m", "e2e"]
         if verbose:
             cmd.append("-v")
         
@@ -89,7 +97,7 @@ class TestRunner:
         return result.returncode == 0
     
     def run_performance_tests(self, verbose: bool = True) -> bool:
-        """Run performance tests."""
+        """Run performance tests serially so timings do not contend for cores."""
         cmd = ["python", "-m", "pytest", "tests/", "-m", "performance", "--tb=short"]
         if verbose:
             cmd.append("-v")
@@ -99,7 +107,7 @@ class TestRunner:
     
     def run_all_tests(self, verbose: bool = True) -> bool:
         """Run all tests."""
-        cmd = ["python", "-m", "pytest", "tests/"]
+        cmd = self._pytest_base()
         if verbose:
             cmd.append("-v")
         
@@ -108,8 +116,8 @@ class TestRunner:
     
     def run_tests_with_coverage(self, verbose: bool = True) -> bool:
         """Run tests with coverage reporting."""
-        cmd = [
-            "python", "-m", "pytest", "tests/",
+        # pytest-cov combines the per-worker data files itself
+        cmd = self._pytest_base() + [
             "--cov=app",
             "--cov-report=html",
             "--cov-report=term-missing",
@@ -129,7 +137,17 @@ class TestRunner:
     
     def run_fast_tests(self, verbose: bool = True) -> bool:
         """Run fast tests (excluding slow tests)."""
-        cmd = ["python", "-m", "pytest", "tests/", "-m", "not slow"]
+        cmd = self._pytest_base() + ["-m", "not slow"]
+        if verbose:
+            cmd.append("-v")
+        
+        result = self.run_command(cmd)
+        return result.returncode == 0
+    
+    def run_changed_tests(self, verbose: bool = True) -> bool:
+        """Re-run last failures first, stopping at the first one still failing."""
+        # Serial on purpose: a handful of failures does not pay for starting xdist workers
+        cmd = ["python", "-m", "pytest", "tests/", "--lf", "--ff", "-x"]
         if verbose:
             cmd.append("-v")
         
@@ -140,28 +158,26 @@ class TestRunner:
         """Run code linting checks."""
         print("Running linting checks...")
         
-        # Run black check
-        result = self.run_command(["black", "--check", "--diff", "app/", "tests/"])
-        if result.returncode != 0:
-            print("Black formatting check failed")
-            return False
-        
-        # Run isort check
-        result = self.run_command(["isort", "--check-only", "--diff", "app/", "tests/"])
-        if result.returncode != 0:
-            print("isort import sorting check failed")
-            return False
+        # The checks are independent, so run them side by side and report in a fixed order
+        checks = [
+            (["black", "--check", "--diff", "app/", "tests/"], "Black formatting check failed"),
+            (["isort", "--check-only", "--diff", "app/", "tests/"], "isort import sorting check failed"),
+            (["flake8", "app/", "tests/"], "flake8 linting check failed"),
+            (["mypy", "app/", "--ignore-missing-imports"], "mypy type checking failed"),
+        ]
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(lambda check: self.run_command(check[0], capture_output=True), checks))
         
-        # Run flake8
-        result = self.run_command(["flake8", "app/", "tests/"])
-        if result.returncode != 0:
-            print("flake8 linting check failed")
-            return False
+        # Output was captured per tool so it is printed whole rather than interleaved
+        passed = True
+        for (_, failure_message), result in zip(checks, results):
+            sys.stdout.write(result.stdout)
+            sys.stderr.write(result.stderr)
+            if result.returncode != 0:
+                print(failure_message)
+                passed = False
         
-        # Run mypy
-        result = self.run_command(["mypy", "app/", "--ignore-missing-imports"])
-        if result.returncode != 0:
-            print("mypy type checking failed")
+        if not passed:
             return False
         
         print("All linting checks passed!")
@@ -184,13 +200,12 @@ class TestRunner:
         print("Security checks completed. Check bandit-report.json and safety-report.json for details.")
         return True
     
-    def cleanup(self):
-        """Clean up test artifacts."""
+    def cleanup(self, deep: bool = False):
+        """Clean up test artifacts; ``deep`` also drops the pytest cache."""
         print("Cleaning up test artifacts...")
         
         cleanup_paths = [
             self.base_dir / "htmlcov",
-            self.base_dir / ".pytest_cache",
             self.base_dir / "coverage.xml",
             self.base_dir / "pytest-report.xml",
             self.base_dir / "bandit-report.json",
@@ -199,6 +214,9 @@ class TestRunner:
             self.base_dir / "test_models",
             self.base_dir / "test_outputs"
         ]
+        # The cache holds last-failed state for the changed mode, so keep it unless asked
+        if deep:
+            cleanup_paths.append(self.base_dir / ".pytest_cache")
         
         for path in cleanup_paths:
             if path.exists():
@@ -222,7 +240,7 @@ def main():
     
     parser.add_argument(
         "test_type",
-        choices=["unit", "integration", "e2e", "performance", "all", "coverage", "fast", "lint", "security", "cleanup"],
+        choices=["unit", "integration", "e2e", "performance", "all", "coverage", "fast", "changed", "lint", "security", "cleanup"],
         help="Type of tests to run"
     )
     
@@ -238,6 +256,12 @@ def main():
         help="Only set up test environment without running tests"
     )
     
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="With cleanup, also remove .pytest_cache"
+    )
+    
     args = parser.parse_args()
     
     runner = TestRunner()
@@ -264,12 +288,14 @@ def main():
         success = runner.run_tests_with_coverage(verbose)
     elif args.test_type == "fast":
         success = runner.run_fast_tests(verbose)
+    elif args.test_type == "changed":
+        success = runner.run_changed_tests(verbose)
     elif args.test_type == "lint":
         success = runner.run_linting()
     elif args.test_type == "security":
         success = runner.run_security_checks()
     elif args.test_type == "cleanup":
-        runner.cleanup()
+        runner.cleanup(deep=args.deep)
         return
     
     if success:
@@ -230,7 +230,7 @@ class ResearcherPipeline:
                     works_count += 1
                     self.metrics.works_processed += 1
                     
-                    if text_data.get('embedding'):
+                    if text_data.get('embedding') is not None:
                         self.metrics.works_with_embeddings += 1
                     
                     if text_data.get('keywords'):
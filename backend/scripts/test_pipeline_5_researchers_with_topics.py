@@ -265,7 +265,7 @@ class ResearcherPipelineWithTopics:
                     works_count += 1
                     self.metrics.works_processed += 1
                     
-                    if text_data.get('embedding'):
+                    if text_data.get('embedding') is not None:
                         self.metrics.works_with_embeddings += 1
                     
                     if text_data.get('keywords'):
@@ -69,7 +69,7 @@ def test_components():
         keywords = processor.extract_keywords(test_text)
         embedding = processor.generate_embedding(test_text)
         
-        if keywords and embedding:
+        if keywords and embedding is not None:
             logger.info(f"✅ Text processor successful: {len(keywords)} keywords, {len(embedding)} dim embedding")
         else:
             logger.error("❌ Text processor failed: No keywords or embedding generated")
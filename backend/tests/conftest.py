@@ -7,6 +7,11 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 from app.main import app
 
+@pytest.fixture(autouse=True)
+def reset_llm_extractor(monkeypatch):
+    """Drop the worker-wide LLM extractor so each test builds one from its own mocks."""
+    monkeypatch.setattr("app.tasks.deconstruction_task._llm_extractor", None)
+
 @pytest.fixture
 def test_client():
     """Create a test client."""
@@ -232,6 +232,28 @@ class TestJobManager:
         mock_redis.get.assert_called_with("job:test-job:metadata")
         mock_redis.set.assert_called()
     
+    def test_update_job_status_with_result_uses_one_pipeline(self, job_manager, mock_redis):
+        """Test completing a job writes result and metadata in one transaction."""
+        existing_metadata = JobMetadata(
+            job_id="test-job",
+            job_type="test",
+            status=JobStatus.PROCESSING,
+            created_at=datetime.utcnow()
+        )
+        mock_redis.get.return_value = existing_metadata.model_dump_json()
+        pipe = mock_redis.pipeline.return_value
+        
+        job_manager.update_job_status("test-job", JobStatus.COMPLETED, progress=100, result={"data": "test result"})
+        
+        mock_redis.set.assert_not_called()
+        pipe.execute.assert_called_once()
+        keys = [call[0][0] for call in pipe.set.call_args_list]
+        assert keys == ["job:test-job:result", "job:test-job:metadata"]
+        stored = JobMetadata.model_validate_json(pipe.set.call_args_list[1][0][1])
+        assert stored.status == JobStatus.COMPLETED
+        assert stored.progress == 100
+        assert stored.result == {"stored": True, "key": "job:test-job:result"}
+    
     def test_store_job_result(self, job_manager, mock_redis):
         """Test job result storage."""
         # Mock existing job metadata
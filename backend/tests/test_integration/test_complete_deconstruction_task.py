@@ -179,7 +179,7 @@ proficiency in mathematical software such as MATLAB, Python with NumPy/SciPy, or
         # Setup LLM extractor mock
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.return_value = expected_llm_metadata
+        mock_extractor.extract_all_metadata_batched.return_value = expected_llm_metadata
         mock_extractor_class.return_value = mock_extractor
         
         # Execute the complete task
@@ -236,7 +236,7 @@ proficiency in mathematical software such as MATLAB, Python with NumPy/SciPy, or
         # Verify component interactions (orchestration)
         mock_extract.assert_called_once_with(temp_pdf_file)
         mock_chunk.assert_called_once_with(sample_nsf_pdf_content)
-        mock_extractor.extract_all_metadata.assert_called_once_with(expected_sections)
+        mock_extractor.extract_all_metadata_batched.assert_called_once_with(expected_sections)
 
     @patch('app.tasks.deconstruction_task.get_job_manager')
     @patch('app.tasks.deconstruction_task.extract_pdf_text')
@@ -367,7 +367,7 @@ proficiency in mathematical software such as MATLAB, Python with NumPy/SciPy, or
         # Setup LLM extractor mock (available but fails)
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.side_effect = Exception("LLM API timeout")
+        mock_extractor.extract_all_metadata_batched.side_effect = Exception("LLM API timeout")
         mock_extractor_class.return_value = mock_extractor
         
         # Execute task - should not fail, should use fallback
@@ -446,7 +446,7 @@ proficiency in mathematical software such as MATLAB, Python with NumPy/SciPy, or
         
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.return_value = expected_llm_metadata
+        mock_extractor.extract_all_metadata_batched.return_value = expected_llm_metadata
         mock_extractor_class.return_value = mock_extractor
         
         # Execute task
@@ -472,8 +472,8 @@ proficiency in mathematical software such as MATLAB, Python with NumPy/SciPy, or
         assert final_call[1]["progress"] == 100
         assert "result" in final_call[1]
         
-        # Verify result structure matches expected output
-        stored_result = final_call[1]["result"]
+        # Verify result structure matches expected output (stored pre-serialized)
+        stored_result = json.loads(final_call[1]["result"])
         assert stored_result["solicitation_id"] == "test_job_progress_404"
         assert stored_result["award_title"] == expected_llm_metadata["metadata"]["award_title"]
 
@@ -200,7 +200,7 @@ class TestLLMIntegration:
             mock_extractor = Mock()
             mock_extractor.is_available.return_value = True
             mock_extractor._extract_metadata_with_llm = Mock(side_effect=mock_llm_extract)
-            mock_extractor.extract_all_metadata.return_value = {
+            mock_extractor.extract_all_metadata_batched.return_value = {
                 "metadata": {
                     "funding_ceiling": 750000,
                     "project_duration_months": 36,
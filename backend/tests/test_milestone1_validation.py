@@ -266,7 +266,7 @@ class TestJobFailureScenariosAndErrorMessages:
         # Setup LLM to be available but fail during extraction
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.side_effect = Exception("LLM API timeout after 30 seconds")
+        mock_extractor.extract_all_metadata_batched.side_effect = Exception("LLM API timeout after 30 seconds")
         mock_extractor_class.return_value = mock_extractor
         
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
@@ -517,7 +517,7 @@ class TestStructuredSolicitationOutputFormatAndCompleteness:
         
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.return_value = {
+        mock_extractor.extract_all_metadata_batched.return_value = {
             "metadata": {
                 "award_title": "Mathematical Foundations of AI",
                 "funding_ceiling": 1500000.0,
@@ -713,7 +713,7 @@ class TestStructuredSolicitationOutputFormatAndCompleteness:
         # Mock LLM to return minimal metadata
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.return_value = {
+        mock_extractor.extract_all_metadata_batched.return_value = {
             "metadata": {
                 "award_title": "Basic Solicitation"
                 # No funding_ceiling, project_duration_months, or submission_deadline
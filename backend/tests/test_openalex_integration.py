@@ -190,6 +190,32 @@ class TestOpenAlexIntegration:
         
         assert result == expected
     
+    def test_cache_path_without_requests_cache_uses_plain_session(self):
+        """Test that caching degrades to a plain session when requests-cache is missing."""
+        with patch.dict('sys.modules', {'requests_cache': None}):
+            client = OpenAlexClient(email="test@example.com", cache_path="/tmp/openalex_test_cache")
+        
+        assert type(client.session) is requests.Session
+    
+    @patch('app.services.openalex_client.time.sleep')
+    def test_cached_responses_skip_rate_limit_delay(self, mock_sleep, client):
+        """Test that responses served from the cache do not wait for the rate limit."""
+        response = Mock(from_cache=True)
+        response.json.return_value = {"results": []}
+        
+        with patch.object(client.session, 'get', return_value=response):
+            client._make_request("https://api.openalex.org/works")
+        
+        mock_sleep.assert_not_called()
+    
+    def test_reconstruct_abstract_out_of_order_with_gaps(self, client):
+        """Test reconstruction places words by position and skips missing positions."""
+        inverted_index = {"learning": [1, 4], "Machine": [0], "deep": [3]}
+        
+        result = client.reconstruct_abstract(inverted_index)
+        
+        assert result == "Machine learning deep learning"
+    
     def test_reconstruct_abstract_empty(self, client):
         """Test abstract reconstruction with empty input."""
         result = client.reconstruct_abstract({})
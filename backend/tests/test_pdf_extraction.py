@@ -7,7 +7,8 @@ from unittest.mock import patch, MagicMock
 import fitz  # PyMuPDF
 
 # Import the function we'll be testing
-from app.services.pdf_processor import extract_pdf_text
+from app.services.pdf_processor import extract_pdf_text, extract_page_texts
+from app.utils import extract_pdf_text as analyze_pdf
 
 class TestPDFTextExtraction:
     """Test cases for PDF text extraction."""
@@ -139,6 +140,51 @@ class TestPDFTextExtraction:
         assert result1["file_size"] == result2["file_size"]
         # Extraction time may vary slightly, so we don't check that
     
+    def test_extract_page_texts_in_worker_processes_keeps_page_order(self):
+        """Multi-process extraction returns the same page texts as a sequential pass."""
+        doc = fitz.open()
+        for page_num in range(7):
+            doc.new_page().insert_text((72, 72), f"Page number {page_num}", fontsize=12)
+        pdf_content = doc.tobytes()
+        doc.close()
+        
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(pdf_content)
+            temp_file.flush()
+            
+            try:
+                with fitz.open(temp_file.name) as doc:
+                    sequential = [page.get_text() for page in doc]
+                    with patch("app.services.pdf_processor.PAGES_PER_EXTRACTION_WORKER", 2):
+                        parallel = extract_page_texts(doc, temp_file.name, max_workers=3)
+                
+                assert parallel == sequential
+                assert "Page number 6" in parallel[6]
+                
+            finally:
+                os.unlink(temp_file.name)
+    
+    @pytest.mark.parametrize("metadata_title,expected", [
+        ("Mathematical Foundations of AI", "Mathematical Foundations of AI"),
+        ("", "A solicitation heading that is long enough to be a title"),
+    ])
+    def test_analyze_pdf_prefers_metadata_title(self, metadata_title, expected):
+        """Document metadata titles are used before scanning the text for one."""
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "A solicitation heading that is long enough to be a title", fontsize=8)
+        doc.set_metadata({"title": metadata_title})
+        pdf_content = doc.tobytes()
+        doc.close()
+        
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(pdf_content)
+            temp_file.flush()
+            
+            try:
+                assert analyze_pdf(temp_file.name)["title"] == expected
+            finally:
+                os.unlink(temp_file.name)
+    
     def _create_test_pdf_with_text(self, text_content: str) -> bytes:
         """Create a simple PDF with the given text content."""
         # Create a simple PDF using PyMuPDF
@@ -0,0 +1,73 @@
+"""Tests for AI analysis service."""
+
+import pytest
+import json
+from unittest.mock import Mock, AsyncMock
+from app.services.ai_service import AIService, GapAnalysisResult
+
+
+def make_stream(pieces):
+    """Build an async iterator of Groq-style streaming chunks"""
+    async def stream():
+        for piece in pieces:
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = piece
+            yield chunk
+    return stream()
+
+
+class TestAIService:
+    """Test suite for AIService"""
+
+    @pytest.fixture
+    def team_report(self):
+        return {
+            'team_members': [{'name': 'Ada Lovelace', 'role': 'PI', 'avg_affinity': 88.0,
+                              'top_skills': [{'skill': 'machine learning', 'score': 91.2}]}],
+            'overall_coverage_score': 62.0,
+            'skill_analysis': [
+                {'skill': 'machine learning', 'coverage_score': 91.2, 'level': 'High'},
+                {'skill': 'hpc', 'coverage_score': 20.0, 'level': 'Low'},
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_gap_analysis_async_accumulates_stream(self, team_report):
+        """Streamed chunks are joined before the JSON response is parsed"""
+        payload = json.dumps({
+            "critical_gaps": ["hpc"],
+            "moderate_gaps": [],
+            "strategic_recommendations": ["Partner with a computing center"],
+            "competitiveness_score": 71.5,
+            "risk_assessment": "Moderate",
+            "mitigation_strategies": [],
+            "collaboration_opportunities": [],
+            "budget_considerations": []
+        })
+        service = AIService(api_key="test_key")
+        service.async_client = Mock()
+        service.async_client.chat.completions.create = AsyncMock(
+            return_value=make_stream([payload[:20], None, payload[20:]])
+        )
+
+        result = await service.generate_gap_analysis_async(
+            team_report, {'title': 'Test'}, {'skills_analyzed': ['hpc']}
+        )
+
+        assert isinstance(result, GapAnalysisResult)
+        assert result.critical_gaps == ["hpc"]
+        assert result.competitiveness_score == 71.5
+        assert service.async_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_gap_analysis_async_falls_back_without_client(self, team_report, monkeypatch):
+        """Without an API key the async path returns the rule-based analysis"""
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        service = AIService()
+
+        result = await service.generate_gap_analysis_async(
+            team_report, {'title': 'Test'}, {'skills_analyzed': []}
+        )
+
+        assert result.critical_gaps == ['hpc']
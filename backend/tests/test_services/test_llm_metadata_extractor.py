@@ -2,7 +2,7 @@
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from app.services.llm_metadata_extractor import LLMMetadataExtractor
 
 
@@ -121,6 +121,16 @@ class TestLLMMetadataExtractor:
         result = extractor._extract_metadata_with_llm(sample_metadata_section, "metadata")
         assert result == {}
 
+    def test_warm_up_lists_models_and_ignores_errors(self, extractor_with_mock_client):
+        """Test warm-up opens a connection and never raises"""
+        extractor_with_mock_client.warm_up()
+        extractor_with_mock_client.client.models.list.assert_called_once()
+
+        extractor_with_mock_client.client.models.list.side_effect = Exception("API Error")
+        extractor_with_mock_client.warm_up()
+
+        LLMMetadataExtractor().warm_up()  # No API key: nothing to warm up
+
     def test_extract_metadata_with_llm_api_error(self, extractor_with_mock_client, sample_metadata_section):
         """Test metadata extraction when API call fails"""
         extractor_with_mock_client.client.chat.completions.create.side_effect = Exception("API Error")
@@ -410,4 +420,118 @@ class TestLLMMetadataExtractor:
         
         for response in malformed_responses:
             result = extractor_with_mock_client._parse_llm_response(response, "metadata")
-            assert isinstance(result, dict)  # Should always return dict, even if empty
\ No newline at end of file
+            assert isinstance(result, dict)  # Should always return dict, even if empty
+
+    def test_extract_all_metadata_batched_single_request(self, extractor_with_mock_client):
+        """All sections are extracted with one API call and merged by extraction type"""
+        sections = {
+            "award_information": "Award info with $500,000 funding",
+            "eligibility_information": "PI must be US citizen",
+            "program_description": "Requires machine learning skills",
+            "review_information": "   "
+        }
+        extractor_with_mock_client.client.chat.completions.create.return_value.choices[0].message.content = json.dumps({
+            "sections": {
+                "award_information": {"funding_ceiling": 500000},
+                "eligibility_information": {"pi_eligibility_rules": ["US citizen required"]},
+                "program_description": {"required_scientific_skills": ["machine learning"]}
+            }
+        })
+
+        result = extractor_with_mock_client.extract_all_metadata_batched(sections)
+
+        create = extractor_with_mock_client.client.chat.completions.create
+        assert create.call_count == 1
+        prompt = create.call_args[1]["messages"][0]["content"]
+        assert "PI must be US citizen" in prompt
+        assert "review_information" not in prompt
+        assert result["extraction_summary"]["sections_processed"] == 3
+        assert result["extraction_summary"]["successful_extractions"] == 3
+        assert result["metadata"]["funding_ceiling"] == 500000
+        assert result["rules"]["pi_eligibility_rules"] == ["US citizen required"]
+        assert result["skills"]["required_scientific_skills"] == ["machine learning"]
+
+    def test_extract_all_metadata_batched_reuses_cached_sections(self, extractor_with_mock_client):
+        """Sections seen before are served from the cache; only new ones reach the model"""
+        store = {}
+        cache = Mock()
+        cache.mget.side_effect = lambda keys: [store.get(key) for key in keys]
+        cache.pipeline.return_value.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+        extractor_with_mock_client.cache = cache
+        create = extractor_with_mock_client.client.chat.completions.create
+        create.return_value.choices[0].message.content = json.dumps({
+            "sections": {"eligibility_information": {"pi_eligibility_rules": ["US citizen required"]}}
+        })
+
+        extractor_with_mock_client.extract_all_metadata_batched({"eligibility_information": "PI must be US citizen"})
+        create.return_value.choices[0].message.content = json.dumps({
+            "sections": {"award_information": {"funding_ceiling": 500000}}
+        })
+        result = extractor_with_mock_client.extract_all_metadata_batched({
+            "award_information": "Award info with $500,000 funding",
+            "eligibility_information": "PI must be US citizen"
+        })
+
+        assert create.call_count == 2
+        prompt = create.call_args[1]["messages"][0]["content"]
+        assert "PI must be US citizen" not in prompt
+        assert len(store) == 2
+        assert all(key.startswith("sec_extract:") for key in store)
+        assert result["extraction_summary"]["successful_extractions"] == 2
+        assert result["metadata"]["funding_ceiling"] == 500000
+        assert result["rules"]["pi_eligibility_rules"] == ["US citizen required"]
+
+    def test_extract_all_metadata_batched_falls_back_on_bad_json(self, extractor_with_mock_client):
+        """Unparseable batched responses fall back to per-section extraction"""
+        sections = {"award_information": "Award info", "program_description": "Program info"}
+        extractor_with_mock_client.client.chat.completions.create.return_value.choices[0].message.content = "not json"
+        fallback = {"metadata": {}, "rules": {}, "skills": {}, "extraction_summary": {}}
+        extractor_with_mock_client._extract_per_section = Mock(return_value=fallback)
+
+        result = extractor_with_mock_client.extract_all_metadata_batched(sections)
+
+        assert result is fallback
+        extractor_with_mock_client._extract_per_section.assert_called_once_with(sections)
+
+    def test_batched_prompt_truncates_long_sections(self, extractor_with_mock_client):
+        """Oversized sections are cut to the batched ceiling and marked"""
+        truncated = extractor_with_mock_client._truncate_section("word " * 10_000)
+
+        assert truncated.endswith("[TRUNCATED]")
+        assert len(truncated) < 16_100
+
+    def test_extract_all_metadata_async_runs_sections_concurrently(self, extractor_with_mock_client):
+        """Per-section fallback issues async requests and retries transient failures"""
+        sections = {
+            "award_information": "Award info",
+            "eligibility_information": "Eligibility info",
+            "program_description": "   "
+        }
+        responses = {
+            "metadata": '{"funding_ceiling": 500000}',
+            "rules": '{"pi_eligibility_rules": ["US citizen required"]}'
+        }
+        failed_once = set()
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            section_type = "metadata" if "Award info" in prompt else "rules"
+            if section_type == "rules" and not failed_once:
+                failed_once.add(section_type)
+                raise RuntimeError("rate limited")
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = responses[section_type]
+            return response
+
+        with patch('app.services.llm_metadata_extractor.AsyncGroq') as async_groq, \
+                patch('app.services.llm_metadata_extractor.LLM_RETRY_BACKOFF_SECONDS', 0):
+            client = async_groq.return_value.__aenter__.return_value
+            client.chat.completions.create = AsyncMock(side_effect=create)
+            result = extractor_with_mock_client._extract_per_section(sections)
+
+        assert client.chat.completions.create.await_count == 3
+        assert result["extraction_summary"]["sections_processed"] == 2
+        assert result["extraction_summary"]["successful_extractions"] == 2
+        assert result["metadata"]["funding_ceiling"] == 500000
+        assert result["rules"]["pi_eligibility_rules"] == ["US citizen required"]
@@ -0,0 +1,230 @@
+"""Tests for report generation service."""
+
+import asyncio
+import json
+import httpx
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from app.models.team import DreamTeamReport, DreamTeamMember, SkillCoverage, SelectionStep
+from app.models.matching import MatchingResults
+from app.services.ai_service import AIService
+from app.services.report_service import ReportService
+
+
+def make_team_report(solicitation_id="sol_1", coverage=72.5):
+    """Build a small DreamTeamReport for report tests"""
+    return DreamTeamReport(
+        solicitation_id=solicitation_id,
+        solicitation_title=f"Solicitation {solicitation_id}",
+        team_members=[
+            DreamTeamMember(
+                researcher_id="r1",
+                name="Ada Lovelace",
+                role="PI",
+                avg_affinity=88.0,
+                top_skills=[{"skill": "machine learning", "score": 91.2}],
+                selection_reason="Top ranked"
+            ),
+            DreamTeamMember(
+                researcher_id="r2",
+                name="Alan Turing",
+                role="Co-I 1",
+                avg_affinity=75.5,
+                top_skills=[{"skill": "data analysis", "score": 80.1}],
+                selection_reason="Coverage"
+            ),
+        ],
+        overall_coverage_score=coverage,
+        skill_analysis=[
+            SkillCoverage(skill="machine learning", coverage_score=91.2, level="High",
+                          expert="Ada Lovelace", expert_score=91.2),
+            SkillCoverage(skill="data analysis", coverage_score=80.1, level="High",
+                          expert="Alan Turing", expert_score=80.1),
+            SkillCoverage(skill="statistics", coverage_score=75.0, level="High",
+                          expert="Ada Lovelace", expert_score=75.0),
+            SkillCoverage(skill="visualization", coverage_score=55.0, level="Medium",
+                          expert="Alan Turing", expert_score=55.0),
+            SkillCoverage(skill="hpc", coverage_score=20.0, level="Low",
+                          expert="Alan Turing", expert_score=20.0),
+        ],
+        strategic_analysis="",
+        selection_history=[
+            SelectionStep(step=1, action="Selected PI", researcher_name="Ada Lovelace",
+                          reason="Top ranked", team_coverage=60.0)
+        ],
+        strategy_used="hybrid",
+        generated_at=datetime(2024, 1, 1),
+        affinity_matrix_shape=(10, 5)
+    )
+
+
+def make_matching_results(solicitation_id="sol_1"):
+    """Build MatchingResults matching make_team_report"""
+    return MatchingResults(
+        solicitation_id=solicitation_id,
+        solicitation_title=f"Solicitation {solicitation_id}",
+        eligible_researchers=8,
+        total_researchers=10,
+        top_matches=[],
+        skills_analyzed=["machine learning", "data analysis", "statistics", "visualization", "hpc"],
+        processing_time_seconds=1.5,
+        generated_at=datetime(2024, 1, 1)
+    )
+
+
+class TestReportService:
+    """Test suite for ReportService"""
+
+    @pytest.fixture
+    def team_report(self):
+        return make_team_report()
+
+    @pytest.fixture
+    def matching_results(self):
+        return make_matching_results()
+
+    def test_gap_analysis_payload_matches_ai_service_signature(self, team_report, matching_results):
+        """Payload keys map onto AIService.generate_gap_analysis arguments"""
+        service = ReportService()
+        payload = service._build_gap_analysis_payload(team_report, matching_results)
+
+        assert set(payload) == {"team_report", "solicitation_data", "matching_results"}
+        assert payload["solicitation_data"]["title"] == team_report.solicitation_title
+        assert payload["team_report"]["overall_coverage_score"] == 72.5
+        assert payload["matching_results"]["skills_analyzed"] == matching_results.skills_analyzed
+
+    def test_generate_comprehensive_reports_gathers_ai_calls(self):
+        """Batch generation issues one async AI call per item and keeps item order"""
+        ai_service = MagicMock()
+        ai_service.generate_gap_analysis_async = AsyncMock(side_effect=["gap_a", "gap_b"])
+        service = ReportService(ai_service=ai_service)
+
+        items = [
+            ("sol_a", make_team_report("sol_a"), make_matching_results("sol_a")),
+            ("sol_b", make_team_report("sol_b"), make_matching_results("sol_b")),
+        ]
+
+        with patch.object(service, "_assemble_comprehensive_report",
+                          side_effect=lambda sid, tr, mr, gap: (sid, gap)):
+            reports = service.generate_comprehensive_reports(items)
+
+        assert reports == [("sol_a", "gap_a"), ("sol_b", "gap_b")]
+        assert ai_service.generate_gap_analysis_async.await_count == 2
+        ai_service.generate_gap_analysis.assert_not_called()
+        loop_client = ai_service.loop_scoped_client.return_value.__aenter__.return_value
+        assert all(call.kwargs["client"] is loop_client
+                   for call in ai_service.generate_gap_analysis_async.await_args_list)
+
+    def test_generate_comprehensive_reports_can_run_repeatedly(self):
+        """Each sync call opens its own Groq client, so later calls still reach the API"""
+        content = json.dumps({"critical_gaps": ["hpc"], "competitiveness_score": 81.0})
+        chunk = {
+            "id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "llama3-70b-8192",
+            "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}]
+        }
+        events = f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode()
+        loops = []
+
+        class LoopBoundTransport(httpx.AsyncBaseTransport):
+            """Like a pooled connection, only usable from the loop that first opened it"""
+
+            def __init__(self):
+                self.loop = None
+
+            async def handle_async_request(self, request):
+                loop = asyncio.get_running_loop()
+                self.loop = self.loop or loop
+                if self.loop is not loop:
+                    raise RuntimeError("Event loop is closed")
+                loops.append(loop)
+                return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=events)
+
+        class StubTransportClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                super().__init__(transport=LoopBoundTransport(), **kwargs)
+
+        with patch("httpx.AsyncClient", StubTransportClient):
+            service = ReportService(ai_service=AIService(api_key="gsk_test"))
+        items = [("sol_a", make_team_report("sol_a"), make_matching_results("sol_a"))]
+
+        with patch("httpx.AsyncClient", StubTransportClient), \
+                patch.object(service, "_assemble_comprehensive_report",
+                             side_effect=lambda sid, tr, mr, gap: gap):
+            first = service.generate_comprehensive_reports(items)
+            second = service.generate_comprehensive_reports(items)
+
+        assert len(loops) == 2 and loops[0] is not loops[1]
+        assert first[0].critical_gaps == second[0].critical_gaps == ["hpc"]
+        assert second[0].competitiveness_score == 81.0
+
+    def test_generate_comprehensive_reports_without_ai(self):
+        """Batch generation skips AI calls when no AI service is configured"""
+        service = ReportService()
+        items = [("sol_a", make_team_report("sol_a"), make_matching_results("sol_a"))]
+
+        with patch.object(service, "_assemble_comprehensive_report",
+                          side_effect=lambda sid, tr, mr, gap: (sid, gap)):
+            reports = service.generate_comprehensive_reports(items)
+
+        assert reports == [("sol_a", None)]
+
+    def test_skill_rows_use_level_emoji(self, team_report):
+        """Template rows carry the emoji for their coverage level"""
+        rows = ReportService()._prepare_skill_analysis_for_template(team_report.skill_analysis)
+
+        assert [row.level_emoji for row in rows] == ['🟢', '🟢', '🟢', '🟡', '🔴']
+
+    def test_strategy_description_falls_back_to_name(self):
+        """Unknown strategies are described by their own name"""
+        service = ReportService()
+
+        assert service._get_strategy_description("greedy").startswith("Pure optimization")
+        assert service._get_strategy_description("custom") == "custom"
+
+    def test_skill_data_groups_levels_in_report_order(self, team_report):
+        """Skill data exposes per-level skill names without reordering"""
+        service = ReportService()
+        skills, skill_levels = service._skill_data(team_report)
+
+        assert skill_levels['High'] == ['machine learning', 'data analysis', 'statistics']
+        assert skill_levels['Medium'] == ['visualization']
+        assert skill_levels['Low'] == ['hpc']
+        assert list(skills['level'].cat.categories) == ['Low', 'Medium', 'High']
+
+    def test_skill_data_is_built_once_per_team_report(self):
+        """Repeated lookups reuse the cached frame until the report is collected"""
+        service = ReportService()
+        team_report = make_team_report()
+
+        first = service._skill_data(team_report)
+        assert service._skill_data(team_report) is first
+
+        del team_report, first
+        assert service._skill_cache == {}
+
+    def test_export_reuses_render_for_identical_content(self, team_report):
+        """Re-exporting an unchanged report renders it only once per format"""
+        service = ReportService()
+        report = Mock(team_report=team_report)
+        report.model_dump_json.return_value = '{"report": 1}'
+
+        with patch.object(service, "create_markdown_report", return_value="# Report") as render, \
+                patch("app.services.report_service.ReportExport"):
+            service.export_report(report, "markdown")
+            service.export_report(report, "markdown")
+            report.model_dump_json.return_value = '{"report": 2}'
+            service.export_report(report, "markdown")
+
+        assert render.call_count == 2
+
+    def test_export_reports_preserves_format_order(self):
+        """Multi-format export returns one export per requested format, in order"""
+        service = ReportService()
+        report = Mock()
+
+        with patch.object(service, "export_report", side_effect=lambda r, fmt: fmt.upper()):
+            exports = service.export_reports(report, ["markdown", "json", "csv"])
+
+        assert exports == ["MARKDOWN", "JSON", "CSV"]
+        assert service.export_reports(report, []) == []
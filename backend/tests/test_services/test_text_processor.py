@@ -0,0 +1,253 @@
+"""Tests for text processing service."""
+
+import re
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+from app.services.text_processor import TextProcessor
+
+
+def fake_encode(texts, **kwargs):
+    """Deterministic stand-in for SentenceTransformer.encode"""
+    return np.array([[float(len(text))] * 384 for text in texts], dtype=np.float32)
+
+
+def fake_tokenizer(texts, **kwargs):
+    """Whitespace stand-in for the model's fast tokenizer"""
+    return {'offset_mapping': [[match.span() for match in re.finditer(r'\S+', text)] for text in texts]}
+
+
+def make_fake_model(model):
+    """Configure a mocked SentenceTransformer with the fake encoder and tokenizer"""
+    model.encode.side_effect = fake_encode
+    model.tokenizer.side_effect = fake_tokenizer
+    model.max_seq_length = 256
+    return model
+
+
+def assert_results_equal(left, right):
+    """Compare processed work dictionaries, including ndarray embeddings"""
+    assert len(left) == len(right)
+    for a, b in zip(left, right):
+        assert {k: v for k, v in a.items() if k != 'embedding'} == \
+            {k: v for k, v in b.items() if k != 'embedding'}
+        if a['embedding'] is None or b['embedding'] is None:
+            assert a['embedding'] is b['embedding']
+        else:
+            np.testing.assert_array_equal(a['embedding'], b['embedding'])
+
+
+class TestTextProcessor:
+    """Test suite for TextProcessor"""
+
+    @pytest.fixture
+    def processor(self):
+        """Text processor with NLTK downloads disabled and a mocked model"""
+        with patch('app.services.text_processor.nltk.download'):
+            processor = TextProcessor()
+        processor.model = make_fake_model(Mock())
+        return processor
+
+    @pytest.fixture
+    def works(self):
+        return [
+            {'title': 'Graph learning', 'abstract': 'Neural networks for graph learning.'},
+            {'title': 'Inverted', 'abstract_inverted_index': {'Deep': [0], 'models': [1]}},
+            {},
+            {'title': 'Topics only', 'topics': [{'display_name': 'Robotics', 'score': 0.9}]},
+        ]
+
+    def test_reconstruct_abstract_orders_words_by_position(self, processor):
+        """Words are placed at their inverted index positions"""
+        inverted_index = {'learning': [1, 3], 'Machine': [0], 'deep': [2]}
+
+        assert processor.reconstruct_abstract(inverted_index) == "Machine learning deep learning"
+
+    def test_generate_embedding_encodes_single_text(self, processor):
+        """Single-text embedding goes through the batch encoder"""
+        embedding = processor.generate_embedding("hello")
+
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.shape == (384,)
+        assert embedding[0] == 5.0
+        assert not embedding.flags.writeable
+        assert processor.model.encode.call_args.kwargs['batch_size'] == 64
+
+    def test_process_works_batch_encodes_once(self, processor, works):
+        """All embeddable works share one encode call and keep input order"""
+        results = processor.process_works_batch(works)
+
+        assert processor.model.encode.call_count == 1
+        assert len(results) == 4
+        assert results[1]['abstract'] == 'Deep models'
+        assert results[2] == {'abstract': '', 'keywords': [], 'embedding': None}
+        assert results[3]['abstract'] == 'This research work focuses on Robotics.'
+        for work, result in zip(works, results):
+            if result['embedding'] is not None:
+                expected = float(len(f"{work.get('title', '')} {result['abstract']}".strip()))
+                assert result['embedding'][0] == expected
+
+    def test_process_works_batch_matches_single_work_processing(self, processor, works):
+        """Batch processing returns the same data as per-work processing"""
+        batch_results = processor.process_works_batch(works)
+        single_results = [processor.process_work_text(work) for work in works]
+
+        assert_results_equal(batch_results, single_results)
+
+    def test_generate_embedding_uses_cache_for_repeat_text(self, processor):
+        """Identical texts are encoded only once"""
+        first = processor.generate_embedding("repeated text")
+        second = processor.generate_embedding("repeated text")
+
+        assert second is first
+        assert processor.model.encode.call_count == 1
+
+    def test_process_works_batch_encodes_only_uncached_texts(self, processor):
+        """Cached and duplicate texts are not sent to the model again"""
+        processor.generate_embedding("Known paper")
+        works = [
+            {'title': 'Known', 'abstract': 'paper'},
+            {'title': 'New', 'abstract': 'paper'},
+            {'title': 'New', 'abstract': 'paper'},
+        ]
+
+        results = processor.process_works_batch(works)
+
+        assert processor.model.encode.call_args.args[0] == ['New paper']
+        assert all(result['embedding'] is not None for result in results)
+        assert processor.find_uncached_texts(['Known paper', 'New paper', 'Other']) == ['Other']
+
+    def test_embedding_cache_evicts_least_recently_used(self, processor):
+        """Cache never grows beyond its configured size"""
+        processor.cache_size = 2
+        for text in ("one", "two", "three"):
+            processor.generate_embedding(text)
+
+        assert processor.find_uncached_texts(["one", "two", "three"]) == ["one"]
+
+    def test_extract_keywords_keeps_alphabetic_non_stop_words(self, processor):
+        """Keywords skip stop words, short words and tokens containing digits"""
+        text = "The graph-based models and GPU2 kernels: graph models, graph café."
+
+        assert processor.extract_keywords(text) == ['graph', 'models', 'based', 'kernels', 'café']
+
+    def test_reconstruct_abstract_handles_gaps_and_scalar_positions(self, processor):
+        """Missing positions are skipped and scalar positions are accepted"""
+        inverted_index = {'Sparse': [0], 'index': 3, 'here': [5], 'empty': []}
+
+        assert processor.reconstruct_abstract(inverted_index) == "Sparse index here"
+
+    def test_create_proxy_abstract_uses_top_five_topics(self, processor):
+        """Proxy abstracts list the highest-scoring topics first"""
+        topics = [{'display_name': f'Topic {i}', 'score': i / 10} for i in range(8)]
+
+        assert processor.create_proxy_abstract(topics) == (
+            "This research work focuses on Topic 7, Topic 6, Topic 5, Topic 4 and Topic 3."
+        )
+
+    @pytest.mark.parametrize("cuda_available,device", [(True, "cuda"), (False, "cpu")])
+    def test_load_model_selects_device(self, cuda_available, device):
+        """Model is placed on CUDA in half precision when a GPU is available"""
+        with patch('app.services.text_processor.nltk.download'):
+            processor = TextProcessor()
+
+        with patch('torch.cuda.is_available', return_value=cuda_available), \
+                patch('app.services.text_processor.SentenceTransformer') as model_cls:
+            processor._load_model()
+
+        model_cls.assert_called_once_with("all-MiniLM-L6-v2", device=device)
+        assert model_cls.return_value.half.called is cuda_available
+        assert processor.model.max_seq_length == 256
+
+    def test_process_works_in_pool_matches_batch_processing(self, processor, works):
+        """Process-pool preparation returns the same data as in-process batching"""
+        with patch('app.services.text_processor.nltk.download'):
+            pooled = processor.process_works(works, n_workers=2)
+
+        assert_results_equal(pooled, processor.process_works_batch(works))
+        assert processor.model.encode.call_count == 1
+
+    def test_stop_words_only_hold_tokenizable_words(self, processor):
+        """Stop words that the keyword pattern can never emit are dropped"""
+        assert 'the' in processor.stop_words
+        assert not any(len(word) < 3 or not word.isalpha() for word in processor.stop_words)
+
+    def test_reconstruct_and_extract_matches_separate_passes(self, processor):
+        """Fused reconstruction yields the same abstract and keywords as two passes"""
+        inverted_index = {
+            'Graph-based': [0], 'models': [1, 6], 'for': [2], 'graph': [3, 7],
+            'learning.': [4], 'The': [5], 'GPU2': [8], 'kernels': [10],
+        }
+
+        abstract, keywords = processor.reconstruct_and_extract(inverted_index)
+
+        assert abstract == processor.reconstruct_abstract(inverted_index)
+        assert keywords == processor.extract_keywords(abstract)
+        assert processor.reconstruct_and_extract({}) == ("", [])
+
+    def test_warm_up_loads_model_once_and_encodes(self):
+        """Warm-up loads the model and runs a single encode"""
+        with patch('app.services.text_processor.nltk.download'):
+            processor = TextProcessor()
+
+        with patch('torch.cuda.is_available', return_value=False), \
+                patch('app.services.text_processor.SentenceTransformer') as model_cls:
+            make_fake_model(model_cls.return_value)
+            processor.warm_up()
+            processor.warm_up()
+
+        model_cls.assert_called_once()
+        assert model_cls.return_value.encode.call_count == 2
+
+    @pytest.mark.parametrize("installed", [True, False])
+    def test_nltk_data_downloaded_only_when_missing(self, installed):
+        """Stop words are downloaded only if nltk.data.find cannot locate them"""
+        find_effect = None if installed else LookupError("missing")
+        with patch('app.services.text_processor.nltk.data.find', side_effect=find_effect), \
+                patch('app.services.text_processor.nltk.download') as download:
+            TextProcessor()
+
+        assert download.called is not installed
+
+    def test_long_texts_are_mean_pooled_over_token_windows(self, processor):
+        """Texts over the sequence limit are split into windows and averaged"""
+        processor.model.max_seq_length = 5
+        long_text = "aaaa bb cccccc d ee fff"
+
+        embeddings = processor._encode_batch(["short", long_text])
+
+        pieces = processor.model.encode.call_args.args[0]
+        assert pieces == ["short", "aaaa bb cccccc", "d ee fff"]
+        assert embeddings.shape == (2, 384)
+        assert embeddings[0][0] == 5.0
+        assert embeddings[1][0] == (len("aaaa bb cccccc") + len("d ee fff")) / 2
+
+    def test_only_texts_longer_than_window_are_tokenized(self, processor):
+        """Texts with no more characters than the token window skip the tokenizer"""
+        processor.model.max_seq_length = 5
+
+        processor._encode_batch(["abc", "d e", "ffff gg"])
+
+        processor.model.tokenizer.assert_called_once()
+        assert processor.model.tokenizer.call_args.args[0] == ["ffff gg"]
+
+    def test_token_windows_are_cut_between_words(self, processor):
+        """Windows end at whitespace instead of inside a word's subword tokens"""
+        # "ab cdef" tokenized as ab, cd, ##ef
+        offsets = [(0, 2), (3, 5), (5, 7)]
+
+        assert processor._token_windows("ab cdef", offsets, 2) == ["ab", "cdef"]
+        assert processor._token_windows("abcdef", [(0, 2), (2, 4), (4, 6)], 2) == ["abcd", "ef"]
+
+    def test_process_works_encodes_in_chunks_while_preparing(self, processor):
+        """Pooled processing encodes prepared works chunk by chunk, in input order"""
+        processor.batch_size = 2
+        works = [{'title': f'Work {i}', 'abstract': 'x' * i} for i in range(40)]
+
+        with patch('app.services.text_processor.nltk.download'):
+            pooled = processor.process_works(works, n_workers=2)
+
+        assert processor.model.encode.call_count == 3
+        assert [result['embedding'][0] for result in pooled] == [
+            float(len(f"Work {i} {'x' * i}".strip())) for i in range(40)
+        ]
@@ -0,0 +1,129 @@
+"""Tests for Redis-backed session storage."""
+
+import fnmatch
+import pytest
+import pandas as pd
+from datetime import datetime
+from app.models.matching import MatchingResults
+from app.services.ai_service import GapAnalysisResult
+from app.state import SessionStore, MatchingSession, ReportSession, TeamSession
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands SessionStore uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def setex(self, name, ttl, value):
+        self.data[name] = value
+        self.ttls[name] = ttl
+
+    def delete(self, name):
+        return 1 if self.data.pop(name, None) is not None else 0
+
+    def exists(self, name):
+        return int(name in self.data)
+
+    def scan_iter(self, match):
+        return [name.encode() for name in self.data if fnmatch.fnmatch(name, match)]
+
+    def multi(self):
+        pass
+
+    def transaction(self, func, *watches, value_from_callable=False):
+        self.watched = watches
+        return func(self)
+
+
+class TestSessionStore:
+    """Test suite for SessionStore"""
+
+    @pytest.fixture
+    def store(self):
+        return SessionStore("session:test", MatchingSession, ttl=60, client=FakeRedis())
+
+    def test_set_and_get_round_trip_models(self, store):
+        """Sessions holding Pydantic models survive storage"""
+        results = MatchingResults(
+            solicitation_id="sol_1", solicitation_title="Test", eligible_researchers=1,
+            total_researchers=2, top_matches=[], skills_analyzed=["hpc"],
+            processing_time_seconds=0.5, generated_at=datetime(2024, 1, 1)
+        )
+        store["sol_1"] = {"status": "completed", "results": results}
+
+        assert "sol_1" in store
+        assert store["sol_1"]["results"] == results
+        assert store.client.ttls["session:test:sol_1"] == 60
+
+    def test_sessions_are_stored_as_json(self, store):
+        """Sessions are written as JSON, never pickled"""
+        store["sol_1"] = {"status": "pending", "progress": 0}
+
+        assert store.client.data["session:test:sol_1"] == b'{"status":"pending","progress":0}'
+
+    def test_dataframes_round_trip_with_labels(self):
+        """Affinity matrices keep their researcher index and skill columns"""
+        store = SessionStore("session:team", TeamSession, client=FakeRedis())
+        frame = pd.DataFrame([[1.5, 0.0], [2.25, 3.0]], index=["Ada", "0042"], columns=["ml", "2024"])
+        store["team_1"] = {"affinity_matrix": {"df": frame, "skills": ["ml", "2024"]}}
+
+        stored = store["team_1"]["affinity_matrix"]
+        pd.testing.assert_frame_equal(stored["df"], frame)
+        assert stored["skills"] == ["ml", "2024"]
+
+    def test_gap_analysis_round_trips_without_losing_fields(self):
+        """Report sessions keep the gap analysis produced by the AI service intact"""
+        store = SessionStore("session:report", ReportSession, client=FakeRedis())
+        gap_analysis = GapAnalysisResult(
+            critical_gaps=["quantum sensing"], moderate_gaps=["outreach"],
+            strategic_recommendations=["add a Co-I in optics"], competitiveness_score=72.5,
+            risk_assessment="moderate", mitigation_strategies=["partner with a national lab"],
+            collaboration_opportunities=["NIST"], budget_considerations=["equipment"]
+        )
+        store["report_1"] = {"status": "completed", "gap_analysis": gap_analysis}
+
+        assert store["report_1"]["gap_analysis"] == gap_analysis
+
+    @pytest.mark.asyncio
+    async def test_async_methods_match_sync_ones(self, store):
+        """The a-prefixed methods give the same results from a coroutine"""
+        await store.aset("sol_1", {"status": "pending"})
+        patched = await store.apatch("sol_1", {"progress": 50})
+
+        assert patched == await store.aget("sol_1") == {"status": "pending", "progress": 50}
+        assert await store.aget("missing", {}) == {}
+
+    def test_patch_persists_changes(self, store):
+        """Patched fields are merged into the stored session"""
+        store["sol_1"] = {"status": "pending", "progress": 0}
+        store.patch("sol_1", {"status": "processing", "progress": 25})
+
+        assert store["sol_1"] == {"status": "processing", "progress": 25}
+        assert store.client.watched == ("session:test:sol_1",)
+        with pytest.raises(KeyError):
+            store.patch("missing", {"status": "failed"})
+
+    def test_missing_sessions_behave_like_dict(self, store):
+        """Missing keys raise KeyError and are not reported as present"""
+        assert "missing" not in store
+        assert store.get("missing") is None
+        with pytest.raises(KeyError):
+            store["missing"]
+        with pytest.raises(KeyError):
+            del store["missing"]
+
+    def test_iteration_and_length_use_prefix(self, store):
+        """Only keys under the store prefix are listed"""
+        store["a"] = {}
+        store["b"] = {}
+        store.client.data["session:other:c"] = b""
+
+        assert sorted(store) == ["a", "b"]
+        assert len(store) == 2
+        del store["a"]
+        assert list(store) == ["b"]
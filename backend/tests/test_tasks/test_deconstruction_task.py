@@ -1,5 +1,7 @@
 """Tests for deconstruction task functionality."""
 
+import json
+import hashlib
 import pytest
 import tempfile
 import os
@@ -9,6 +11,10 @@ from app.tasks.deconstruction_task import (
     deconstruct_solicitation_task,
     _assemble_structured_solicitation,
     _fallback_metadata_extraction,
+    _parse_deadline,
+    _get_llm_extractor,
+    _start_llm_warm_up,
+    _hash_file,
     _extract_pdf_text,
     _chunk_by_sections,
     _extract_metadata_with_llm,
@@ -123,7 +129,8 @@ class TestDeconstructionTask:
         section_type = "metadata"
         expected_result = {"award_title": "Test Award"}
         
-        with patch('app.tasks.deconstruction_task.LLMMetadataExtractor') as mock_extractor_class:
+        with patch('app.tasks.deconstruction_task.get_job_manager'), \
+                patch('app.tasks.deconstruction_task.LLMMetadataExtractor') as mock_extractor_class:
             mock_extractor = Mock()
             mock_extractor._extract_metadata_with_llm.return_value = expected_result
             mock_extractor_class.return_value = mock_extractor
@@ -219,6 +226,87 @@ class TestDeconstructionTask:
         # Since no patterns match, it should be 0, but the logic counts empty results as 0
         assert result["extraction_summary"]["successful_extractions"] == 0
 
+    @patch('app.tasks.deconstruction_task.get_job_manager')
+    @patch('app.tasks.deconstruction_task.LLMMetadataExtractor')
+    def test_llm_extractor_is_shared_across_calls(self, mock_extractor_class, mock_get_job_manager):
+        """The extractor is built once, with the job Redis as its cache, and then reused"""
+        first = _get_llm_extractor()
+        second = _get_llm_extractor()
+
+        assert first is second
+        mock_extractor_class.assert_called_once_with(cache=mock_get_job_manager.return_value.redis)
+
+    @patch('app.tasks.deconstruction_task.threading.Thread')
+    @patch('app.tasks.deconstruction_task.get_job_manager')
+    @patch('app.tasks.deconstruction_task.LLMMetadataExtractor')
+    def test_llm_warm_up_runs_once_per_extractor(self, mock_extractor_class, mock_get_job_manager, mock_thread):
+        """Only creating the shared extractor starts a warm-up, not every job"""
+        for _ in range(3):
+            _start_llm_warm_up()
+
+        mock_thread.assert_called_once_with(target=mock_extractor_class.return_value.warm_up, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch('app.tasks.deconstruction_task.get_job_manager')
+    @patch('app.tasks.deconstruction_task.LLMMetadataExtractor')
+    def test_unavailable_llm_extractor_is_not_kept(self, mock_extractor_class, mock_get_job_manager):
+        """An extractor built without API access is rebuilt on the next call"""
+        mock_extractor_class.return_value.is_available.return_value = False
+
+        _get_llm_extractor()
+        _get_llm_extractor()
+
+        assert mock_extractor_class.call_count == 2
+
+    def test_hash_file_falls_back_to_chunked_reads(self, temp_pdf_file, monkeypatch):
+        """Without hashlib.file_digest (Python < 3.11) the file is hashed in chunks"""
+        with open(temp_pdf_file, "rb") as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        monkeypatch.setattr("app.tasks.deconstruction_task.HASH_CHUNK_SIZE", 64)
+
+        assert _hash_file(temp_pdf_file) == expected
+
+    @pytest.mark.parametrize("deadline,expected", [
+        ("March 15, 2025", datetime(2025, 3, 15)),
+        ("Mar 15, 2025", datetime(2025, 3, 15)),
+        ("2025-03-15", datetime(2025, 3, 15)),
+        ("03/15/2025", datetime(2025, 3, 15)),
+        ("15/03/2025", datetime(2025, 3, 15)),
+        ("Smarch 15, 2025", None),
+        ("next Tuesday", None),
+    ])
+    def test_parse_deadline_dispatches_on_shape(self, deadline, expected):
+        """Deadlines are parsed with the formats matching their shape"""
+        assert _parse_deadline(deadline) == expected
+
+    def test_fallback_eligibility_rules_are_deduplicated_in_order(self, sample_sections):
+        """Repeated rules are reported once, in the order they were found"""
+        text = ("PIs must be U.S. citizens at eligible institutions. "
+                "Co-PIs may be permanent residents of any state. "
+                "PIs must be U.S. citizens at eligible institutions.")
+
+        rules = _fallback_metadata_extraction(sample_sections, text)["rules"]
+
+        assert rules["pi_eligibility_rules"] == [
+            "PIs must be U.S. citizens at eligible institutions",
+            "Co-PIs may be permanent residents of any state",
+        ]
+
+    def test_fallback_skill_keywords_found_in_single_scan(self, sample_sections):
+        """Skill keywords are matched case-insensitively and keep category order"""
+        text = ("Proficiency in PYTHON and Fortran software is essential. "
+                "Deep Learning and numerical methods, plus r programming languages.")
+
+        skills = _fallback_metadata_extraction(sample_sections, text)["skills"]
+
+        assert skills["required_scientific_skills"] == ["numerical methods"]
+        assert skills["preferred_skills"] == ["deep learning"]
+        assert skills["technical_requirements"] == [
+            "proficiency in", "programming languages", "software", "Python", "R programming", "Fortran"
+        ]
+
     @patch('app.tasks.deconstruction_task.get_job_manager')
     @patch('app.tasks.deconstruction_task.extract_pdf_text')
     @patch('app.tasks.deconstruction_task.chunk_by_sections')
@@ -237,7 +325,7 @@ class TestDeconstructionTask:
         
         mock_extractor = Mock()
         mock_extractor.is_available.return_value = True
-        mock_extractor.extract_all_metadata.return_value = sample_extracted_metadata
+        mock_extractor.extract_all_metadata_batched.return_value = sample_extracted_metadata
         mock_extractor_class.return_value = mock_extractor
         
         # Execute task
@@ -285,8 +373,45 @@ class TestDeconstructionTask:
         assert isinstance(result, StructuredSolicitation)
         assert result.solicitation_id == "test_job_123"
         
-        # Should have used fallback extraction
-        assert mock_extractor.extract_all_metadata.call_count == 0
+        # Should have used fallback extraction, which is not cached
+        assert mock_extractor.extract_all_metadata_batched.call_count == 0
+        mock_job_manager.redis.setex.assert_not_called()
+
+    @patch('app.tasks.deconstruction_task.get_job_manager')
+    @patch('app.tasks.deconstruction_task.extract_pdf_text')
+    @patch('app.tasks.deconstruction_task.chunk_by_sections')
+    @patch('app.tasks.deconstruction_task.LLMMetadataExtractor')
+    def test_deconstruct_solicitation_task_reuses_cached_result(
+        self, mock_extractor_class, mock_chunk, mock_extract, mock_get_job_manager,
+        temp_pdf_file, sample_pdf_content, sample_sections, sample_extracted_metadata
+    ):
+        """A second run on the same PDF is served from the content-hash cache"""
+        cache = {}
+        mock_job_manager = Mock()
+        mock_job_manager.redis.get.side_effect = cache.get
+        mock_job_manager.redis.setex.side_effect = lambda key, ttl, value: cache.__setitem__(key, value)
+        mock_get_job_manager.return_value = mock_job_manager
+
+        mock_extract.return_value = {"text": sample_pdf_content}
+        mock_chunk.return_value = {"sections": sample_sections}
+        mock_extractor = Mock()
+        mock_extractor.is_available.return_value = True
+        mock_extractor.extract_all_metadata_batched.return_value = sample_extracted_metadata
+        mock_extractor_class.return_value = mock_extractor
+
+        first = deconstruct_solicitation_task("job_1", temp_pdf_file)
+        second = deconstruct_solicitation_task("job_2", temp_pdf_file)
+
+        assert mock_extract.call_count == 1
+        assert mock_extractor.extract_all_metadata_batched.call_count == 1
+        assert len(first.source_sha256) == 64
+        assert list(cache) == [f"decon:{first.source_sha256}"]
+        assert second.solicitation_id == "job_2"
+        assert second.award_title == first.award_title
+        assert second.source_sha256 == first.source_sha256
+        final_call = mock_job_manager.update_job_status.call_args
+        assert final_call[0] == ("job_2", "completed")
+        assert json.loads(final_call[1]["result"])["solicitation_id"] == "job_2"
 
     @patch('app.tasks.deconstruction_task.get_job_manager')
     @patch('app.tasks.deconstruction_task.extract_pdf_text')